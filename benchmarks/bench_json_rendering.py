@@ -0,0 +1,141 @@
+"""
+Benchmark JSON rendering of large deck and progress payloads.
+
+Compares DRF's JSONRenderer with the previous CustomJSONEncoder against the
+orjson-based ORJSONRenderer. Payloads are serialized once from unsaved model
+instances, so no database is needed; only rendering is timed.
+
+Usage (from the repository root):
+
+    python benchmarks/bench_json_rendering.py [--decks 5000] [--progress 20000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.base')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.utils import timezone  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.flashcards.models import Deck, Flashcard, FlashcardProgress  # noqa: E402
+from apps.flashcards.serializers import DeckSerializer, FlashcardProgressSerializer  # noqa: E402
+from core.renderers import ORJSONRenderer  # noqa: E402
+from core.utils import CustomJSONEncoder  # noqa: E402
+
+
+class CustomEncoderRenderer(JSONRenderer):
+    """The renderer configuration used before ORJSONRenderer."""
+
+    encoder_class = CustomJSONEncoder
+
+
+def build_deck_payload(count):
+    """Return serialized data for ``count`` decks."""
+    owner = get_user_model()(id=1, username='benchmark')
+    now = timezone.now()
+    decks = [
+        Deck(
+            id=i,
+            name=f'Deck {i}',
+            description='Vocabulário essencial para viagens e situações do dia a dia.',
+            language='en',
+            level='B1',
+            category='vocabulary',
+            owner=owner,
+            tags='travel,airport,hotel',
+            difficulty=0.35,
+            total_cards=120,
+            mastered_cards=48,
+            completion_rate=0.4,
+            last_studied_at=now,
+            created_at=now - timedelta(days=30),
+            updated_at=now,
+        )
+        for i in range(1, count + 1)
+    ]
+    context = {'favorite_ids': frozenset()}
+    return DeckSerializer(decks, many=True, context=context).data
+
+
+def build_progress_payload(count):
+    """Return serialized data for ``count`` flashcard progress records."""
+    now = timezone.now()
+    deck = Deck(id=1, name='Deck')
+    progress = []
+    for i in range(1, count + 1):
+        flashcard = Flashcard(
+            id=i,
+            deck=deck,
+            front=f'Front {i}',
+            back=f'Verso {i}',
+            example='Where is the boarding gate?',
+            created_at=now,
+            updated_at=now,
+        )
+        progress.append(FlashcardProgress(
+            id=i,
+            flashcard=flashcard,
+            correct_attempts=i % 17,
+            incorrect_attempts=i % 5,
+            average_response_time=2.5,
+            last_reviewed=now,
+            next_review_date=now + timedelta(days=i % 30),
+            ease_factor=2.5,
+            interval=i % 30,
+            streak=i % 7,
+        ))
+    return FlashcardProgressSerializer(progress, many=True).data
+
+
+def measure(renderer, data, repeat):
+    """Return the best rendering time in seconds and the output size."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        content = renderer.render(data, 'application/json', {})
+        best = min(best, time.perf_counter() - started)
+    return best, len(content)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--decks', type=int, default=5000)
+    parser.add_argument('--progress', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = [
+        (f'{args.decks} decks', build_deck_payload(args.decks)),
+        (f'{args.progress} progress records', build_progress_payload(args.progress)),
+    ]
+    renderers = [
+        ('JSONRenderer + CustomJSONEncoder', CustomEncoderRenderer()),
+        ('ORJSONRenderer', ORJSONRenderer()),
+    ]
+
+    for name, data in payloads:
+        print(name)
+        baseline = None
+        for renderer_name, renderer in renderers:
+            seconds, size = measure(renderer, data, args.repeat)
+            baseline = baseline or seconds
+            print(
+                f'  {renderer_name:<34} {seconds * 1000:8.1f} ms  '
+                f'{size / seconds / 2 ** 20:8.1f} MiB/s  {baseline / seconds:5.1f}x'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Django settings for the micro-benchmarks: in-memory SQLite and a local cache,
+so the suite runs without PostgreSQL or Redis.
+"""
+
+from config.settings.base import *  # noqa
+
+SECRET_KEY = 'benchmark-secret-key'
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['*']
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+
+
+# Cria as tabelas direto dos modelos
+class DisableMigrations:
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+for logger in LOGGING['loggers'].values():  # noqa F405
+    logger['level'] = 'CRITICAL'
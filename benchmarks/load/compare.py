@@ -0,0 +1,77 @@
+"""
+Compare two load-test results written by ``locustfile.py``.
+
+Prints the p95 latency, throughput and failure rate of every endpoint in both
+runs and exits with status 1 when an endpoint's p95 grew by more than
+``--threshold`` percent or its failure rate increased.
+
+Usage (from the repository root):
+
+    python benchmarks/load/compare.py BASELINE.json CANDIDATE.json [--threshold 10]
+
+Micro-benchmark results are compared with pytest-benchmark itself:
+
+    cd benchmarks && pytest --benchmark-compare --benchmark-compare-fail=median:10%
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path):
+    """Return the result stored in ``path``."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def failure_rate(stats):
+    return stats['failures'] / stats['requests'] if stats['requests'] else 0
+
+
+def compare(baseline, candidate, threshold):
+    """Print the comparison and return the endpoints that regressed."""
+    regressions = []
+    print(f"baseline  {(baseline['commit'] or '?')[:12]}  {baseline['created_at']}")
+    print(f"candidate {(candidate['commit'] or '?')[:12]}  {candidate['created_at']}")
+    print()
+    print(f"{'endpoint':<48} {'p95 ms':>17} {'change':>8} {'rps':>15} {'failures':>15}")
+    for name in sorted(set(baseline['endpoints']) | set(candidate['endpoints'])):
+        before = baseline['endpoints'].get(name)
+        after = candidate['endpoints'].get(name)
+        if before is None or after is None:
+            print(f"{name:<48} {'only in ' + ('candidate' if before is None else 'baseline'):>17}")
+            continue
+        change = 0
+        if before['p95_ms']:
+            change = (after['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100
+        regressed = change > threshold or failure_rate(after) > failure_rate(before)
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<48} {before['p95_ms']:>8.0f} {after['p95_ms']:>8.0f} {change:>+7.1f}% "
+            f"{before['rps']:>7.2f} {after['rps']:>7.2f} "
+            f"{failure_rate(before):>7.1%} {failure_rate(after):>7.1%}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main():
+    """Compare the results given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    parser.add_argument(
+        '--threshold', type=float, default=10, help='allowed p95 increase, in percent',
+    )
+    args = parser.parse_args()
+
+    regressions = compare(load(args.baseline), load(args.candidate), args.threshold)
+    if regressions:
+        print(f'\n{len(regressions)} endpoint(s) regressed.')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""
+Compare the WSGI and ASGI servers under increasing concurrency.
+
+For each interface, starts gunicorn with ``src/config/gunicorn.py`` and the
+same number of workers, then runs ``io_locustfile.py`` headless at every user
+count given. Prints the throughput, p95 latency and failure rate of each run,
+with the peak memory of the server (master and workers) and the throughput per
+100 MB, and writes them as JSON to ``benchmarks/results/load/``.
+
+The server uses the environment of this script (``DJANGO_SETTINGS_MODULE``,
+``DATABASE_URL``, ``REDIS_URL``...); run ``manage.py seed_scale`` first to
+test at production size.
+
+Usage (from the repository root):
+
+    python benchmarks/load/concurrency.py [--users 50 200 500] [--workers 2] [--duration 1m]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import datetime, timezone
+from pathlib import Path
+
+import psutil
+
+ROOT = Path(__file__).resolve().parents[2]
+RESULTS_DIR = Path(os.getenv('LOADTEST_RESULTS_DIR', ROOT / 'benchmarks' / 'results' / 'load'))
+INTERFACES = ['wsgi', 'asgi']
+
+
+def start_server(interface, bind, workers):
+    """Start gunicorn and wait until it answers the liveness probe."""
+    env = {
+        **os.environ,
+        'SERVER_INTERFACE': interface,
+        'GUNICORN_BIND': bind,
+        'GUNICORN_WORKERS': str(workers),
+    }
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'config/gunicorn.py'],
+        cwd=ROOT / 'src', env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f'http://{bind}/livez', timeout=1)
+            return server
+        except OSError:
+            if server.poll() is not None:
+                raise RuntimeError(f'gunicorn ({interface}) exited with status {server.returncode}')
+            time.sleep(0.5)
+    server.terminate()
+    raise RuntimeError(f'gunicorn ({interface}) did not start')
+
+
+class MemorySampler(threading.Thread):
+    """Record the peak RSS of a process and its children."""
+
+    def __init__(self, pid, interval=0.5):
+        super().__init__(daemon=True)
+        self.process = psutil.Process(pid)
+        self.interval = interval
+        self.peak = 0
+        self.stopped = threading.Event()
+
+    def rss(self):
+        total = 0
+        for process in [self.process, *self.process.children(recursive=True)]:
+            try:
+                total += process.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+        return total
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.peak = max(self.peak, self.rss())
+
+
+def run_load(host, users, duration):
+    """Run the I/O scenario and return the result written by the locustfile."""
+    with tempfile.TemporaryDirectory() as results_dir:
+        subprocess.run(
+            [
+                sys.executable, '-m', 'locust',
+                '-f', str(ROOT / 'benchmarks' / 'load' / 'io_locustfile.py'),
+                '--headless', '--only-summary', '-u', str(users), '-r', str(max(users // 10, 1)),
+                '-t', duration, '--host', host,
+            ],
+            env={**os.environ, 'LOADTEST_RESULTS_DIR': results_dir},
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        paths = list(Path(results_dir).glob('*.json'))
+        if not paths:
+            raise RuntimeError(f'locust wrote no result for {users} users')
+        return json.loads(paths[0].read_text())
+
+
+def measure(interface, args):
+    """Return one row per user count for ``interface``."""
+    server = start_server(interface, args.bind, args.workers)
+    rows = []
+    try:
+        for users in args.users:
+            sampler = MemorySampler(server.pid)
+            sampler.peak = sampler.rss()
+            sampler.start()
+            result = run_load(f'http://{args.bind}', users, args.duration)
+            sampler.stopped.set()
+            sampler.join()
+            total = result['total']
+            rss_mb = sampler.peak / 2 ** 20
+            rows.append({
+                'interface': interface,
+                'users': users,
+                'requests': total['requests'],
+                'failures': total['failures'],
+                'rps': total['rps'],
+                'p95_ms': total['p95_ms'],
+                'rss_mb': round(rss_mb, 1),
+                'rps_per_100mb': round(total['rps'] / rss_mb * 100, 3) if rss_mb else 0,
+            })
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    return rows
+
+
+def main():
+    """Run the comparison given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--users', type=int, nargs='+', default=[50, 200, 500])
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--duration', default='1m', help='duration of each run, in locust format')
+    parser.add_argument('--bind', default='127.0.0.1:8100')
+    parser.add_argument('--interfaces', nargs='+', choices=INTERFACES, default=INTERFACES)
+    args = parser.parse_args()
+
+    rows = []
+    for interface in args.interfaces:
+        rows.extend(measure(interface, args))
+
+    print(
+        f"{'interface':<10} {'users':>6} {'rps':>9} {'p95 ms':>8} {'failures':>9} "
+        f"{'RSS MB':>8} {'rps/100MB':>10}"
+    )
+    for row in rows:
+        failure_rate = row['failures'] / row['requests'] if row['requests'] else 0
+        print(
+            f"{row['interface']:<10} {row['users']:>6} {row['rps']:>9.2f} {row['p95_ms']:>8.0f} "
+            f"{failure_rate:>9.1%} {row['rss_mb']:>8.1f} {row['rps_per_100mb']:>10.2f}"
+        )
+
+    now = datetime.now(timezone.utc)
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    path = RESULTS_DIR / f'{now:%Y%m%d_%H%M%S}_concurrency.json'
+    path.write_text(json.dumps({
+        'created_at': now.isoformat(),
+        'workers': args.workers,
+        'duration': args.duration,
+        'runs': rows,
+    }, indent=2))
+    print(f'\nResults saved in {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+r"""
+Load-test scenario for the I/O-bound endpoints served by async views.
+
+Every user hits the readiness probe, its due cards, the recommendations and
+the export of its deck with little think time, so the run measures how many
+concurrent requests a worker can keep waiting on the database and Redis.
+Users are registered as in ``locustfile.py``, whose result writer is reused.
+
+Usage (from the repository root, with the server running):
+
+    locust -f benchmarks/load/io_locustfile.py --headless -u 200 -r 50 -t 1m \
+        --host http://localhost:8000
+
+``concurrency.py`` runs it against the WSGI and ASGI servers.
+"""
+
+from locust import between, task
+
+# Importar o locustfile também registra o gravador de resultados
+from locustfile import API, ApiUser
+
+
+class IOUser(ApiUser):
+    """Waits on I/O-bound endpoints."""
+
+    wait_time = between(0.1, 0.5)
+
+    @task(3)
+    def due_review(self):
+        self.client.get(f'{API}/flashcards/flashcards/due_review/', name='/flashcards/due_review/')
+
+    @task(2)
+    def recommendations(self):
+        self.client.get(f'{API}/flashcards/decks/recommendations/', name='/decks/recommendations/')
+
+    @task(2)
+    def export(self):
+        if self.deck_ids:
+            self.client.get(
+                f'{API}/flashcards/decks/{self.rng.choice(self.deck_ids)}/export/?format=json',
+                name='/decks/[id]/export/',
+            )
+
+    @task(1)
+    def readyz(self):
+        self.client.get('/readyz', name='/readyz')
@@ -0,0 +1,268 @@
+r"""
+Load-test scenarios for the API hot paths.
+
+Three kinds of users, mixed by weight:
+
+* ``StudySessionUser``: checks the due cards, reviews cards and its progress.
+* ``CatalogUser``: browses public and featured decks, opens decks and their
+  cards, searches and asks for recommendations.
+* ``ImportExportUser``: imports decks and exports them, with and without a
+  cached ETag.
+
+Every simulated user registers its own account and imports a deck to study,
+so the scenarios also run against an empty database; populate it with
+``manage.py seed_scale`` first to test at production size. Choices are drawn
+from generators seeded with ``LOADTEST_SEED`` and the user's number, so runs
+are reproducible.
+
+When the run ends the per-endpoint stats are written as JSON to
+``benchmarks/results/load/`` (or ``LOADTEST_RESULTS_DIR``), ready for
+``compare.py``.
+
+Usage (from the repository root, with the server running):
+
+    locust -f benchmarks/load/locustfile.py --headless -u 50 -r 10 -t 2m \
+        --host http://localhost:8000
+"""
+
+import itertools
+import json
+import os
+import random
+import subprocess
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from locust import HttpUser, between, events, task
+
+API = '/api/v1'
+SEED = int(os.getenv('LOADTEST_SEED', 20240601))
+PASSWORD = 'LoadTest#2024'
+RESULTS_DIR = Path(os.getenv(
+    'LOADTEST_RESULTS_DIR', Path(__file__).resolve().parent.parent / 'results' / 'load',
+))
+
+WORDS = [
+    'airport', 'hotel', 'ticket', 'breakfast', 'meeting',
+    'invoice', 'doctor', 'weather', 'station', 'market',
+]
+QUERIES = ['travel', 'trvel', 'business', 'food', 'gramar', 'verbs', 'hotel']
+
+_user_numbers = itertools.count()
+
+
+def make_deck_file(rng, cards=50):
+    """Return the JSON export of a synthetic deck with ``cards`` flashcards."""
+    return json.dumps({
+        'name': f'Load test {rng.choice(WORDS)} {rng.randrange(10 ** 6)}',
+        'description': 'Deck gerado pelo teste de carga.',
+        'language': 'en',
+        'level': rng.choice(['A1', 'A2', 'B1', 'B2']),
+        'category': 'vocabulary',
+        'tags': ','.join(rng.sample(WORDS, 3)),
+        'flashcards': [
+            {'front': f'{rng.choice(WORDS)} {i}', 'back': f'verso {i}', 'example': ''}
+            for i in range(cards)
+        ],
+    }).encode()
+
+
+class ApiUser(HttpUser):
+    """Registered user authenticated with a JWT."""
+
+    abstract = True
+    wait_time = between(1, 3)
+
+    def on_start(self):
+        """Register, log in and import a deck to work with."""
+        self.rng = random.Random(SEED + next(_user_numbers))
+        username = f'lt_{uuid.UUID(int=self.rng.getrandbits(128)).hex[:20]}'
+        with self.client.post(f'{API}/auth/register/', json={
+            'username': username,
+            'email': f'{username}@example.com',
+            'password': PASSWORD,
+            'password2': PASSWORD,
+        }, name='/auth/register/', catch_response=True) as response:
+            # A conta já existe quando o teste é repetido com a mesma semente
+            if response.status_code == 400 and 'username' in response.json():
+                response.success()
+        response = self.client.post(f'{API}/auth/token/', json={
+            'username': username,
+            'password': PASSWORD,
+        }, name='/auth/token/')
+        self.client.headers['Authorization'] = f"Bearer {response.json()['access']}"
+        self.deck_ids = []
+        self.import_deck()
+
+    def import_deck(self):
+        """Import a synthetic deck and remember its id."""
+        response = self.client.post(
+            f'{API}/flashcards/decks/import_deck/',
+            files={'file': ('deck.json', make_deck_file(self.rng), 'application/json')},
+            name='/decks/import_deck/',
+        )
+        if response.status_code == 201:
+            self.deck_ids.append(response.json()['id'])
+
+
+class StudySessionUser(ApiUser):
+    """Checks the due cards and reviews cards of its own decks."""
+
+    weight = 5
+
+    @task(5)
+    def study(self):
+        self.client.get(f'{API}/flashcards/flashcards/due_review/', name='/flashcards/due_review/')
+        if not self.deck_ids:
+            return
+        # Só é possível revisar cards dos próprios decks
+        deck_id = self.rng.choice(self.deck_ids)
+        response = self.client.get(
+            f'{API}/flashcards/decks/{deck_id}/cards/', name='/decks/[id]/cards/',
+        )
+        if not response.ok:
+            return
+        cards = response.json()['results']
+        for card in self.rng.sample(cards, min(len(cards), 20)):
+            self.client.post(
+                f"{API}/flashcards/flashcards/{card['id']}/review/",
+                json={
+                    'quality': self.rng.randint(0, 5),
+                    'response_time': round(self.rng.uniform(1, 10), 2),
+                },
+                name='/flashcards/[id]/review/',
+            )
+
+    @task(2)
+    def progress(self):
+        self.client.get(f'{API}/progress/stats/', name='/progress/stats/')
+        self.client.get(f'{API}/flashcards/flashcards/progress/', name='/flashcards/progress/')
+
+    @task(1)
+    def achievements(self):
+        self.client.get(f'{API}/achievements/', name='/achievements/')
+
+
+class CatalogUser(ApiUser):
+    """Browses the public catalog."""
+
+    weight = 3
+
+    @task(4)
+    def browse(self):
+        response = self.client.get(
+            f'{API}/flashcards/decks/public_decks/', name='/decks/public_decks/',
+        )
+        # Parte dos usuários segue para as próximas páginas
+        while response.ok and response.json().get('next') and self.rng.random() < 0.5:
+            response = self.client.get(response.json()['next'], name='/decks/public_decks/')
+        self.client.get(f'{API}/flashcards/decks/featured/', name='/decks/featured/')
+        if response.ok and response.json().get('results'):
+            deck = self.rng.choice(response.json()['results'])
+            self.client.get(f"{API}/flashcards/decks/{deck['id']}/", name='/decks/[id]/')
+            self.client.get(
+                f"{API}/flashcards/decks/{deck['id']}/cards/", name='/decks/[id]/cards/',
+            )
+
+    @task(2)
+    def filter_catalog(self):
+        self.client.get(
+            f"{API}/flashcards/decks/?level={self.rng.choice(['A1', 'B1'])}"
+            f"&tags={self.rng.choice(WORDS)}",
+            name='/decks/?filters',
+        )
+
+    @task(2)
+    def search(self):
+        query = self.rng.choice(QUERIES)
+        self.client.get(f'{API}/flashcards/search/?q={query}', name='/search/')
+        self.client.get(
+            f'{API}/flashcards/search/autocomplete/?q={query[:4]}',
+            name='/search/autocomplete/',
+        )
+
+    @task(1)
+    def recommendations(self):
+        self.client.get(f'{API}/flashcards/decks/recommendations/', name='/decks/recommendations/')
+
+
+class ImportExportUser(ApiUser):
+    """Imports and exports decks."""
+
+    weight = 1
+
+    @task(1)
+    def import_deck_task(self):
+        self.import_deck()
+
+    @task(3)
+    def export(self):
+        if not self.deck_ids:
+            return
+        url = f'{API}/flashcards/decks/{self.rng.choice(self.deck_ids)}/export/?format=json'
+        response = self.client.get(url, name='/decks/[id]/export/')
+        etag = response.headers.get('ETag')
+        if etag:
+            # Cliente que já tem o arquivo: deve receber 304
+            self.client.get(
+                url, headers={'If-None-Match': etag}, name='/decks/[id]/export/ (cached)',
+            )
+
+
+def get_commit():
+    """Return the current commit, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    environment.started_at = time.time()
+
+
+@events.quitting.add_listener
+def save_results(environment, **kwargs):
+    """Write the stats of every endpoint as JSON."""
+    if environment.stats.total.num_requests == 0:
+        return
+    options = environment.parsed_options
+    endpoints = {}
+    for entry in environment.stats.entries.values():
+        endpoints[f'{entry.method} {entry.name}'] = {
+            'requests': entry.num_requests,
+            'failures': entry.num_failures,
+            'rps': round(entry.total_rps, 3),
+            'avg_ms': round(entry.avg_response_time, 3),
+            'p50_ms': entry.get_response_time_percentile(0.5),
+            'p95_ms': entry.get_response_time_percentile(0.95),
+            'p99_ms': entry.get_response_time_percentile(0.99),
+            'max_ms': entry.max_response_time,
+        }
+    now = datetime.now(timezone.utc)
+    commit = get_commit()
+    result = {
+        'commit': commit,
+        'created_at': now.isoformat(),
+        'host': environment.host,
+        'seed': SEED,
+        'users': getattr(options, 'num_users', None),
+        'spawn_rate': getattr(options, 'spawn_rate', None),
+        'duration_s': round(time.time() - getattr(environment, 'started_at', time.time()), 1),
+        'total': {
+            'requests': environment.stats.total.num_requests,
+            'failures': environment.stats.total.num_failures,
+            'rps': round(environment.stats.total.total_rps, 3),
+            'p95_ms': environment.stats.total.get_response_time_percentile(0.95),
+        },
+        'endpoints': endpoints,
+    }
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    path = RESULTS_DIR / f"{now:%Y%m%d_%H%M%S}_{(commit or 'nocommit')[:12]}.json"
+    path.write_text(json.dumps(result, indent=2))
+    print(f'Load test results saved in {path}')
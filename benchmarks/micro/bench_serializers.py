@@ -0,0 +1,90 @@
+"""
+Micro-benchmarks of the API serializers.
+
+Instances are built in memory, so only serialization is measured.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.flashcards.models import Deck, Flashcard, FlashcardProgress
+from apps.flashcards.serializers import (
+    DeckListSerializer,
+    DeckSerializer,
+    FlashcardProgressSerializer,
+    FlashcardSerializer,
+)
+
+from .conftest import build_decks
+
+User = get_user_model()
+
+
+@pytest.fixture
+def decks(rng):
+    """Return 1,000 unsaved decks."""
+    return build_decks(rng, User(id=1, username='benchmark'), 1000)
+
+
+@pytest.fixture
+def progress_records(rng):
+    """Return 2,000 unsaved flashcard progress records."""
+    now = timezone.now()
+    deck = Deck(id=1, name='Deck')
+    records = []
+    for i in range(1, 2001):
+        flashcard = Flashcard(
+            id=i, deck=deck, front=f'Front {i}', back=f'Verso {i}', created_at=now, updated_at=now,
+        )
+        records.append(FlashcardProgress(
+            id=i,
+            flashcard=flashcard,
+            correct_attempts=rng.randint(0, 20),
+            incorrect_attempts=rng.randint(0, 5),
+            last_reviewed=now,
+            next_review_date=now + timedelta(days=rng.randint(0, 30)),
+            interval=rng.randint(1, 30),
+        ))
+    return records
+
+
+def bench_deck_serializer(benchmark, decks):
+    """Full deck representation, as in ``GET /decks/``."""
+    context = {'favorite_ids': frozenset()}
+    data = benchmark(lambda: DeckSerializer(decks, many=True, context=context).data)
+
+    assert len(data) == len(decks)
+
+
+def bench_deck_list_serializer(benchmark, decks):
+    """Compact catalog representation, as in ``GET /decks/public_decks/``."""
+    context = {'favorite_ids': frozenset()}
+    data = benchmark(lambda: DeckListSerializer(decks, many=True, context=context).data)
+
+    assert len(data) == len(decks)
+
+
+def bench_deck_serializer_sparse(benchmark, decks):
+    """Sparse fieldset, as in ``GET /decks/?fields=id,name,level``."""
+    data = benchmark(lambda: DeckSerializer(decks, many=True, fields={'id', 'name', 'level'}).data)
+
+    assert set(data[0]) == {'id', 'name', 'level'}
+
+
+def bench_flashcard_serializer(benchmark, progress_records):
+    """Flashcards of a study session."""
+    flashcards = [record.flashcard for record in progress_records]
+
+    data = benchmark(lambda: FlashcardSerializer(flashcards, many=True).data)
+
+    assert len(data) == len(flashcards)
+
+
+def bench_progress_serializer(benchmark, progress_records):
+    """Progress records, as in ``GET /flashcards/due_review/``."""
+    data = benchmark(lambda: FlashcardProgressSerializer(progress_records, many=True).data)
+
+    assert len(data) == len(progress_records)
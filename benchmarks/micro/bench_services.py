@@ -0,0 +1,76 @@
+"""
+Micro-benchmarks of the services behind the hot endpoints.
+
+Run against the seeded ``dataset``; caches are cleared before every round so
+the uncached path is measured.
+"""
+
+import json
+
+import pytest
+from django.core.cache import cache
+
+from apps.achievements.services import get_achievement_stats
+from apps.flashcards import fuzzy
+from apps.flashcards.models import Deck
+from apps.flashcards.services import (
+    DeckExportService,
+    DeckImportService,
+    DeckRecommendationService,
+    get_tagged_deck_ids,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def largest_deck(dataset):
+    return max(dataset['decks'], key=lambda deck: deck.flashcards.count())
+
+
+def bench_tagged_decks(benchmark, dataset):
+    """Decks tagged with every tag of a filter (``?tags_all=``)."""
+    def filter_decks():
+        return list(Deck.objects.filter(id__in=get_tagged_deck_ids('travel,food', match_all=True)))
+
+    benchmark(filter_decks)
+
+
+def bench_recommendations(benchmark, dataset):
+    """Recommendations of the most active user, without the cache."""
+    service = DeckRecommendationService(dataset['heavy_user'])
+
+    benchmark.pedantic(service.get_recommendations, setup=cache.clear, rounds=50)
+
+
+def bench_achievement_stats(benchmark, dataset):
+    """Achievement stats of the most active user, without the cache."""
+    benchmark.pedantic(
+        get_achievement_stats, args=(dataset['heavy_user'],), setup=cache.clear, rounds=50,
+    )
+
+
+def bench_autocomplete(benchmark, dataset):
+    """Fuzzy deck autocomplete with a typo."""
+    decks = Deck.objects.filter(is_public=True)
+    results = benchmark(lambda: fuzzy.autocomplete_decks(decks, 'trvel'))
+
+    assert results
+
+
+def bench_export_json(benchmark, dataset):
+    """JSON export of a 50-card deck."""
+    service = DeckExportService(largest_deck(dataset))
+
+    content = benchmark(service.export, 'json')
+
+    assert json.loads(content)['flashcards']
+
+
+def bench_import_json(benchmark, dataset):
+    """Import of an exported 50-card deck."""
+    content = DeckExportService(largest_deck(dataset)).export('json')
+    service = DeckImportService(dataset['users'][-1])
+
+    deck = benchmark.pedantic(service.import_deck, args=(content, 'json'), rounds=20)
+
+    assert deck.flashcards.count() == 50
@@ -0,0 +1,18 @@
+"""Micro-benchmarks of the spaced repetition scheduling."""
+
+from apps.flashcards.models import FlashcardProgress
+
+
+def bench_calculate_next_review(benchmark, rng):
+    """1,000 reviews of a single card with random answer quality."""
+    qualities = [rng.randint(0, 5) for _ in range(1000)]
+
+    def review():
+        progress = FlashcardProgress()
+        for quality in qualities:
+            progress.calculate_next_review(quality)
+        return progress
+
+    progress = benchmark(review)
+
+    assert progress.correct_attempts + progress.incorrect_attempts == len(qualities)
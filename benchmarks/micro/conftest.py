@@ -0,0 +1,148 @@
+"""
+Fixtures for the micro-benchmarks.
+
+Data is generated from a fixed seed so runs on different commits measure the
+same work. Deck popularity and user activity are skewed (Pareto), like in
+production: a few decks hold most favorites and a few users most reviews.
+"""
+
+import random
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.achievements.models import Achievement
+from apps.flashcards.models import (
+    CATEGORY_CHOICES,
+    LANGUAGE_CHOICES,
+    LEVEL_CHOICES,
+    Deck,
+    DeckFavorite,
+    Flashcard,
+    FlashcardProgress,
+)
+from apps.flashcards.services import sync_deck_tags
+
+User = get_user_model()
+
+SEED = 20240601
+TAGS = [
+    'travel', 'food', 'business', 'grammar', 'verbs',
+    'airport', 'hotel', 'health', 'music', 'sports',
+]
+
+
+def pareto_index(rng, size, alpha=1.2):
+    """Return an index in ``range(size)`` drawn from a heavy-tailed distribution."""
+    return min(int(rng.paretovariate(alpha)) - 1, size - 1)
+
+
+def build_decks(rng, owner, count, saved=False):
+    """Return ``count`` decks of ``owner``."""
+    now = timezone.now()
+    decks = []
+    for i in range(count):
+        decks.append(Deck(
+            id=None if saved else i + 1,
+            name=f'Deck {i} {rng.choice(TAGS)}',
+            description='Vocabulário essencial para viagens e situações do dia a dia.',
+            language=rng.choice(LANGUAGE_CHOICES)[0],
+            level=rng.choice(LEVEL_CHOICES)[0],
+            category=rng.choice(CATEGORY_CHOICES)[0],
+            owner=owner,
+            is_public=rng.random() < 0.8,
+            tags=','.join(rng.sample(TAGS, 3)),
+            total_cards=rng.randint(10, 200),
+            created_at=now - timedelta(days=rng.randint(1, 365)),
+            updated_at=now,
+        ))
+    return decks
+
+
+@pytest.fixture
+def rng():
+    """Return a seeded random generator."""
+    return random.Random(SEED)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every benchmark with an empty cache."""
+    cache.clear()
+
+
+@pytest.fixture(scope='session')
+def dataset(django_db_setup, django_db_blocker):
+    """
+    Populate the database once per session.
+
+    40 users, 120 decks, 6,000 flashcards, about 12,000 progress records,
+    favorites and achievements.
+    """
+    rng = random.Random(SEED)
+    now = timezone.now()
+    with django_db_blocker.unblock():
+        users = User.objects.bulk_create([
+            User(username=f'user{i}', email=f'user{i}@example.com', password='!')
+            for i in range(40)
+        ])
+        decks = Deck.objects.bulk_create([
+            deck
+            for owner in users[:10]
+            for deck in build_decks(rng, owner, 12, saved=True)
+        ])
+        for deck in decks:
+            sync_deck_tags(deck)
+        flashcards = Flashcard.objects.bulk_create([
+            Flashcard(
+                deck=deck,
+                front=f'Front {deck.pk}-{i}',
+                back=f'Verso {deck.pk}-{i}',
+                example='Where is the boarding gate?',
+            )
+            for deck in decks
+            for i in range(50)
+        ])
+        progress = {}
+        for user in users:
+            # Poucos usuários concentram a maior parte das revisões
+            for _ in range(min(int(rng.paretovariate(1.1) * 150), len(flashcards))):
+                flashcard = flashcards[rng.randrange(len(flashcards))]
+                progress[(user.pk, flashcard.pk)] = FlashcardProgress(
+                    user=user,
+                    flashcard=flashcard,
+                    correct_attempts=rng.randint(0, 20),
+                    incorrect_attempts=rng.randint(0, 5),
+                    last_reviewed=now - timedelta(days=rng.randint(0, 60)),
+                    next_review_date=now + timedelta(days=rng.randint(-10, 30)),
+                    interval=rng.randint(1, 30),
+                )
+        FlashcardProgress.objects.bulk_create(progress.values())
+        favorites = {
+            (user.pk, decks[pareto_index(rng, len(decks))].pk)
+            for user in users
+            for _ in range(5)
+        }
+        DeckFavorite.objects.bulk_create([
+            DeckFavorite(user_id=user_id, deck_id=deck_id) for user_id, deck_id in favorites
+        ])
+        Achievement.objects.bulk_create([
+            Achievement(
+                user=user,
+                type=rng.choice(Achievement.ACHIEVEMENT_TYPES)[0],
+                name=f'Achievement {i}',
+                description='',
+                points=rng.choice([10, 25, 50]),
+            )
+            for user in users
+            for i in range(rng.randint(0, 15))
+        ])
+    return {
+        'users': users,
+        'decks': decks,
+        # Usuário mais ativo: o pior caso das telas de progresso
+        'heavy_user': max(users, key=lambda user: sum(1 for key in progress if key[0] == user.pk)),
+    }
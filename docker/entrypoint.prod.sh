@@ -26,6 +26,10 @@ python src/manage.py migrate --noinput
 echo "Collecting static files..."
 python src/manage.py collectstatic --noinput
 
+# Render the OpenAPI schema served by /api/schema/
+echo "Generating OpenAPI schema..."
+python src/manage.py generate_schema
+
 # Start Gunicorn
 echo "Starting Gunicorn..."
 exec "$@" 
\ No newline at end of file
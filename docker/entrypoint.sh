@@ -32,6 +32,6 @@ fi
 # Inicia o servidor
 echo "Starting server..."
 if [ "$DJANGO_SETTINGS_MODULE" = "config.settings.production" ]; then
-    poetry run gunicorn config.wsgi:application --bind 0.0.0.0:8000 --workers 4 --threads 4
+    poetry run gunicorn -c src/config/gunicorn.py
 else
     poetry run python src/manage.py runserver 0.0.0.0:8000 
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""Package for achievements app."""
+
+default_app_config = 'apps.achievements.apps.AchievementsConfig'
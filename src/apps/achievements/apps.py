@@ -0,0 +1,15 @@
+"""Configuration for achievements app."""
+
+from django.apps import AppConfig
+
+
+class AchievementsConfig(AppConfig):
+    """Configuration class for achievements app."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.achievements'
+    verbose_name = 'Conquistas'
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.achievements.signals  # noqa
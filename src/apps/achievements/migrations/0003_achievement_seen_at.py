@@ -0,0 +1,24 @@
+# Generated by Django 5.0.2 on 2026-10-19 14:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("achievements", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="achievement",
+            name="seen_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="achievement",
+            index=models.Index(fields=["user", "seen_at"], name="achievement_user_id_97178a_idx"),
+        ),
+    ]
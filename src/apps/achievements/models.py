@@ -21,11 +21,13 @@ class Achievement(models.Model):
     unlocked_at = models.DateTimeField(auto_now_add=True)
     icon = models.CharField(max_length=50, default='trophy')
     points = models.IntegerField(default=0)
+    seen_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         indexes = [
             models.Index(fields=['user']),
-            models.Index(fields=['type'])
+            models.Index(fields=['type']),
+            models.Index(fields=['user', 'seen_at'])
         ]
         ordering = ['-unlocked_at']
         unique_together = ['user', 'type', 'name']
@@ -33,6 +35,13 @@ class Achievement(models.Model):
     def __str__(self):
         return f"{self.user.username} - {self.name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded points so changes can be applied to the user's total."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_points = instance.__dict__.get('points')
+        return instance
+
 
 class AchievementDefinition(models.Model):
     """
@@ -52,6 +61,23 @@ class AchievementDefinition(models.Model):
     def __str__(self):
         return self.name
 
+    def is_met(self, progress):
+        """
+        Verifica se o progresso informado satisfaz o requisito da conquista.
+        """
+        if self.type == 'streak':
+            return progress.current_streak >= self.requirement_value
+        if self.type == 'cards':
+            return progress.total_cards >= self.requirement_value
+        if self.type == 'accuracy':
+            return progress.accuracy_rate >= self.requirement_value
+        if self.type == 'level':
+            level_values = {'A1': 1, 'A2': 2, 'B1': 3, 'B2': 4, 'C1': 5, 'C2': 6}
+            return level_values.get(progress.current_level, 0) >= self.requirement_value
+        if self.type == 'time':
+            return progress.time_spent >= self.requirement_value
+        return False
+
     def check_achievement(self, user):
         """
         Verifica se o usuário alcançou a conquista.
@@ -59,20 +85,7 @@ class AchievementDefinition(models.Model):
         from apps.progress.models import UserProgress
         progress = UserProgress.objects.get(user=user)
 
-        achieved = False
-        if self.type == 'streak':
-            achieved = progress.current_streak >= self.requirement_value
-        elif self.type == 'cards':
-            achieved = progress.total_cards >= self.requirement_value
-        elif self.type == 'accuracy':
-            achieved = progress.accuracy_rate >= self.requirement_value
-        elif self.type == 'level':
-            level_values = {'A1': 1, 'A2': 2, 'B1': 3, 'B2': 4, 'C1': 5, 'C2': 6}
-            achieved = level_values.get(progress.current_level, 0) >= self.requirement_value
-        elif self.type == 'time':
-            achieved = progress.time_spent >= self.requirement_value
-
-        if achieved:
+        if self.is_met(progress):
             Achievement.objects.get_or_create(
                 user=user,
                 type=self.type,
@@ -82,4 +95,4 @@ class AchievementDefinition(models.Model):
                     'icon': self.icon,
                     'points': self.points
                 }
-            ) 
\ No newline at end of file
+            )
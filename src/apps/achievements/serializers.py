@@ -9,8 +9,16 @@ class AchievementSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = Achievement
-        fields = ('id', 'type', 'name', 'description', 'unlocked_at', 'icon', 'points')
-        read_only_fields = ('id', 'unlocked_at')
+        fields = ('id', 'type', 'name', 'description', 'unlocked_at', 'icon', 'points', 'seen_at')
+        # Os pontos vêm das definições e alimentam os placares
+        read_only_fields = ('id', 'unlocked_at', 'points', 'seen_at')
+
+
+class AchievementAcknowledgeSerializer(serializers.Serializer):
+    """
+    Serializador para confirmar notificações de conquistas.
+    """
+    ids = serializers.ListField(child=serializers.IntegerField(), required=False)
 
 
 class AchievementDefinitionSerializer(serializers.ModelSerializer):
@@ -29,7 +37,13 @@ class AchievementDefinitionSerializer(serializers.ModelSerializer):
     def get_is_achieved(self, obj: AchievementDefinition) -> bool:
         """
         Verifica se o usuário atual já alcançou esta conquista.
+
+        Usa o conjunto ``achieved`` do contexto, quando fornecido pela view,
+        para evitar uma consulta por definição.
         """
+        achieved = self.context.get('achieved')
+        if achieved is not None:
+            return (obj.type, obj.name) in achieved
         user = self.context['request'].user
         return Achievement.objects.filter(
             user=user,
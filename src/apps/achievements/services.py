@@ -0,0 +1,131 @@
+"""Services for achievements app."""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+
+from core import metrics
+from core.cache import TwoTierCache
+
+from .models import Achievement, AchievementDefinition
+
+definitions_cache = TwoTierCache('achievement_definitions', maxsize=16, local_timeout=5 * 60)
+
+STATS_CACHE_TIMEOUT = 60 * 15
+
+
+def get_achievement_definitions(queryset=None) -> List[AchievementDefinition]:
+    """Return the achievement definitions from the two-tier cache.
+
+    Each ordering of ``queryset`` is cached under its own key.
+    """
+    if queryset is None:
+        queryset = AchievementDefinition.objects.all()
+    ordering = ','.join(queryset.query.order_by) or 'default'
+    return definitions_cache.get_or_set(ordering, lambda: list(queryset))
+
+
+def get_unlocked_pairs(user) -> set:
+    """Return the (type, name) pairs of the achievements unlocked by ``user``."""
+    return set(Achievement.objects.filter(user=user).values_list('type', 'name'))
+
+
+def get_stats_cache_key(user_id) -> str:
+    """Return the cache key of the achievement stats of a user."""
+    return f'achievement_stats_{user_id}'
+
+
+def get_achievement_stats(user) -> Dict[str, Any]:
+    """
+    Return the achievement stats of ``user``.
+
+    Totals and per-type counts come from a single aggregate query; the result is
+    cached per user and invalidated whenever one of their achievements changes.
+    """
+    cache_key = get_stats_cache_key(user.pk)
+    stats = cache.get(cache_key)
+    if stats is not None:
+        metrics.record_cache('achievement_stats', 'hit_shared')
+        return stats
+    metrics.record_cache('achievement_stats', 'miss')
+
+    achievements = Achievement.objects.filter(user=user)
+    types = [achievement_type for achievement_type, _ in Achievement.ACHIEVEMENT_TYPES]
+    aggregates = achievements.aggregate(
+        total_achievements=Count('id'),
+        total_points=Sum('points'),
+        **{
+            f'type_{achievement_type}': Count('id', filter=Q(type=achievement_type))
+            for achievement_type in types
+        },
+    )
+    stats = {
+        'total_achievements': aggregates['total_achievements'],
+        'total_points': aggregates['total_points'] or 0,
+        'achievements_by_type': {
+            achievement_type: aggregates[f'type_{achievement_type}']
+            for achievement_type in types
+            if aggregates[f'type_{achievement_type}']
+        },
+        'recent_achievements': list(achievements.order_by('-unlocked_at')[:5]),
+    }
+    cache.set(cache_key, stats, STATS_CACHE_TIMEOUT)
+    return stats
+
+
+class AchievementService:
+    """Service for evaluating and unlocking achievements."""
+
+    def __init__(self, user):
+        """Initialize service."""
+        self.user = user
+
+    def evaluate(self, types: Optional[Iterable[str]] = None, progress=None) -> List[Achievement]:
+        """
+        Evaluate achievement definitions and unlock the ones the user has met.
+
+        Only definitions whose ``type`` is in ``types`` are evaluated; all of them
+        are evaluated when ``types`` is None. Returns the newly unlocked achievements,
+        which stay unseen in the user's notification feed until acknowledged.
+        """
+        definitions = get_achievement_definitions()
+        if types is not None:
+            types = set(types)
+            definitions = [definition for definition in definitions if definition.type in types]
+        if not definitions:
+            return []
+
+        if progress is None:
+            from apps.progress.models import UserProgress
+            progress = UserProgress.objects.filter(user=self.user).first()
+            if progress is None:
+                return []
+
+        # Carrega as conquistas já desbloqueadas de uma só vez
+        unlocked = set(
+            Achievement.objects.filter(
+                user=self.user,
+                type__in={definition.type for definition in definitions},
+            ).values_list('type', 'name')
+        )
+
+        new_achievements = []
+        for definition in definitions:
+            if (definition.type, definition.name) in unlocked:
+                continue
+            if not definition.is_met(progress):
+                continue
+            achievement, created = Achievement.objects.get_or_create(
+                user=self.user,
+                type=definition.type,
+                name=definition.name,
+                defaults={
+                    'description': definition.description,
+                    'icon': definition.icon,
+                    'points': definition.points,
+                },
+            )
+            if created:
+                new_achievements.append(achievement)
+        return new_achievements
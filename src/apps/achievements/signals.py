@@ -0,0 +1,81 @@
+"""Signals for achievements app."""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.progress.leaderboards import LeaderboardService
+from apps.progress.signals import level_changed, stats_updated, streak_updated, time_spent_updated
+
+from .models import Achievement, AchievementDefinition
+from .services import AchievementService, definitions_cache, get_stats_cache_key
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=AchievementDefinition)
+@receiver(post_delete, sender=AchievementDefinition)
+def invalidate_definitions_cache(sender, **kwargs):
+    """Invalidate the cached definitions when one of them changes."""
+    definitions_cache.clear()
+
+
+def apply_points(instance, amount):
+    """Add ``amount`` points to the counter and leaderboards of the achievement's user."""
+    if not amount:
+        return
+    User.objects.filter(pk=instance.user_id).update(total_points=F('total_points') + amount)
+    service = LeaderboardService()
+    if service.client is None:
+        return
+    if Achievement.user.is_cached(instance):
+        language = instance.user.language
+    else:
+        language = (
+            User.objects.filter(pk=instance.user_id).values_list('language', flat=True).first()
+        )
+    service.increment(instance.user_id, language, 'points', amount)
+
+
+@receiver(post_save, sender=Achievement)
+def achievement_saved(sender, instance, created, **kwargs):
+    """Keep the user's points counter and cached stats up to date."""
+    if created:
+        apply_points(instance, instance.points)
+    elif getattr(instance, '_loaded_points', None) is not None:
+        apply_points(instance, instance.points - instance._loaded_points)
+    instance._loaded_points = instance.points
+    cache.delete(get_stats_cache_key(instance.user_id))
+
+
+@receiver(post_delete, sender=Achievement)
+def achievement_deleted(sender, instance, **kwargs):
+    """Discount the points of a removed achievement."""
+    apply_points(instance, -getattr(instance, '_loaded_points', instance.points))
+    cache.delete(get_stats_cache_key(instance.user_id))
+
+
+@receiver(stats_updated)
+def evaluate_stats_achievements(sender, user, progress, **kwargs):
+    """Evaluate card and accuracy achievements when the statistics are updated."""
+    AchievementService(user).evaluate(types=['cards', 'accuracy'], progress=progress)
+
+
+@receiver(streak_updated)
+def evaluate_streak_achievements(sender, user, progress, **kwargs):
+    """Evaluate streak achievements when the streak is updated."""
+    AchievementService(user).evaluate(types=['streak'], progress=progress)
+
+
+@receiver(level_changed)
+def evaluate_level_achievements(sender, user, progress, **kwargs):
+    """Evaluate level achievements when the level changes."""
+    AchievementService(user).evaluate(types=['level'], progress=progress)
+
+
+@receiver(time_spent_updated)
+def evaluate_time_achievements(sender, user, progress, **kwargs):
+    """Evaluate time achievements when the time spent is updated."""
+    AchievementService(user).evaluate(types=['time'], progress=progress)
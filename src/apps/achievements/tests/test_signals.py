@@ -0,0 +1,191 @@
+"""Tests for event-driven achievement unlocking."""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.flashcards.models import Deck, Flashcard
+
+from ..models import Achievement, AchievementDefinition
+
+User = get_user_model()
+
+
+class AchievementEventTests(TestCase):
+    """Test that domain events unlock only the affected achievements."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.progress = self.user.progress
+
+        AchievementDefinition.objects.create(
+            type='level',
+            name='Intermediário',
+            description='Alcance o nível B1',
+            points=50,
+            requirement_value=3,
+            requirement_type='level',
+        )
+        AchievementDefinition.objects.create(
+            type='time',
+            name='Dedicado',
+            description='Estude por 60 minutos',
+            points=20,
+            requirement_value=60,
+            requirement_type='minutes',
+        )
+        AchievementDefinition.objects.create(
+            type='cards',
+            name='Primeiro cartão',
+            description='Revise um cartão',
+            points=10,
+            requirement_value=1,
+            requirement_type='cards',
+        )
+
+    def test_level_changed_unlocks_level_achievement(self):
+        """Test that changing the level evaluates only level achievements."""
+        self.progress.time_spent = 120
+        self.progress.save()
+
+        self.progress.set_level('B1')
+
+        self.assertEqual(
+            list(Achievement.objects.filter(user=self.user).values_list('name', flat=True)),
+            ['Intermediário'],
+        )
+
+    def test_time_spent_unlocks_time_achievement(self):
+        """Test that adding study time unlocks time achievements."""
+        self.progress.add_time_spent(30)
+        self.assertFalse(Achievement.objects.filter(user=self.user).exists())
+
+        self.progress.add_time_spent(30)
+        self.assertTrue(
+            Achievement.objects.filter(user=self.user, type='time', name='Dedicado').exists()
+        )
+
+    def review(self, flashcard, quality=4, response_time=2.0):
+        url = reverse('flashcards:flashcard-review', args=[flashcard.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(url, {'quality': quality, 'response_time': response_time})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_review_unlocks_card_achievement(self):
+        """Test that a committed review updates the stats and unlocks card achievements."""
+        deck = Deck.objects.create(
+            name='Test Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+        )
+        flashcard = Flashcard.objects.create(deck=deck, front='Front', back='Back')
+
+        self.review(flashcard)
+
+        self.progress.refresh_from_db()
+        self.assertEqual(self.progress.total_cards, 1)
+        self.assertEqual(
+            list(Achievement.objects.filter(user=self.user).values_list('name', flat=True)),
+            ['Primeiro cartão'],
+        )
+
+    def test_reviews_add_time_spent(self):
+        """Test that review time adds up to whole minutes and unlocks time achievements."""
+        deck = Deck.objects.create(
+            name='Test Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+        )
+        flashcard = Flashcard.objects.create(deck=deck, front='Front', back='Back')
+        self.progress.time_spent = 59
+        self.progress.save()
+
+        self.review(flashcard, response_time=40.0)
+        self.progress.refresh_from_db()
+        self.assertEqual(self.progress.time_spent, 59)
+        self.assertFalse(Achievement.objects.filter(user=self.user, type='time').exists())
+
+        # Os segundos pendentes completam o minuto
+        self.review(flashcard, response_time=30.0)
+        self.progress.refresh_from_db()
+        self.assertEqual(self.progress.time_spent, 60)
+        self.assertEqual(self.progress.pending_study_seconds, 10.0)
+        self.assertTrue(
+            Achievement.objects.filter(user=self.user, type='time', name='Dedicado').exists()
+        )
+
+    def test_review_updates_streak(self):
+        """Test that a review the day after the last study extends the streak."""
+        AchievementDefinition.objects.create(
+            type='streak',
+            name='Constante',
+            description='Estude dois dias seguidos',
+            points=10,
+            requirement_value=2,
+            requirement_type='days',
+        )
+        self.progress.current_streak = 1
+        self.progress.last_study_date = timezone.now() - timedelta(days=1)
+        self.progress.save()
+        deck = Deck.objects.create(
+            name='Test Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+        )
+        flashcard = Flashcard.objects.create(deck=deck, front='Front', back='Back')
+
+        self.review(flashcard, quality=1)
+
+        self.progress.refresh_from_db()
+        self.assertEqual(self.progress.current_streak, 2)
+        self.assertEqual(self.progress.total_cards, 1)
+        self.assertEqual(self.progress.accuracy_rate, 0)
+        self.assertTrue(
+            Achievement.objects.filter(user=self.user, type='streak', name='Constante').exists()
+        )
+
+    def test_notifications_feed(self):
+        """Test listing and acknowledging unlock notifications."""
+        self.progress.set_level('C1')
+
+        res = self.client.get(reverse('achievement-notifications'))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 1)
+        self.assertEqual(res.data[0]['name'], 'Intermediário')
+
+        res = self.client.post(reverse('achievement-acknowledge-notifications'))
+        self.assertEqual(res.data['acknowledged'], 1)
+
+        res = self.client.get(reverse('achievement-notifications'))
+        self.assertEqual(len(res.data), 0)
+
+    def test_acknowledge_rejects_invalid_ids(self):
+        """Test acknowledging with malformed ids is a client error."""
+        self.progress.set_level('C1')
+        url = reverse('achievement-acknowledge-notifications')
+
+        for ids in (['x'], 'abc', 5):
+            res = self.client.post(url, {'ids': ids}, format='json')
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        achievement = Achievement.objects.get(user=self.user)
+        res = self.client.post(url, {'ids': [achievement.id]}, format='json')
+        self.assertEqual(res.data['acknowledged'], 1)
@@ -0,0 +1,181 @@
+"""Tests for achievements views."""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import Achievement, AchievementDefinition
+
+User = get_user_model()
+
+
+class AchievementDefinitionViewSetTests(TestCase):
+    """Test the achievement definition viewset."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+
+        for value in range(1, 6):
+            AchievementDefinition.objects.create(
+                type='streak',
+                name=f'Sequência {value}',
+                description=f'Estude {value} dias seguidos',
+                points=value * 10,
+                requirement_value=value,
+                requirement_type='days',
+            )
+        Achievement.objects.create(
+            user=self.user,
+            type='streak',
+            name='Sequência 1',
+            description='Estude 1 dias seguidos',
+            points=10,
+        )
+
+    def test_list_definitions_is_achieved(self):
+        """Test that is_achieved is resolved for every definition."""
+        res = self.client.get(reverse('achievementdefinition-list'))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        achieved = {item['name']: item['is_achieved'] for item in res.data['results']}
+        self.assertTrue(achieved['Sequência 1'])
+        self.assertFalse(achieved['Sequência 2'])
+
+    def test_list_definitions_does_not_query_per_definition(self):
+        """Test that the definitions list does not run one query per definition."""
+        url = reverse('achievementdefinition-list')
+        self.client.get(url)
+
+        # Lista em cache: apenas a consulta das conquistas do usuário
+        with self.assertNumQueries(1):
+            res = self.client.get(url)
+        self.assertEqual(len(res.data['results']), 5)
+
+    def test_list_definitions_ordering(self):
+        """Test that ?ordering= applies to the cached definitions list."""
+        url = reverse('achievementdefinition-list')
+        self.client.get(url)
+
+        res = self.client.get(url, {'ordering': '-points'})
+        points = [item['points'] for item in res.data['results']]
+        self.assertEqual(points, [50, 40, 30, 20, 10])
+
+        with self.assertNumQueries(1):
+            res = self.client.get(url, {'ordering': '-points'})
+        self.assertEqual(res.data['results'][0]['points'], 50)
+
+    def test_definition_change_invalidates_cache(self):
+        """Test that writing a definition refreshes the cached list."""
+        url = reverse('achievementdefinition-list')
+        self.client.get(url)
+
+        AchievementDefinition.objects.create(
+            type='time',
+            name='Dedicado',
+            description='Estude por 60 minutos',
+            requirement_value=60,
+            requirement_type='minutes',
+        )
+
+        res = self.client.get(url)
+        self.assertEqual(res.data['count'], 6)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+})
+class AchievementStatsTests(TestCase):
+    """Test the achievement stats endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        for name, achievement_type, points in [
+            ('Sequência 3', 'streak', 10),
+            ('Sequência 7', 'streak', 30),
+            ('Cem cartões', 'cards', 50),
+        ]:
+            Achievement.objects.create(
+                user=self.user,
+                type=achievement_type,
+                name=name,
+                description=name,
+                points=points,
+            )
+
+    def test_stats(self):
+        """Test the stats payload."""
+        res = self.client.get(reverse('achievement-stats'))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['total_achievements'], 3)
+        self.assertEqual(res.data['total_points'], 90)
+        self.assertEqual(res.data['achievements_by_type'], {'streak': 2, 'cards': 1})
+        self.assertEqual(len(res.data['recent_achievements']), 3)
+
+    def test_stats_cached_and_invalidated(self):
+        """Test that stats are cached and refreshed on new achievements."""
+        url = reverse('achievement-stats')
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        Achievement.objects.create(
+            user=self.user,
+            type='time',
+            name='Dedicado',
+            description='Dedicado',
+            points=5,
+        )
+        res = self.client.get(url)
+        self.assertEqual(res.data['total_achievements'], 4)
+        self.assertEqual(res.data['total_points'], 95)
+
+    def test_total_points_counter(self):
+        """Test that the user's total_points follows achievement writes."""
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_points, 90)
+
+        achievement = Achievement.objects.get(name='Sequência 7')
+        achievement.points = 20
+        achievement.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_points, 80)
+
+        Achievement.objects.get(name='Cem cartões').delete()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_points, 30)
+
+    def test_points_read_only(self):
+        """Test that users cannot set the points of their achievements."""
+        res = self.client.post(reverse('achievement-list'), {
+            'type': 'time',
+            'name': 'Falsa',
+            'description': 'Falsa',
+            'points': 1000,
+        })
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['points'], 0)
+
+        achievement = Achievement.objects.get(name='Sequência 3')
+        url = reverse('achievement-detail', args=[achievement.id])
+        self.client.patch(url, {'points': 1000})
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_points, 90)
@@ -4,8 +4,9 @@ from rest_framework.routers import DefaultRouter
 from ..views import AchievementViewSet, AchievementDefinitionViewSet
 
 router = DefaultRouter()
-router.register('', AchievementViewSet, basename='achievement')
+# Registrado antes do prefixo vazio para não ser capturado pela rota de detalhe
 router.register('definitions', AchievementDefinitionViewSet)
+router.register('', AchievementViewSet, basename='achievement')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,15 +1,23 @@
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Count, Sum
+from django.core.cache import cache
 from django.utils import timezone
 
 from .models import Achievement, AchievementDefinition
 from .serializers import (
+    AchievementAcknowledgeSerializer,
     AchievementSerializer,
     AchievementDefinitionSerializer,
     AchievementStatsSerializer
 )
+from .services import (
+    AchievementService,
+    get_achievement_definitions,
+    get_achievement_stats,
+    get_stats_cache_key,
+    get_unlocked_pairs,
+)
 
 
 class AchievementViewSet(viewsets.ModelViewSet):
@@ -32,32 +40,47 @@ class AchievementViewSet(viewsets.ModelViewSet):
         """
         Retorna estatísticas das conquistas do usuário.
         """
-        achievements = self.get_queryset()
-        
-        # Calcula estatísticas
-        stats = {
-            'total_achievements': achievements.count(),
-            'total_points': achievements.aggregate(Sum('points'))['points__sum'] or 0,
-            'achievements_by_type': dict(achievements.values('type').annotate(
-                count=Count('id')
-            ).values_list('type', 'count')),
-            'recent_achievements': achievements.order_by('-unlocked_at')[:5]
-        }
-
+        stats = get_achievement_stats(request.user)
         serializer = AchievementStatsSerializer(stats)
         return Response(serializer.data)
 
     @action(detail=False)
     def check(self, request):
         """
-        Verifica e atualiza as conquistas do usuário.
+        Reavalia todas as conquistas do usuário.
+
+        As conquistas são desbloqueadas por eventos (revisões, sequência, nível e
+        tempo de estudo); este endpoint serve apenas para ressincronização manual.
         """
-        definitions = AchievementDefinition.objects.all()
-        for definition in definitions:
-            definition.check_achievement(request.user)
-        
+        AchievementService(request.user).evaluate()
         return Response({'status': 'Achievements checked successfully'})
 
+    @action(detail=False)
+    def notifications(self, request):
+        """
+        Retorna as conquistas desbloqueadas que o usuário ainda não viu.
+        """
+        unseen = self.get_queryset().filter(seen_at__isnull=True)
+        serializer = self.get_serializer(unseen, many=True)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['post'], url_path='notifications/ack')
+    def acknowledge_notifications(self, request):
+        """
+        Marca as notificações de conquistas como vistas.
+
+        Aceita uma lista opcional de ``ids``; sem ela, todas são marcadas.
+        """
+        serializer = AchievementAcknowledgeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        unseen = self.get_queryset().filter(seen_at__isnull=True)
+        ids = serializer.validated_data.get('ids')
+        if ids:
+            unseen = unseen.filter(id__in=ids)
+        acknowledged = unseen.update(seen_at=timezone.now())
+        cache.delete(get_stats_cache_key(request.user.pk))
+        return Response({'acknowledged': acknowledged})
+
 
 class AchievementDefinitionViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -67,8 +90,24 @@ class AchievementDefinitionViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = AchievementDefinitionSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def list(self, request, *args, **kwargs):
+        """
+        Lista as definições a partir do cache em processo.
+
+        A ordenação (``?ordering=``) faz parte da chave do cache.
+        """
+        definitions = get_achievement_definitions(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(definitions)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(definitions, many=True)
+        return Response(serializer.data)
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        if not getattr(self, 'swagger_fake_view', False):
+        # Apenas list e retrieve exibem is_achieved
+        if self.action in ('list', 'retrieve') and not getattr(self, 'swagger_fake_view', False):
             context['user'] = self.request.user
-        return context 
\ No newline at end of file
+            context['achieved'] = get_unlocked_pairs(self.request.user)
+        return context
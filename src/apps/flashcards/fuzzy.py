@@ -0,0 +1,231 @@
+"""
+Typo-tolerant search (autocomplete) for deck names, tags and flashcard fronts.
+
+PostgreSQL uses ``pg_trgm`` GIN indexes and the word similarity operator
+(``<%``), which can use the index and matches a query against any part of the
+text. Other databases (SQLite in development and tests) use an in-memory
+trigram index per process, rebuilt when the indexed tables change.
+"""
+
+import heapq
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+from django.db import connection
+from django.db.models import BooleanField, Count, FloatField, Max, QuerySet
+from django.db.models.expressions import RawSQL
+
+from .models import Deck, Flashcard
+
+# Mesmo limite padrão de pg_trgm.word_similarity_threshold
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+# Campos indexados: (tabela, coluna)
+TRIGRAM_INDEXES = [
+    ('flashcards_deck', 'name'),
+    ('flashcards_deck', 'tags'),
+    ('flashcards_flashcard', 'front'),
+]
+
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+_installed = {}
+
+
+def is_installed(using=None) -> bool:
+    """Return whether the trigram indexes exist in the database ``using``."""
+    using = using or connection
+    if using.vendor != 'postgresql':
+        return False
+    if using.alias not in _installed:
+        with using.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            _installed[using.alias] = cursor.fetchone() is not None
+    return _installed[using.alias]
+
+
+def install(using=None) -> None:
+    """Create the pg_trgm extension and GIN indexes (PostgreSQL only)."""
+    using = using or connection
+    if using.vendor != 'postgresql':
+        return
+    _installed.pop(using.alias, None)
+    with using.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for table, column in TRIGRAM_INDEXES:
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {table}_{column}_trgm_idx '
+                f'ON {table} USING GIN ({column} gin_trgm_ops)'
+            )
+
+
+def uninstall(using=None) -> None:
+    """Drop the trigram indexes; the extension is left in place."""
+    using = using or connection
+    if using.vendor != 'postgresql':
+        return
+    _installed.pop(using.alias, None)
+    with using.cursor() as cursor:
+        for table, column in TRIGRAM_INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {table}_{column}_trgm_idx')
+
+
+def ensure_installed(using=None) -> None:
+    """Install the trigram indexes when they are missing."""
+    using = using or connection
+    if using.vendor == 'postgresql' and not is_installed(using):
+        install(using)
+
+
+# Índice de trigramas em memória
+
+def trigrams(text: str) -> Set[str]:
+    """Return the trigrams of ``text`` as pg_trgm extracts them."""
+    result = set()
+    for word in WORD_RE.findall(text.lower()):
+        padded = f'  {word} '
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+def word_similarity(query_trigrams: Set[str], text_trigrams: Set[str]) -> float:
+    """Share of the query's trigrams found in the text."""
+    if not query_trigrams:
+        return 0.0
+    return len(query_trigrams & text_trigrams) / len(query_trigrams)
+
+
+class TrigramIndex:
+    """In-memory inverted index from trigrams to document keys."""
+
+    def __init__(self, documents: Iterable[Tuple[object, str]]):
+        """Build the index from (key, text) pairs."""
+        self._trigrams = {}
+        self._postings = defaultdict(set)
+        for key, text in documents:
+            document_trigrams = trigrams(text or '')
+            self._trigrams[key] = document_trigrams
+            for trigram in document_trigrams:
+                self._postings[trigram].add(key)
+
+    def search(
+        self, query: str, limit: int, threshold: float = WORD_SIMILARITY_THRESHOLD,
+    ) -> List[Tuple[object, float]]:
+        """Return up to ``limit`` (key, similarity) pairs, best first."""
+        query_trigrams = trigrams(query)
+        candidates = set()
+        for trigram in query_trigrams:
+            candidates |= self._postings.get(trigram, set())
+        scored = []
+        for key in candidates:
+            document_trigrams = self._trigrams[key]
+            similarity = word_similarity(query_trigrams, document_trigrams)
+            if similarity >= threshold:
+                # Desempate: textos mais próximos do termo como um todo
+                union = len(query_trigrams | document_trigrams)
+                overall = len(query_trigrams & document_trigrams) / union
+                scored.append((similarity, overall, key))
+        best = heapq.nlargest(limit, scored, key=lambda item: (item[0], item[1]))
+        return [(key, similarity) for similarity, _, key in best]
+
+
+_indexes: Dict[str, Tuple[tuple, TrigramIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def _get_index(name: str, queryset: QuerySet, documents) -> TrigramIndex:
+    """Return the in-memory index ``name``, rebuilding it when ``queryset`` changed."""
+    stats = queryset.aggregate(updated_at=Max('updated_at'), count=Count('id'))
+    signature = (stats['updated_at'], stats['count'])
+    entry = _indexes.get(name)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    index = TrigramIndex(documents())
+    with _indexes_lock:
+        _indexes[name] = (signature, index)
+    return index
+
+
+def _split_tags(tags: str) -> List[str]:
+    return [tag.strip() for tag in (tags or '').split(',') if tag.strip()]
+
+
+# Consultas
+
+def _postgresql_search(queryset: QuerySet, column: str, query: str) -> QuerySet:
+    table = connection.ops.quote_name(queryset.model._meta.db_table)
+    return queryset.filter(
+        RawSQL(f'%s <%% {table}.{column}', (query,), output_field=BooleanField()),
+    ).annotate(
+        similarity=RawSQL(
+            f'word_similarity(%s, {table}.{column})', (query,), output_field=FloatField(),
+        ),
+    ).order_by('-similarity', 'pk')
+
+
+def _fallback_search(queryset: QuerySet, index: TrigramIndex, query: str, limit: int) -> list:
+    # Busca mais candidatos que o necessário: parte pode não ser visível ao usuário
+    matches = dict(index.search(query, limit * 5))
+    objects = list(queryset.filter(pk__in=matches))
+    for obj in objects:
+        obj.similarity = matches[obj.pk]
+    objects.sort(key=lambda obj: (-obj.similarity, obj.pk))
+    return objects[:limit]
+
+
+def autocomplete_decks(queryset: QuerySet, query: str, limit: int = 10) -> list:
+    """Return the decks of ``queryset`` whose name best matches ``query``."""
+    if is_installed():
+        return list(_postgresql_search(queryset, 'name', query)[:limit])
+    index = _get_index(
+        'deck_names',
+        Deck.objects.all(),
+        lambda: Deck.objects.values_list('id', 'name').iterator(),
+    )
+    return _fallback_search(queryset, index, query, limit)
+
+
+def autocomplete_flashcards(queryset: QuerySet, query: str, limit: int = 10) -> list:
+    """Return the flashcards of ``queryset`` whose front best matches ``query``."""
+    if is_installed():
+        return list(_postgresql_search(queryset, 'front', query)[:limit])
+    index = _get_index(
+        'flashcard_fronts',
+        Flashcard.objects.all(),
+        lambda: Flashcard.objects.values_list('id', 'front').iterator(),
+    )
+    return _fallback_search(queryset, index, query, limit)
+
+
+def autocomplete_tags(queryset: QuerySet, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+    """
+    Return the tags used by the decks of ``queryset`` that best match ``query``.
+
+    Tags are stored comma separated on the deck, so matching decks are found
+    through the index and each of their tags is scored individually.
+    """
+    query_trigrams = trigrams(query)
+    if is_installed():
+        rows = _postgresql_search(queryset, 'tags', query)
+        rows = rows.values_list('tags', flat=True)[:limit * 5]
+        tags = {tag for row in rows for tag in _split_tags(row)}
+    else:
+        # O índice cobre todos os decks; a visibilidade é aplicada pelo banco
+        index = _get_index(
+            'deck_tags',
+            Deck.objects.all(),
+            lambda: Deck.objects.values_list('id', 'tags').iterator(),
+        )
+        deck_ids = [deck_id for deck_id, _ in index.search(query, limit * 5)]
+        rows = queryset.filter(pk__in=deck_ids).values_list('tags', flat=True)
+        tags = {tag for row in rows for tag in _split_tags(row)}
+
+    scored = []
+    for tag in tags:
+        similarity = word_similarity(query_trigrams, trigrams(tag))
+        if similarity >= WORD_SIMILARITY_THRESHOLD:
+            scored.append((tag, similarity))
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored[:limit]
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+def install_trigram_index(apps, schema_editor):
+    from apps.flashcards import fuzzy
+
+    fuzzy.install(schema_editor.connection)
+
+
+def uninstall_trigram_index(apps, schema_editor):
+    from apps.flashcards import fuzzy
+
+    fuzzy.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("flashcards", "0002_search_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(install_trigram_index, uninstall_trigram_index),
+    ]
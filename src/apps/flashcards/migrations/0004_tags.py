@@ -0,0 +1,118 @@
+# Generated by Django 5.0.2 on 2026-10-19 14:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def backfill_tags(apps, schema_editor):
+    """Create the normalized tags from the comma separated deck tags."""
+    Deck = apps.get_model("flashcards", "Deck")
+    Tag = apps.get_model("flashcards", "Tag")
+    DeckTag = apps.get_model("flashcards", "DeckTag")
+
+    deck_tags = {}
+    for deck_id, tags in Deck.objects.exclude(tags="").values_list("id", "tags").iterator():
+        names = []
+        for name in tags.split(","):
+            name = name.strip().lower()[:50]
+            if name and name not in names:
+                names.append(name)
+        deck_tags[deck_id] = names
+
+    all_names = {name for names in deck_tags.values() for name in names}
+    Tag.objects.bulk_create(
+        [Tag(name=name) for name in all_names], batch_size=BATCH_SIZE, ignore_conflicts=True,
+    )
+    tag_ids = dict(Tag.objects.filter(name__in=all_names).values_list("name", "id"))
+    DeckTag.objects.bulk_create(
+        [
+            DeckTag(deck_id=deck_id, tag_id=tag_ids[name])
+            for deck_id, names in deck_tags.items()
+            for name in names
+        ],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("flashcards", "0003_trigram_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True, verbose_name="nome")),
+            ],
+            options={
+                "verbose_name": "tag",
+                "verbose_name_plural": "tags",
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="DeckTag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "deck",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deck_tags",
+                        to="flashcards.deck",
+                        verbose_name="deck",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deck_tags",
+                        to="flashcards.tag",
+                        verbose_name="tag",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "tag do deck",
+                "verbose_name_plural": "tags dos decks",
+            },
+        ),
+        migrations.AddField(
+            model_name="deck",
+            name="tag_set",
+            field=models.ManyToManyField(
+                blank=True,
+                help_text="Tags do deck, sincronizadas a partir do campo tags.",
+                related_name="decks",
+                through="flashcards.DeckTag",
+                to="flashcards.tag",
+                verbose_name="tags normalizadas",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="decktag",
+            index=models.Index(fields=["tag", "deck"], name="flashcards__tag_id_9e55e9_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="decktag",
+            unique_together={("deck", "tag")},
+        ),
+        migrations.RunPython(backfill_tags, migrations.RunPython.noop),
+    ]
@@ -38,6 +38,26 @@ LANGUAGE_CHOICES = [
     ('ru', _('Russo')),
 ]
 
+TAG_MAX_LENGTH = 50
+
+# Campos de Deck exibidos, filtrados ou buscados nas listagens públicas.
+# updated_at e os contadores usados só na ordenação não invalidam o catálogo:
+# ficam desatualizados nas listagens até o fim do TTL
+CATALOG_FIELDS = (
+    'name', 'description', 'language', 'level', 'category', 'owner_id', 'is_public',
+    'is_featured', 'is_archived', 'tags', 'total_cards', 'favorite_count', 'color', 'icon',
+)
+
+
+def parse_tags(value):
+    """Split a comma separated tag string into unique, normalized tag names."""
+    names = []
+    for name in (value or '').split(','):
+        name = name.strip().lower()[:TAG_MAX_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names
+
 
 class Deck(models.Model):
     """Model for flashcard decks."""
@@ -92,6 +112,14 @@ class Deck(models.Model):
         blank=True,
         help_text=_('Tags separadas por vírgula.'),
     )
+    tag_set = models.ManyToManyField(
+        'Tag',
+        verbose_name=_('tags normalizadas'),
+        through='DeckTag',
+        related_name='decks',
+        blank=True,
+        help_text=_('Tags do deck, sincronizadas a partir do campo tags.'),
+    )
     difficulty = models.FloatField(
         _('dificuldade'),
         default=0.0,
@@ -210,6 +238,18 @@ class Deck(models.Model):
         """Return string representation."""
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded tags and catalog fields so changes can be detected."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_tags = instance.__dict__.get('tags')
+        instance._loaded_catalog = instance.get_catalog_values()
+        return instance
+
+    def get_catalog_values(self):
+        """Return the values of the loaded catalog fields, without loading deferred ones."""
+        return {name: self.__dict__.get(name) for name in CATALOG_FIELDS}
+
     def update_stats(self):
         """Update deck statistics."""
         # Atualiza total de cartões
@@ -516,4 +556,57 @@ class DeckFavorite(models.Model):
     def delete(self, *args, **kwargs):
         """Override delete method."""
         self.deck.decrement_favorite_count()
-        super().delete(*args, **kwargs) 
\ No newline at end of file
+        super().delete(*args, **kwargs)
+
+
+class Tag(models.Model):
+    """Model for deck tags."""
+
+    name = models.CharField(
+        _('nome'),
+        max_length=TAG_MAX_LENGTH,
+        unique=True,
+    )
+
+    class Meta:
+        """Meta options."""
+
+        verbose_name = _('tag')
+        verbose_name_plural = _('tags')
+        ordering = ['name']
+
+    def __str__(self):
+        """Return string representation."""
+        return self.name
+
+
+class DeckTag(models.Model):
+    """Through model linking decks to their tags."""
+
+    deck = models.ForeignKey(
+        'Deck',
+        verbose_name=_('deck'),
+        on_delete=models.CASCADE,
+        related_name='deck_tags',
+    )
+    tag = models.ForeignKey(
+        'Tag',
+        verbose_name=_('tag'),
+        on_delete=models.CASCADE,
+        related_name='deck_tags',
+    )
+
+    class Meta:
+        """Meta options."""
+
+        verbose_name = _('tag do deck')
+        verbose_name_plural = _('tags dos decks')
+        unique_together = ['deck', 'tag']
+        indexes = [
+            # Filtro por tag: encontra os decks sem tocar na tabela de decks
+            models.Index(fields=['tag', 'deck']),
+        ]
+
+    def __str__(self):
+        """Return string representation."""
+        return f'{self.deck_id} - {self.tag_id}'
@@ -0,0 +1,17 @@
+"""Pagination classes for flashcards app."""
+
+from rest_framework.pagination import CursorPagination
+
+
+class FlashcardCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the flashcards of a deck.
+
+    Pages are read with a keyset condition on the ordering, so deep pages cost
+    the same as the first one and stay stable while cards are added.
+    """
+
+    ordering = ('created_at', 'id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
@@ -0,0 +1,378 @@
+"""
+Full-text search for decks and flashcards.
+
+PostgreSQL keeps a ``search_vector`` tsvector column per table, filled by
+triggers with the text search configuration of the deck's language and
+indexed with GIN. SQLite (development and tests) uses FTS5 external content
+tables kept in sync by triggers. Other databases fall back to ``icontains``.
+
+The schema objects are not declared on the models; they are installed by the
+``0002_search_index`` migration and, for databases created without
+migrations (tests), by a ``post_migrate`` handler.
+"""
+
+import logging
+import re
+from typing import List, Optional, Tuple
+
+from django.db import DatabaseError, connection
+from django.db.models import BooleanField, FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
+
+logger = logging.getLogger(__name__)
+
+# Configurações de busca textual do PostgreSQL por idioma do deck
+SEARCH_CONFIGS = {
+    'en': 'english',
+    'es': 'spanish',
+    'fr': 'french',
+    'de': 'german',
+    'it': 'italian',
+    'pt': 'portuguese',
+    'ru': 'russian',
+}
+DEFAULT_SEARCH_CONFIG = 'simple'
+
+DECK_TABLE = 'flashcards_deck'
+FLASHCARD_TABLE = 'flashcards_flashcard'
+
+# Colunas indexadas e seus pesos (PostgreSQL: A-D, SQLite: pesos do bm25).
+# As tags do deck são indexadas sem radicais (configuração simple).
+DECK_COLUMNS = [('name', 'A', 10.0), ('description', 'B', 4.0), ('tags', 'C', 2.0)]
+FLASHCARD_COLUMNS = [('front', 'A', 10.0), ('back', 'A', 10.0), ('example', 'C', 2.0)]
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+# Resultado de is_installed por conexão, evitando introspecção a cada busca
+_installed = {}
+
+
+def _search_config_case(column: str) -> str:
+    cases = ' '.join(f"WHEN '{code}' THEN '{config}'" for code, config in SEARCH_CONFIGS.items())
+    return f"(CASE {column} {cases} ELSE '{DEFAULT_SEARCH_CONFIG}' END)::regconfig"
+
+
+def _postgresql_statements() -> List[str]:
+    deck_vector = (
+        "setweight(to_tsvector(config, coalesce(NEW.name, '')), 'A') || "
+        "setweight(to_tsvector(config, coalesce(NEW.description, '')), 'B') || "
+        "setweight(to_tsvector('simple', replace(coalesce(NEW.tags, ''), ',', ' ')), 'C')"
+    )
+    flashcard_vector = ' || '.join(
+        f"setweight(to_tsvector(config, coalesce(NEW.{column}, '')), '{weight}')"
+        for column, weight, _ in FLASHCARD_COLUMNS
+    )
+    return [
+        f'ALTER TABLE {DECK_TABLE} ADD COLUMN IF NOT EXISTS search_vector tsvector',
+        f'ALTER TABLE {FLASHCARD_TABLE} ADD COLUMN IF NOT EXISTS search_vector tsvector',
+        f'CREATE INDEX IF NOT EXISTS {DECK_TABLE}_search_idx '
+        f'ON {DECK_TABLE} USING GIN (search_vector)',
+        f'CREATE INDEX IF NOT EXISTS {FLASHCARD_TABLE}_search_idx '
+        f'ON {FLASHCARD_TABLE} USING GIN (search_vector)',
+        f"""
+        CREATE OR REPLACE FUNCTION flashcards_search_config(language varchar)
+        RETURNS regconfig AS $$
+            SELECT {_search_config_case('language')}
+        $$ LANGUAGE sql IMMUTABLE
+        """,
+        f"""
+        CREATE OR REPLACE FUNCTION {DECK_TABLE}_search_update() RETURNS trigger AS $$
+        DECLARE
+            config regconfig := flashcards_search_config(NEW.language);
+        BEGIN
+            NEW.search_vector := {deck_vector};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        f"""
+        CREATE OR REPLACE FUNCTION {FLASHCARD_TABLE}_search_update() RETURNS trigger AS $$
+        DECLARE
+            config regconfig;
+        BEGIN
+            SELECT flashcards_search_config(language) INTO config
+            FROM {DECK_TABLE} WHERE id = NEW.deck_id;
+            NEW.search_vector := {flashcard_vector};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        # Os cards usam o idioma do deck: reindexa quando ele muda
+        f"""
+        CREATE OR REPLACE FUNCTION {DECK_TABLE}_language_update() RETURNS trigger AS $$
+        BEGIN
+            UPDATE {FLASHCARD_TABLE} SET front = front WHERE deck_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        f'DROP TRIGGER IF EXISTS {DECK_TABLE}_search_trigger ON {DECK_TABLE}',
+        f"""
+        CREATE TRIGGER {DECK_TABLE}_search_trigger
+        BEFORE INSERT OR UPDATE OF name, description, tags, language ON {DECK_TABLE}
+        FOR EACH ROW EXECUTE FUNCTION {DECK_TABLE}_search_update()
+        """,
+        f'DROP TRIGGER IF EXISTS {DECK_TABLE}_language_trigger ON {DECK_TABLE}',
+        f"""
+        CREATE TRIGGER {DECK_TABLE}_language_trigger
+        AFTER UPDATE OF language ON {DECK_TABLE}
+        FOR EACH ROW WHEN (OLD.language IS DISTINCT FROM NEW.language)
+        EXECUTE FUNCTION {DECK_TABLE}_language_update()
+        """,
+        f'DROP TRIGGER IF EXISTS {FLASHCARD_TABLE}_search_trigger ON {FLASHCARD_TABLE}',
+        f"""
+        CREATE TRIGGER {FLASHCARD_TABLE}_search_trigger
+        BEFORE INSERT OR UPDATE OF front, back, example, deck_id ON {FLASHCARD_TABLE}
+        FOR EACH ROW EXECUTE FUNCTION {FLASHCARD_TABLE}_search_update()
+        """,
+        # Preenche as linhas existentes
+        f'UPDATE {DECK_TABLE} SET name = name WHERE search_vector IS NULL',
+        f'UPDATE {FLASHCARD_TABLE} SET front = front WHERE search_vector IS NULL',
+    ]
+
+
+def _sqlite_statements() -> List[str]:
+    statements = []
+    for table, columns in [(DECK_TABLE, DECK_COLUMNS), (FLASHCARD_TABLE, FLASHCARD_COLUMNS)]:
+        fts = f'{table}_fts'
+        names = ', '.join(column for column, _, _ in columns)
+        new_values = ', '.join(f'new.{column}' for column, _, _ in columns)
+        old_values = ', '.join(f'old.{column}' for column, _, _ in columns)
+        statements += [
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                {names}, content='{table}', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});
+            END
+            """,
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+    return statements
+
+
+def _sqlite_drop_statements() -> List[str]:
+    statements = []
+    for table in [DECK_TABLE, FLASHCARD_TABLE]:
+        fts = f'{table}_fts'
+        statements += [f'DROP TRIGGER IF EXISTS {fts}_{suffix}' for suffix in ('ai', 'ad', 'au')]
+        statements.append(f'DROP TABLE IF EXISTS {fts}')
+    return statements
+
+
+def _postgresql_drop_statements() -> List[str]:
+    return [
+        f'DROP TRIGGER IF EXISTS {FLASHCARD_TABLE}_search_trigger ON {FLASHCARD_TABLE}',
+        f'DROP TRIGGER IF EXISTS {DECK_TABLE}_language_trigger ON {DECK_TABLE}',
+        f'DROP TRIGGER IF EXISTS {DECK_TABLE}_search_trigger ON {DECK_TABLE}',
+        f'DROP FUNCTION IF EXISTS {FLASHCARD_TABLE}_search_update()',
+        f'DROP FUNCTION IF EXISTS {DECK_TABLE}_language_update()',
+        f'DROP FUNCTION IF EXISTS {DECK_TABLE}_search_update()',
+        'DROP FUNCTION IF EXISTS flashcards_search_config(varchar)',
+        f'ALTER TABLE {FLASHCARD_TABLE} DROP COLUMN IF EXISTS search_vector',
+        f'ALTER TABLE {DECK_TABLE} DROP COLUMN IF EXISTS search_vector',
+    ]
+
+
+def is_installed(using=None) -> bool:
+    """Return whether the search index exists in the database ``using``."""
+    using = using or connection
+    if using.alias in _installed:
+        return _installed[using.alias]
+    installed = False
+    with using.cursor() as cursor:
+        if using.vendor == 'postgresql':
+            columns = using.introspection.get_table_description(cursor, FLASHCARD_TABLE)
+            installed = any(column.name == 'search_vector' for column in columns)
+        elif using.vendor == 'sqlite':
+            installed = f'{FLASHCARD_TABLE}_fts' in using.introspection.table_names(cursor)
+    _installed[using.alias] = installed
+    return installed
+
+
+def install(using=None) -> None:
+    """Create (or update) the search index objects; safe to run repeatedly."""
+    using = using or connection
+    if using.vendor == 'postgresql':
+        statements = _postgresql_statements()
+    elif using.vendor == 'sqlite':
+        statements = _sqlite_statements()
+    else:
+        return
+    _installed.pop(using.alias, None)
+    try:
+        with using.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+    except DatabaseError as e:
+        # Ex.: SQLite compilado sem FTS5; a busca usa icontains
+        logger.warning(f'Full-text search index not installed: {str(e)}')
+        if using.vendor == 'postgresql':
+            raise
+
+
+def uninstall(using=None) -> None:
+    """Drop the search index objects."""
+    using = using or connection
+    if using.vendor == 'postgresql':
+        statements = _postgresql_drop_statements()
+    elif using.vendor == 'sqlite':
+        statements = _sqlite_drop_statements()
+    else:
+        return
+    _installed.pop(using.alias, None)
+    with using.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def ensure_installed(using=None) -> None:
+    """
+    Install the search index when it is missing.
+
+    On SQLite it is always reinstalled: migrations that rebuild a table drop
+    its triggers, and rebuilding the FTS tables is cheap at development sizes.
+    """
+    using = using or connection
+    with using.cursor() as cursor:
+        if DECK_TABLE not in using.introspection.table_names(cursor):
+            return
+    if using.vendor == 'sqlite' or not is_installed(using):
+        install(using)
+
+
+# Consultas
+
+def get_search_config(language: Optional[str]) -> str:
+    """Return the text search configuration of a deck language."""
+    return SEARCH_CONFIGS.get(language, DEFAULT_SEARCH_CONFIG)
+
+
+def _tokens(query: str) -> List[str]:
+    return TOKEN_RE.findall(query or '')
+
+
+def _postgresql_tsquery(query: str, language: Optional[str]) -> Tuple[str, list]:
+    # Sem idioma, combina as consultas de todas as configurações para que
+    # termos com radicais de qualquer idioma sejam encontrados
+    if language:
+        configs = [get_search_config(language)]
+    else:
+        configs = sorted(set(SEARCH_CONFIGS.values()) | {DEFAULT_SEARCH_CONFIG})
+    sql = ' || '.join(['websearch_to_tsquery(%s::regconfig, %s)'] * len(configs))
+    params = [param for config in configs for param in (config, query)]
+    return f'({sql})', params
+
+
+def _sqlite_match(query: str) -> str:
+    # Cada termo entre aspas (sem operadores do usuário), com prefixo no último
+    tokens = [f'"{token}"' for token in _tokens(query)]
+    tokens[-1] += '*'
+    return ' '.join(tokens)
+
+
+def search(
+    queryset: QuerySet,
+    query: str,
+    columns,
+    fallback_fields,
+    language: Optional[str] = None,
+) -> QuerySet:
+    """
+    Filter ``queryset`` by ``query`` and annotate a relevance ``rank``.
+
+    Higher ranks are better. The queryset is not ordered by rank, so callers
+    can combine the result with their own ordering.
+    """
+    if not _tokens(query):
+        return queryset.none()
+
+    using = connection
+    table = queryset.model._meta.db_table
+    quoted_table = using.ops.quote_name(table)
+    if using.vendor == 'postgresql' and is_installed(using):
+        tsquery, params = _postgresql_tsquery(query, language)
+        return queryset.filter(
+            RawSQL(
+                f'{quoted_table}.search_vector @@ {tsquery}', params, output_field=BooleanField(),
+            ),
+        ).annotate(
+            rank=RawSQL(
+                f'ts_rank({quoted_table}.search_vector, {tsquery})', params,
+                output_field=FloatField(),
+            ),
+        )
+
+    if using.vendor == 'sqlite' and is_installed(using):
+        fts = f'{table}_fts'
+        match = _sqlite_match(query)
+        weights = ', '.join(str(weight) for _, _, weight in columns)
+        return queryset.filter(
+            RawSQL(
+                f'{quoted_table}.id IN (SELECT rowid FROM {fts} WHERE {fts} MATCH %s)',
+                (match,),
+                output_field=BooleanField(),
+            ),
+        ).annotate(
+            rank=RawSQL(
+                f'(SELECT -bm25({fts}, {weights}) FROM {fts} '
+                f'WHERE {fts} MATCH %s AND {fts}.rowid = {quoted_table}.id)',
+                (match,),
+                output_field=FloatField(),
+            ),
+        )
+
+    condition = Q()
+    for token in _tokens(query):
+        token_condition = Q()
+        for field in fallback_fields:
+            token_condition |= Q(**{f'{field}__icontains': token})
+        condition &= token_condition
+    return queryset.filter(condition).annotate(rank=Value(0.0, output_field=FloatField()))
+
+
+def search_decks(queryset: QuerySet, query: str, language: Optional[str] = None) -> QuerySet:
+    """Full-text search over deck names, descriptions and tags."""
+    return search(
+        queryset, query, DECK_COLUMNS, ['name', 'description', 'tags'], language=language,
+    )
+
+
+def search_flashcards(queryset: QuerySet, query: str, language: Optional[str] = None) -> QuerySet:
+    """Full-text search over flashcard fronts, backs and examples."""
+    return search(
+        queryset, query, FLASHCARD_COLUMNS, ['front', 'back', 'example'], language=language,
+    )
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    SearchFilter backed by the full-text index.
+
+    Views declare the search function in ``full_text_search``; views without
+    one keep the default ``icontains`` behaviour.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        """Filter the queryset with the view's full-text search function."""
+        search_function = getattr(view, 'full_text_search', None)
+        query = request.query_params.get(self.search_param, '')
+        if search_function is None or not query.strip():
+            return super().filter_queryset(request, queryset, view)
+        return search_function(queryset, query)
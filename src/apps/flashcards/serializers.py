@@ -1,12 +1,16 @@
 """Serializers for flashcards app."""
 
+from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
+
+from core.serializers import DynamicFieldsMixin
+
 from .models import Flashcard, FlashcardProgress, Deck, DeckFavorite
 
 
-class FlashcardSerializer(serializers.ModelSerializer):
+class FlashcardSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for Flashcard model."""
 
     audio_url = serializers.SerializerMethodField()
@@ -34,6 +38,13 @@ class FlashcardSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
+        expandable_fields = {
+            'deck': ('apps.flashcards.serializers.DeckListSerializer', {'read_only': True}),
+        }
+        method_field_sources = {
+            'audio_url': ['audio'],
+            'image_url': ['image'],
+        }
 
     @extend_schema_field(serializers.URLField(allow_null=True))
     def get_audio_url(self, obj: Flashcard) -> str | None:
@@ -46,7 +57,7 @@ class FlashcardSerializer(serializers.ModelSerializer):
         return obj.get_image_url()
 
 
-class DeckSerializer(serializers.ModelSerializer):
+class DeckSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for Deck model."""
 
     is_favorite = serializers.SerializerMethodField()
@@ -108,10 +119,19 @@ class DeckSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
+        expandable_fields = {
+            'parent_deck': ('apps.flashcards.serializers.DeckListSerializer', {'read_only': True}),
+        }
+        method_field_sources = {
+            'is_favorite': [],
+        }
 
     @extend_schema_field(serializers.BooleanField())
     def get_is_favorite(self, obj: Deck) -> bool:
         """Return whether the deck is favorited by the current user."""
+        favorite_ids = self.context.get('favorite_ids')
+        if favorite_ids is not None:
+            return obj.pk in favorite_ids
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return DeckFavorite.objects.filter(
@@ -175,14 +195,62 @@ class DeckSerializer(serializers.ModelSerializer):
 
 
 class DeckDetailSerializer(DeckSerializer):
-    """Serializer for Deck model with flashcards."""
+    """
+    Serializer for a deck's header.
+
+    Flashcards are not embedded: ``cards_url`` points to the deck's paginated
+    cards sub-resource.
+    """
+
+    flashcards_count = serializers.SerializerMethodField()
+    cards_url = serializers.SerializerMethodField()
+
+    class Meta(DeckSerializer.Meta):
+        """Meta options."""
+
+        fields = DeckSerializer.Meta.fields + ['flashcards_count', 'cards_url']
+        read_only_fields = DeckSerializer.Meta.read_only_fields + ['flashcards_count', 'cards_url']
+
+    @extend_schema_field(serializers.IntegerField())
+    def get_flashcards_count(self, obj: Deck) -> int:
+        """Return the number of flashcards, using the queryset annotation when present."""
+        count = getattr(obj, 'flashcards_count', None)
+        if count is None:
+            count = obj.flashcards.count()
+        return count
+
+    @extend_schema_field(serializers.URLField())
+    def get_cards_url(self, obj: Deck) -> str:
+        """Return the URL of the deck's first page of flashcards."""
+        url = reverse('flashcards:deck-cards', args=[obj.pk])
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
 
-    flashcards = FlashcardSerializer(many=True, read_only=True)
+
+class DeckListSerializer(DeckSerializer):
+    """Compact, read-only Deck serializer for catalog listings."""
 
     class Meta(DeckSerializer.Meta):
         """Meta options."""
 
-        fields = DeckSerializer.Meta.fields + ['flashcards']
+        fields = [
+            'id',
+            'name',
+            'language',
+            'level',
+            'category',
+            'owner_username',
+            'is_featured',
+            'tags',
+            'total_cards',
+            'favorite_count',
+            'is_favorite',
+            'color',
+            'icon',
+            'updated_at',
+        ]
+        read_only_fields = fields
+        expandable_fields = {}
 
 
 class DeckFavoriteSerializer(serializers.ModelSerializer):
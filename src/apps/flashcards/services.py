@@ -3,18 +3,157 @@
 import json
 import csv
 import io
-from typing import List, Dict, Any, Union
-from django.db.models import Q, Count, Avg, F
+import textwrap
+from datetime import datetime
+from typing import Dict, Any, AsyncIterator, Iterator, Tuple, Union
+from django.db.models import Count, F, Max
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.utils.text import slugify
 
-from .models import Deck, DeckFavorite, FlashcardProgress, Flashcard
+from core.cache import TwoTierCache
+from core.db import aiterate_in_chunks, iterate_in_chunks
+from core.singleflight import single_flight
+
+from .models import Deck, DeckFavorite, DeckTag, FlashcardProgress, Flashcard, Tag, parse_tags
 
 User = get_user_model()
 
+# Respostas compartilhadas entre usuários: listagens públicas e cabeçalhos de decks
+catalog_cache = TwoTierCache(
+    'deck_catalog', maxsize=256, timeout=settings.CACHE_TTL, stale_timeout=settings.CACHE_TTL * 4,
+)
+deck_cache = TwoTierCache(
+    'deck_detail', maxsize=2048, timeout=settings.CACHE_TTL, stale_timeout=settings.CACHE_TTL * 4,
+)
+
+RECOMMENDATIONS_CACHE_TIMEOUT = 60 * 60
+
+# Flashcards lidos do banco e enviados ao cliente por vez na exportação
+EXPORT_CHUNK_SIZE = 500
+
+
+def invalidate_deck_cache(deck_id, catalog: bool = True) -> None:
+    """
+    Invalidate the cached responses of a deck.
+
+    Removes the deck's header and, unless ``catalog`` is False, every cached
+    public listing the deck may appear in.
+    """
+    deck_cache.delete(deck_id)
+    if catalog:
+        catalog_cache.clear()
+
+
+def catalog_changed(deck: Deck) -> bool:
+    """
+    Return whether a catalog field of ``deck`` changed since it was loaded.
+
+    Decks not loaded from the database have nothing to compare against and
+    count as changed.
+    """
+    loaded = getattr(deck, '_loaded_catalog', None)
+    return loaded is None or loaded != deck.get_catalog_values()
+
+
+def sync_deck_tags(deck: Deck) -> None:
+    """Mirror the deck's comma separated tags into the normalized tag tables."""
+    names = parse_tags(deck.tags)
+    current = dict(
+        DeckTag.objects.filter(deck=deck).values_list('tag__name', 'id'),
+    )
+    stale_ids = [link_id for name, link_id in current.items() if name not in names]
+    if stale_ids:
+        DeckTag.objects.filter(id__in=stale_ids).delete()
+
+    missing = [name for name in names if name not in current]
+    if missing:
+        Tag.objects.bulk_create([Tag(name=name) for name in missing], ignore_conflicts=True)
+        DeckTag.objects.bulk_create(
+            [DeckTag(deck=deck, tag=tag) for tag in Tag.objects.filter(name__in=missing)],
+            ignore_conflicts=True,
+        )
+    deck._loaded_tags = deck.tags
+
+
+def get_tagged_deck_ids(value: str, match_all: bool = False):
+    """
+    Return a subquery of the ids of decks tagged with the comma separated ``value``.
+
+    Decks need any of the tags, or every one of them when ``match_all`` is set.
+    The lookup only reads the tag tables and their (tag, deck) index.
+    """
+    names = parse_tags(value)
+    tagged = DeckTag.objects.filter(tag__name__in=names).order_by()
+    if match_all:
+        tagged = tagged.values('deck_id').annotate(tag_count=Count('tag_id')).filter(
+            tag_count=len(names),
+        )
+    return tagged.values('deck_id')
+
+
+def get_content_version(queryset, related: Tuple[str, ...] = ()) -> Tuple[str, datetime]:
+    """
+    Return a version string and the last modification of a flashcard queryset.
+
+    Uses a single aggregate query: the latest ``updated_at`` catches edits and
+    the count catches removals. The latest ``updated_at`` of each relation in
+    ``related`` (e.g. an expanded deck) is part of the version too.
+    """
+    return _content_version(queryset.aggregate(**_content_version_aggregates(related)), related)
+
+
+async def aget_content_version(queryset, related: Tuple[str, ...] = ()) -> Tuple[str, datetime]:
+    """Async version of :func:`get_content_version`."""
+    return _content_version(
+        await queryset.aaggregate(**_content_version_aggregates(related)), related,
+    )
+
+
+def _content_version_aggregates(related):
+    aggregates = {'updated_at': Max('updated_at'), 'count': Count('id')}
+    for name in related:
+        aggregates[f'{name}_updated_at'] = Max(f'{name}__updated_at')
+    return aggregates
+
+
+def _content_version(stats, related=()) -> Tuple[str, datetime]:
+    timestamps = [stats['updated_at']] + [stats[f'{name}_updated_at'] for name in related]
+    version = ':'.join(
+        [str(timestamp.timestamp() if timestamp else 0) for timestamp in timestamps]
+        + [str(stats['count'])]
+    )
+    return version, stats['updated_at']
+
+
+def get_deck_content_version(deck: Deck) -> Tuple[str, datetime]:
+    """Return a version string and the last modification of a deck and its cards."""
+    return _deck_content_version(deck, get_content_version(deck.flashcards.all()))
+
+
+async def aget_deck_content_version(deck: Deck) -> Tuple[str, datetime]:
+    """Async version of :func:`get_deck_content_version`."""
+    return _deck_content_version(deck, await aget_content_version(deck.flashcards.all()))
+
+
+def _deck_content_version(deck: Deck, cards_content_version) -> Tuple[str, datetime]:
+    cards_version, cards_updated_at = cards_content_version
+    version = f'{deck.pk}:{deck.updated_at.timestamp()}:{cards_version}'
+    last_modified = max(filter(None, [deck.updated_at, cards_updated_at]))
+    return version, last_modified
+
+
+def get_favorite_deck_ids(user, deck_ids) -> set:
+    """Return which of ``deck_ids`` are favorited by ``user``."""
+    if not user.is_authenticated or not deck_ids:
+        return set()
+    return set(
+        DeckFavorite.objects.filter(user=user, deck_id__in=deck_ids)
+        .order_by()
+        .values_list('deck_id', flat=True)
+    )
+
 
 class DeckRecommendationService:
     """Service for deck recommendations."""
@@ -23,14 +162,18 @@ class DeckRecommendationService:
         """Initialize service."""
         self.user = user
 
+    @single_flight(
+        key=lambda self, limit=10: f'deck_recommendations_{self.user.id}_{limit}',
+        timeout=RECOMMENDATIONS_CACHE_TIMEOUT,
+        name='deck_recommendations',
+        stale_timeout=RECOMMENDATIONS_CACHE_TIMEOUT * 6,
+    )
     def get_recommendations(self, limit=10):
-        """Get deck recommendations for user."""
-        # Tenta obter recomendações do cache
-        cache_key = f'deck_recommendations_{self.user.id}'
-        recommendations = cache.get(cache_key)
-        if recommendations is not None:
-            return recommendations
+        """
+        Get deck recommendations for user.
 
+        Cached for an hour; concurrent misses for the same user and limit are coalesced.
+        """
         # Obtém os decks que o usuário já favoritou
         favorited_decks = DeckFavorite.objects.filter(
             user=self.user,
@@ -76,12 +219,16 @@ class DeckRecommendationService:
                 unique_recommendations.append(deck)
 
         # Limita o número de recomendações
-        recommendations = unique_recommendations[:limit]
+        return unique_recommendations[:limit]
 
-        # Armazena em cache por 1 hora
-        cache.set(cache_key, recommendations, 60 * 60)
+    async def aget_recommendations(self, limit=10):
+        """
+        Async version of :meth:`get_recommendations`.
 
-        return recommendations
+        Cache hits are read with the asyncio Redis client; misses are computed
+        in a worker thread.
+        """
+        return await DeckRecommendationService.get_recommendations.acall(self, limit)
 
     def _get_user_level_recommendations(self, base_query):
         """Get recommendations based on user level."""
@@ -126,7 +273,14 @@ class DeckRecommendationService:
 
 
 class DeckExportService:
-    """Service for deck export."""
+    """
+    Service for deck export.
+
+    ``stream()`` and ``astream()`` yield the file in chunks, reading the
+    flashcards with one query per ``EXPORT_CHUNK_SIZE`` cards, so large decks
+    are never held in memory and no cursor stays open while the client reads;
+    ``export()`` returns the same content at once.
+    """
 
     SUPPORTED_FORMATS = ['json', 'csv']
 
@@ -136,40 +290,47 @@ class DeckExportService:
 
     def export(self, format: str = 'json') -> Union[str, bytes]:
         """Export deck to specified format."""
+        content = b''.join(self.stream(format))
+        if format == 'json':
+            return content.decode('utf-8')
+        return content
+
+    def stream(self, format: str = 'json') -> Iterator[bytes]:
+        """Yield the export of the deck in chunks."""
+        writer = self._get_writer(format)
+        yield writer.head()
+        batch = []
+        for card in iterate_in_chunks(self._get_flashcards(), EXPORT_CHUNK_SIZE):
+            batch.append(writer.card(card))
+            if len(batch) == EXPORT_CHUNK_SIZE:
+                yield ''.join(batch).encode('utf-8')
+                batch = []
+        yield (''.join(batch) + writer.tail()).encode('utf-8')
+
+    async def astream(self, format: str = 'json') -> AsyncIterator[bytes]:
+        """Async version of :meth:`stream`, reading the flashcards with the async ORM."""
+        writer = self._get_writer(format)
+        yield writer.head()
+        batch = []
+        async for card in aiterate_in_chunks(self._get_flashcards(), EXPORT_CHUNK_SIZE):
+            batch.append(writer.card(card))
+            if len(batch) == EXPORT_CHUNK_SIZE:
+                yield ''.join(batch).encode('utf-8')
+                batch = []
+        yield (''.join(batch) + writer.tail()).encode('utf-8')
+
+    def _get_writer(self, format: str):
         if format not in self.SUPPORTED_FORMATS:
             raise ValueError(f'Formato não suportado. Use um dos seguintes: {self.SUPPORTED_FORMATS}')
-
         if format == 'json':
-            return self._export_to_json()
-        return self._export_to_csv()
-
-    def _export_to_json(self) -> str:
-        """Export deck to JSON format."""
-        data = self._get_deck_data()
-        return json.dumps(data, ensure_ascii=False, indent=2)
-
-    def _export_to_csv(self) -> bytes:
-        """Export deck to CSV format."""
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Escreve o cabeçalho
-        writer.writerow(['front', 'back', 'example', 'audio_url', 'image_url'])
-
-        # Escreve os flashcards
-        for flashcard in self.deck.flashcards.all():
-            writer.writerow([
-                flashcard.front,
-                flashcard.back,
-                flashcard.example,
-                flashcard.get_audio_url() or '',
-                flashcard.get_image_url() or '',
-            ])
-
-        return output.getvalue().encode('utf-8')
+            return _JSONExportWriter(self._get_deck_data())
+        return _CSVExportWriter()
+
+    def _get_flashcards(self):
+        return self.deck.flashcards.order_by('created_at')
 
     def _get_deck_data(self) -> Dict[str, Any]:
-        """Get deck data for export."""
+        """Get deck data for export, without the flashcards."""
         return {
             'name': self.deck.name,
             'description': self.deck.description,
@@ -177,19 +338,65 @@ class DeckExportService:
             'level': self.deck.level,
             'category': self.deck.category,
             'tags': self.deck.tags,
-            'flashcards': [
-                {
-                    'front': card.front,
-                    'back': card.back,
-                    'example': card.example,
-                    'audio_url': card.get_audio_url(),
-                    'image_url': card.get_image_url(),
-                }
-                for card in self.deck.flashcards.all()
-            ],
         }
 
 
+class _JSONExportWriter:
+    """Write a deck export as the same indented JSON ``json.dumps`` would produce."""
+
+    def __init__(self, deck_data: Dict[str, Any]):
+        self.deck_data = deck_data
+        self.count = 0
+
+    def head(self) -> bytes:
+        head = json.dumps({**self.deck_data, 'flashcards': []}, ensure_ascii=False, indent=2)
+        # Remove a lista vazia e o fechamento: os flashcards vêm em seguida
+        return head[:-len('[]\n}')].encode('utf-8')
+
+    def card(self, card: Flashcard) -> str:
+        data = json.dumps({
+            'front': card.front,
+            'back': card.back,
+            'example': card.example,
+            'audio_url': card.get_audio_url(),
+            'image_url': card.get_image_url(),
+        }, ensure_ascii=False, indent=2)
+        self.count += 1
+        return ('[\n' if self.count == 1 else ',\n') + textwrap.indent(data, ' ' * 4)
+
+    def tail(self) -> str:
+        return '\n  ]\n}' if self.count else '[]\n}'
+
+
+class _CSVExportWriter:
+    """Write a deck export as CSV."""
+
+    def __init__(self):
+        self.output = io.StringIO()
+        self.writer = csv.writer(self.output)
+
+    def _row(self, values) -> str:
+        self.output.seek(0)
+        self.output.truncate()
+        self.writer.writerow(values)
+        return self.output.getvalue()
+
+    def head(self) -> bytes:
+        return self._row(['front', 'back', 'example', 'audio_url', 'image_url']).encode('utf-8')
+
+    def card(self, card: Flashcard) -> str:
+        return self._row([
+            card.front,
+            card.back,
+            card.example,
+            card.get_audio_url() or '',
+            card.get_image_url() or '',
+        ])
+
+    def tail(self) -> str:
+        return ''
+
+
 class DeckImportService:
     """Service for deck import."""
 
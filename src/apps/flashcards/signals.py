@@ -1,9 +1,26 @@
 """Signals for flashcards app."""
 
-from django.db.models.signals import post_delete, pre_save
-from django.dispatch import receiver
+from django.db import connections
+from django.db.migrations.loader import MigrationLoader
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import Signal, receiver
+from django.utils import timezone
 
-from .models import Flashcard
+from core import metrics
+
+from . import fuzzy, search
+from .models import Deck, Flashcard
+from .services import catalog_changed, invalidate_deck_cache, sync_deck_tags
+
+# Índices criados fora do ORM e a migração que cria cada um
+SEARCH_INDEXES = [
+    ('0002_search_index', search.ensure_installed),
+    ('0003_trigram_index', fuzzy.ensure_installed),
+]
+
+# Enviado após a revisão de um flashcard ser persistida.
+# Argumentos: user, progress, quality, response_time
+review_committed = Signal()
 
 
 @receiver(pre_save, sender=Flashcard)
@@ -28,4 +45,77 @@ def delete_files(sender, instance, **kwargs):
     if instance.audio:
         instance.audio.delete(save=False)
     if instance.image:
-        instance.image.delete(save=False) 
\ No newline at end of file
+        instance.image.delete(save=False)
+
+
+@receiver(post_save, sender=Deck)
+def invalidate_deck_responses(sender, instance, created, **kwargs):
+    """
+    Invalidate cached deck responses when a deck changes.
+
+    The public listings are only cleared when the deck is new or one of its
+    catalog fields changed; other saves only drop the deck's own entry.
+    """
+    invalidate_deck_cache(instance.pk, catalog=created or catalog_changed(instance))
+    instance._loaded_catalog = instance.get_catalog_values()
+
+
+@receiver(post_delete, sender=Deck)
+def invalidate_deleted_deck_responses(sender, instance, **kwargs):
+    """Invalidate cached deck responses when a deck is removed."""
+    invalidate_deck_cache(instance.pk)
+
+
+@receiver(post_save, sender=Deck)
+def sync_tags(sender, instance, created, raw=False, **kwargs):
+    """Keep the normalized tags in sync with the deck's tags field."""
+    if raw:
+        return
+    if not created and getattr(instance, '_loaded_tags', None) == instance.tags:
+        return
+    if created and not instance.tags:
+        return
+    sync_deck_tags(instance)
+
+
+@receiver(post_save, sender=Flashcard)
+def invalidate_flashcard_deck_responses(sender, instance, **kwargs):
+    """Invalidate the cached responses of the deck a flashcard belongs to."""
+    # As listagens não incluem os cards, apenas o deck é invalidado
+    invalidate_deck_cache(instance.deck_id, catalog=False)
+
+
+@receiver(post_delete, sender=Flashcard)
+def touch_deck_on_flashcard_delete(sender, instance, origin=None, **kwargs):
+    """
+    Update the deck's timestamp when one of its flashcards is removed.
+
+    Keeps the deck's Last-Modified honest, since a removal leaves no newer
+    updated_at behind. Skipped when the deck itself is being deleted.
+    """
+    if isinstance(origin, Deck):
+        return
+    Deck.objects.filter(pk=instance.deck_id).update(updated_at=timezone.now())
+    invalidate_deck_cache(instance.deck_id)
+
+
+@receiver(review_committed)
+def count_review(sender, **kwargs):
+    """Count committed reviews for the review throughput metric."""
+    metrics.record_review()
+
+
+@receiver(post_migrate)
+def install_search_index(sender, using, **kwargs):
+    """Install the search indexes on databases created without migrations."""
+    if sender.label != 'flashcards':
+        return
+    connection = connections[using]
+    loader = MigrationLoader(connection, ignore_no_migrations=True)
+    for migration, ensure_installed in SEARCH_INDEXES:
+        # Com migrações, respeita o estado da migração que cria o índice
+        if sender.label in loader.migrated_apps and (
+            (sender.label, migration) not in loader.applied_migrations
+        ):
+            continue
+        ensure_installed(connection)
@@ -0,0 +1,199 @@
+"""Tests for the streaming export and the async flashcards views."""
+
+import csv
+import io
+import json
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .. import services
+from ..models import Deck, Flashcard, FlashcardProgress
+from ..services import DeckExportService
+
+User = get_user_model()
+
+
+class DeckExportStreamTests(TestCase):
+    """Test the export is streamed with the same content as before."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.deck = Deck.objects.create(
+            name='Deck "Viagem"',
+            description='Frases úteis',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            tags='viagem,aeroporto',
+            owner=self.user,
+        )
+
+    def create_cards(self, count):
+        for i in range(count):
+            Flashcard.objects.create(
+                deck=self.deck,
+                front=f'Front {i}, "quoted"',
+                back=f'Verso {i}\ncom quebra',
+                example=f'Exemplo {i}',
+            )
+
+    def expected_json(self):
+        return json.dumps({
+            'name': self.deck.name,
+            'description': self.deck.description,
+            'language': self.deck.language,
+            'level': self.deck.level,
+            'category': self.deck.category,
+            'tags': self.deck.tags,
+            'flashcards': [
+                {
+                    'front': card.front,
+                    'back': card.back,
+                    'example': card.example,
+                    'audio_url': card.get_audio_url(),
+                    'image_url': card.get_image_url(),
+                }
+                for card in self.deck.flashcards.all()
+            ],
+        }, ensure_ascii=False, indent=2)
+
+    def expected_csv(self):
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(['front', 'back', 'example', 'audio_url', 'image_url'])
+        for card in self.deck.flashcards.all():
+            writer.writerow([card.front, card.back, card.example, '', ''])
+        return output.getvalue().encode('utf-8')
+
+    def test_json_matches_json_dumps(self):
+        """Test the streamed JSON is byte-identical to json.dumps, with or without cards."""
+        service = DeckExportService(self.deck)
+        self.assertEqual(service.export('json'), self.expected_json())
+
+        self.create_cards(5)
+        with mock.patch.object(services, 'EXPORT_CHUNK_SIZE', 2):
+            self.assertEqual(service.export('json'), self.expected_json())
+
+    def test_csv_matches_csv_writer(self):
+        """Test the streamed CSV matches writing every row at once."""
+        self.create_cards(5)
+        with mock.patch.object(services, 'EXPORT_CHUNK_SIZE', 2):
+            content = DeckExportService(self.deck).export('csv')
+
+        self.assertEqual(content, self.expected_csv())
+
+    def test_stream_reads_in_chunks(self):
+        """Test the flashcards are yielded in batches of EXPORT_CHUNK_SIZE."""
+        self.create_cards(5)
+        with mock.patch.object(services, 'EXPORT_CHUNK_SIZE', 2):
+            chunks = list(DeckExportService(self.deck).stream('csv'))
+
+        # Cabeçalho, dois lotes completos e o restante
+        self.assertEqual(len(chunks), 4)
+
+    async def test_astream_matches_stream(self):
+        """Test the async stream yields the same content as the sync one."""
+        await sync_to_async(self.create_cards)(3)
+        service = DeckExportService(self.deck)
+        for format in DeckExportService.SUPPORTED_FORMATS:
+            chunks = [chunk async for chunk in service.astream(format)]
+            expected = await sync_to_async(lambda: b''.join(service.stream(format)))()
+            self.assertEqual(b''.join(chunks), expected)
+
+
+class AsyncViewTests(TestCase):
+    """Test the async actions, through the ASGI handler and the sync one."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.async_client = AsyncClient()
+        self.headers = {'Authorization': f'Bearer {token}'}
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.deck = Deck.objects.create(
+            name='Test Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+            is_public=True,
+        )
+        self.flashcard = Flashcard.objects.create(deck=self.deck, front='Front', back='Back')
+
+    async def test_export_streams_under_asgi(self):
+        """Test the export is streamed from the async ORM under ASGI."""
+        url = reverse('flashcards:deck-export', args=[self.deck.id])
+        res = await self.async_client.get(url, {'format': 'json'}, headers=self.headers)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertTrue(res.is_async)
+        content = b''.join([chunk async for chunk in res.streaming_content])
+        self.assertEqual(json.loads(content)['flashcards'][0]['front'], 'Front')
+        self.assertIn('ETag', res)
+
+    def test_export_csv_under_wsgi(self):
+        """Test ``?format=csv`` selects the export format on the sync handler."""
+        url = reverse('flashcards:deck-export', args=[self.deck.id])
+        res = self.client.get(url, {'format': 'csv'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse(res.is_async)
+        self.assertEqual(res['Content-Type'], 'text/csv')
+        self.assertIn(b'Front,Back', b''.join(res.streaming_content))
+
+    def test_export_unsupported_format(self):
+        """Test an unknown format is rejected before streaming."""
+        url = reverse('flashcards:deck-export', args=[self.deck.id])
+        res = self.client.get(url, {'format': 'xml'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_due_review_under_asgi(self):
+        """Test due cards are listed by the async action."""
+        await FlashcardProgress.objects.acreate(
+            user=self.user,
+            flashcard=self.flashcard,
+            next_review_date=timezone.now() - timedelta(days=1),
+        )
+        res = await self.async_client.get(
+            reverse('flashcards:flashcard-due-review'), headers=self.headers,
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.json()), 1)
+
+    async def test_async_action_requires_authentication(self):
+        """Test DRF authentication still runs before async actions."""
+        res = await self.async_client.get(reverse('flashcards:deck-recommendations'))
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_recommendations_under_asgi(self):
+        """Test recommendations are served by the async action."""
+        res = await self.async_client.get(
+            reverse('flashcards:deck-recommendations'), headers=self.headers,
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(res.json(), list)
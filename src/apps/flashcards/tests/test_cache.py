@@ -0,0 +1,306 @@
+"""Tests for the flashcards response cache."""
+
+import json
+import threading
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core import metrics, singleflight
+from core.cache import TwoTierCache, _listener
+
+from ..models import Deck, DeckFavorite, Flashcard
+from ..services import DeckRecommendationService, catalog_cache, deck_cache
+
+if metrics.is_enabled():
+    from prometheus_client import REGISTRY
+
+User = get_user_model()
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+})
+class DeckResponseCacheTests(TestCase):
+    """Test the response cache of the public deck endpoints."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        catalog_cache.evict_local()
+        deck_cache.evict_local()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123',
+        )
+        self.deck = Deck.objects.create(
+            name='Test Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+            is_public=True,
+            is_featured=True,
+        )
+        DeckFavorite.objects.create(user=self.user, deck=self.deck)
+        self.url = reverse('flashcards:deck-featured')
+
+    def test_featured_served_from_cache(self):
+        """Test a repeated listing only queries the user's favorites."""
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.url)
+        with self.assertNumQueries(1):
+            res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['results'][0]['id'], self.deck.id)
+
+    def test_is_favorite_overlaid_per_user(self):
+        """Test cached listings carry the favorite flag of each user."""
+        self.client.force_authenticate(user=self.user)
+        res = self.client.get(self.url)
+        self.assertTrue(res.data['results'][0]['is_favorite'])
+
+        self.client.force_authenticate(user=self.other_user)
+        res = self.client.get(self.url)
+        self.assertFalse(res.data['results'][0]['is_favorite'])
+
+    def test_equivalent_query_params_share_entry(self):
+        """Test parameter order and empty values do not change the cache key."""
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.url, {'level': 'A1', 'ordering': 'name', 'search': ''})
+        with self.assertNumQueries(1):
+            self.client.get(f'{self.url}?ordering=name&level=A1')
+
+    def test_deck_change_invalidates_listing(self):
+        """Test saving a deck invalidates the cached listings."""
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.url)
+        self.deck.name = 'Renamed Deck'
+        self.deck.save()
+
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.data['results'][0]['name'], 'Renamed Deck')
+
+    def test_non_catalog_change_keeps_listing(self):
+        """Test saving fields absent from the listings keeps them cached."""
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.url)
+        deck = Deck.objects.get(pk=self.deck.pk)
+        deck.increment_study_count()
+
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        deck.is_featured = False
+        deck.save()
+        res = self.client.get(self.url)
+        self.assertEqual(res.data['results'], [])
+
+    def test_retrieve_cache_key_normalized(self):
+        """Test equivalent deck ids share one cache entry and its invalidation."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('flashcards:deck-detail', args=[self.deck.id])
+        padded_url = url.replace(f'/{self.deck.id}/', f'/0{self.deck.id}/')
+        self.client.get(url)
+        with self.assertNumQueries(1):
+            self.client.get(padded_url)
+
+        self.deck.name = 'Renamed Deck'
+        self.deck.save()
+
+        self.assertEqual(self.client.get(padded_url).data['name'], 'Renamed Deck')
+
+    @override_settings(ALLOWED_HOSTS=['*'])
+    def test_retrieve_cards_url_follows_host(self):
+        """Test the cached deck detail links to the cards on the requested host."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('flashcards:deck-detail', args=[self.deck.id])
+        self.client.get(url, HTTP_HOST='a.example.com')
+
+        res = self.client.get(url, HTTP_HOST='b.example.com')
+
+        self.assertTrue(res.data['cards_url'].startswith('http://b.example.com/'))
+
+    def test_retrieve_invalidated_by_flashcard_change(self):
+        """Test flashcard writes invalidate the cached deck detail."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('flashcards:deck-detail', args=[self.deck.id])
+        self.client.get(url)
+        with self.assertNumQueries(1):
+            self.client.get(url)
+
+        Flashcard.objects.create(deck=self.deck, front='Front', back='Back')
+
+        with self.assertNumQueries(4):
+            res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.data['is_favorite'])
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+})
+class TwoTierCacheTests(TestCase):
+    """Test the two-tier cache."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.cache = TwoTierCache('test_two_tier', maxsize=2)
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return self.calls
+
+    def test_local_tier_serves_without_shared_tier(self):
+        """Test values are kept locally after the first read."""
+        self.assertEqual(self.cache.get_or_set('a', self.compute), 1)
+        cache.clear()
+
+        self.assertEqual(self.cache.get_or_set('a', self.compute), 1)
+
+    def test_shared_tier_fills_local_tier(self):
+        """Test a local miss is served from the shared tier."""
+        self.cache.get_or_set('a', self.compute)
+        self.cache.evict_local()
+
+        self.assertEqual(self.cache.get_or_set('a', self.compute), 1)
+        self.assertEqual(self.calls, 1)
+
+    def test_local_tier_is_bounded(self):
+        """Test the least recently used entry is evicted."""
+        for key in ['a', 'b', 'c']:
+            self.cache.set(key, key)
+
+        self.assertEqual(list(self.cache._data), ['b', 'c'])
+
+    def test_delete_and_clear(self):
+        """Test invalidations reach both tiers."""
+        self.cache.get_or_set('a', self.compute)
+        self.cache.delete('a')
+        self.assertEqual(self.cache.get_or_set('a', self.compute), 2)
+
+        self.cache.clear()
+        self.assertEqual(self.cache.get_or_set('a', self.compute), 3)
+
+    def test_broadcast_evicts_local_tier(self):
+        """Test invalidation messages from other workers evict local entries."""
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+
+        _listener.handle(json.dumps({'cache': 'test_two_tier', 'key': 'a'}))
+        self.assertEqual(list(self.cache._data), ['b'])
+
+        _listener.handle(json.dumps({'cache': 'test_two_tier', 'key': None}))
+        self.assertEqual(list(self.cache._data), [])
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+})
+class SingleFlightTests(TestCase):
+    """Test request coalescing on cache misses."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        time.sleep(0.2)
+        return 'fresh'
+
+    def test_concurrent_misses_compute_once(self):
+        """Test only one of several concurrent callers recomputes the value."""
+        results = []
+
+        def worker():
+            results.append(singleflight.load('sf_key', self.compute, 60, name='sf_test'))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['fresh'] * 4)
+        self.assertEqual(self.calls, 1)
+        if metrics.is_enabled():
+            self.assertEqual(
+                REGISTRY.get_sample_value(
+                    'single_flight_calls_total', {'name': 'sf_test', 'outcome': 'leader'},
+                ),
+                1,
+            )
+
+    def test_recommendations_keyed_by_limit(self):
+        """Test callers asking for different limits do not share a result."""
+        user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123',
+        )
+        for index in range(2):
+            Deck.objects.create(
+                name=f'Deck {index}',
+                language='en',
+                level='A1',
+                category='vocabulary',
+                owner=owner,
+                is_public=True,
+            )
+        service = DeckRecommendationService(user)
+
+        self.assertEqual(len(service.get_recommendations(limit=1)), 1)
+        self.assertEqual(len(service.get_recommendations(limit=2)), 2)
+
+    def test_serves_stale_while_leader_recomputes(self):
+        """Test waiters get the stale copy while the lock is held."""
+        cache.set(f'sf_stale{singleflight.STALE_SUFFIX}', 'stale')
+
+        with singleflight._local_lock('sf_stale'):
+            value = singleflight.load('sf_stale', self.compute, 60)
+
+        self.assertEqual(value, 'stale')
+        self.assertEqual(self.calls, 0)
+
+    def test_should_cache(self):
+        """Test values rejected by should_cache are not stored."""
+        singleflight.load('sf_skip', self.compute, 60, should_cache=lambda value: False)
+
+        self.assertIsNone(cache.get('sf_skip'))
+
+    def test_uncached_values_skip_waiting(self):
+        """Test misses of values that will not be cached do not wait for a leader."""
+        singleflight.load('sf_skip', self.compute, 60, should_cache=lambda value: False)
+
+        started = time.monotonic()
+        with singleflight._local_lock('sf_skip'):
+            value = singleflight.load(
+                'sf_skip', self.compute, 60, wait_timeout=5, should_cache=lambda value: False,
+            )
+
+        self.assertEqual(value, 'fresh')
+        self.assertEqual(self.calls, 2)
+        self.assertLess(time.monotonic() - started, 2)
@@ -0,0 +1,131 @@
+"""Tests for conditional requests on decks and flashcards."""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import Deck, DeckFavorite, Flashcard
+from ..services import catalog_cache, deck_cache
+
+User = get_user_model()
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+})
+class ConditionalRequestTests(TestCase):
+    """Test ETag and Last-Modified support."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        catalog_cache.evict_local()
+        deck_cache.evict_local()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.deck = Deck.objects.create(
+            name='Test Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+            is_public=True,
+        )
+        self.flashcard = Flashcard.objects.create(
+            deck=self.deck,
+            front='Front',
+            back='Back',
+        )
+        self.detail_url = reverse('flashcards:deck-detail', args=[self.deck.id])
+
+    def test_retrieve_not_modified(self):
+        """Test a matching If-None-Match returns 304 without a body."""
+        res = self.client.get(self.detail_url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn('Last-Modified', res)
+
+        res = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=res['ETag'])
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res.content, b'')
+
+    def test_retrieve_etag_changes_with_cards_and_favorites(self):
+        """Test the ETag follows flashcard writes and the user's favorite."""
+        etag = self.client.get(self.detail_url)['ETag']
+
+        Flashcard.objects.create(deck=self.deck, front='New', back='Card')
+        res = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        etag = res['ETag']
+        DeckFavorite.objects.create(user=self.user, deck=self.deck)
+        res = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.data['is_favorite'])
+
+    def test_retrieve_last_modified_follows_card_removal(self):
+        """Test removing a flashcard invalidates If-Modified-Since."""
+        last_modified = self.client.get(self.detail_url)['Last-Modified']
+        res = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Deck.objects.filter(pk=self.deck.pk).update(
+            updated_at=self.deck.updated_at.replace(year=2000),
+        )
+        Flashcard.objects.filter(pk=self.flashcard.pk).update(
+            updated_at=self.deck.updated_at.replace(year=2000),
+        )
+        deck_cache.evict_local()
+        cache.clear()
+        last_modified = self.client.get(self.detail_url)['Last-Modified']
+        self.flashcard.delete()
+
+        res = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_export_not_modified(self):
+        """Test export answers 304 until the deck content changes."""
+        url = reverse('flashcards:deck-export', args=[self.deck.id])
+        etag = self.client.get(url, {'format': 'json'})['ETag']
+
+        res = self.client.get(url, {'format': 'json'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.flashcard.front = 'Changed'
+        self.flashcard.save()
+        res = self.client.get(url, {'format': 'json'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_flashcard_list_not_modified(self):
+        """Test the deck flashcard listing answers 304 until a card changes."""
+        url = reverse('flashcards:flashcard-list')
+        etag = self.client.get(url, {'deck': self.deck.id})['ETag']
+
+        res = self.client.get(url, {'deck': self.deck.id}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.flashcard.delete()
+        res = self.client.get(url, {'deck': self.deck.id}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_flashcard_list_expanded_deck_changes_etag(self):
+        """Test a deck change invalidates listings that expand the deck."""
+        url = reverse('flashcards:flashcard-list')
+        params = {'deck': self.deck.id, 'expand': 'deck'}
+        etag = self.client.get(url, params)['ETag']
+
+        self.deck.name = 'Renamed Deck'
+        self.deck.save()
+        res = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['results'][0]['deck']['name'], 'Renamed Deck')
@@ -0,0 +1,105 @@
+"""Tests for the paginated deck cards sub-resource."""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import Deck, Flashcard
+
+User = get_user_model()
+
+
+class DeckCardsTests(TestCase):
+    """Test the deck detail header and its cards endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.deck = Deck.objects.create(
+            name='Test Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+        )
+        Flashcard.objects.bulk_create([
+            Flashcard(deck=self.deck, front=f'Front {i}', back=f'Back {i}')
+            for i in range(5)
+        ])
+        self.url = reverse('flashcards:deck-cards', args=[self.deck.id])
+
+    def test_detail_links_to_cards(self):
+        """Test the deck detail returns the header without embedded cards."""
+        res = self.client.get(reverse('flashcards:deck-detail', args=[self.deck.id]))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotIn('flashcards', res.data)
+        self.assertEqual(res.data['flashcards_count'], 5)
+        self.assertTrue(res.data['cards_url'].endswith(self.url))
+
+    def test_cursor_pages(self):
+        """Test cards are returned in pages linked by a cursor."""
+        res = self.client.get(self.url, {'page_size': 2})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        fronts = [card['front'] for card in res.data['results']]
+        while res.data['next']:
+            res = self.client.get(res.data['next'])
+            fronts += [card['front'] for card in res.data['results']]
+
+        self.assertEqual(fronts, [f'Front {i}' for i in range(5)])
+
+    def test_sparse_fields(self):
+        """Test ?fields= applies to the cards."""
+        res = self.client.get(self.url, {'fields': 'id,front'})
+
+        self.assertEqual(set(res.data['results'][0]), {'id', 'front'})
+
+    def test_expanded_deck_loaded_with_cards(self):
+        """Test ?expand=deck does not query the deck once per card."""
+        params = {'fields': 'id,front,deck', 'expand': 'deck'}
+        self.client.get(self.url, params)
+        with CaptureQueriesContext(connection) as one_card:
+            self.client.get(self.url, {**params, 'page_size': 1})
+        with CaptureQueriesContext(connection) as all_cards:
+            res = self.client.get(self.url, params)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['results'][0]['deck']['name'], 'Test Deck')
+        self.assertEqual(len(all_cards), len(one_card))
+
+    def test_not_modified(self):
+        """Test an unchanged page answers 304 until a card changes."""
+        etag = self.client.get(self.url)['ETag']
+
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Flashcard.objects.filter(deck=self.deck).first().delete()
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_private_deck_hidden(self):
+        """Test other users cannot page through a private deck."""
+        self.deck.is_public = False
+        self.deck.save()
+        self.client.force_authenticate(user=self.other_user)
+
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,123 @@
+"""Tests for fuzzy autocomplete."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..fuzzy import TrigramIndex, autocomplete_tags
+from ..models import Deck, Flashcard
+
+User = get_user_model()
+
+
+class TrigramIndexTests(TestCase):
+    """Test the in-memory trigram index."""
+
+    def test_typo_tolerant_ranking(self):
+        """Test misspelled queries still find the closest texts first."""
+        index = TrigramIndex([(1, 'Travel phrases'), (2, 'Travelling abroad'), (3, 'Food')])
+
+        keys = [key for key, _ in index.search('travl', 10)]
+
+        self.assertEqual(keys, [1, 2])
+
+    def test_limit(self):
+        """Test only the best ``limit`` matches are returned."""
+        index = TrigramIndex([(i, f'Verbs {i}') for i in range(20)])
+
+        self.assertEqual(len(index.search('verbs', 5)), 5)
+
+
+class AutocompleteTests(TestCase):
+    """Test the autocomplete endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.travel_deck = Deck.objects.create(
+            name='Travel phrases',
+            language='en',
+            level='A1',
+            category='expressions',
+            owner=self.user,
+            tags='travel,airport',
+        )
+        self.private_deck = Deck.objects.create(
+            name='Travel secrets',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.other_user,
+            is_public=False,
+            tags='travelogue',
+        )
+        Flashcard.objects.create(
+            deck=self.travel_deck,
+            front='Airport',
+            back='Aeroporto',
+        )
+        self.url = reverse('flashcards:search-autocomplete')
+
+    def test_requires_query(self):
+        """Test a missing query is rejected."""
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_misspelled_deck_name(self):
+        """Test decks are suggested despite typos, hiding other users' private decks."""
+        res = self.client.get(self.url, {'q': 'travl', 'type': 'decks'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([deck['id'] for deck in res.data['decks']], [self.travel_deck.id])
+        self.assertNotIn('tags', res.data)
+
+    def test_tags_and_flashcards(self):
+        """Test tags and flashcard fronts are suggested."""
+        res = self.client.get(self.url, {'q': 'airprt'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['tag'] for item in res.data['tags']], ['airport'])
+        self.assertEqual(res.data['flashcards'][0]['front'], 'Airport')
+
+    def test_limit_clamped(self):
+        """Test out of range limits are clamped instead of failing."""
+        res = self.client.get(self.url, {'q': 'travl', 'type': 'decks', 'limit': -3})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data['decks']), 1)
+
+    def test_tags_filtered_by_queryset(self):
+        """Test the shared tag index only suggests tags of the given decks."""
+        all_tags = autocomplete_tags(Deck.objects.all(), 'travelog')
+        public_tags = autocomplete_tags(Deck.objects.filter(is_public=True), 'travelog')
+
+        self.assertIn('travelogue', [tag for tag, _ in all_tags])
+        self.assertNotIn('travelogue', [tag for tag, _ in public_tags])
+
+    def test_index_follows_writes(self):
+        """Test new decks are suggested right after they are created."""
+        deck = Deck.objects.create(
+            name='Irregular verbs',
+            language='en',
+            level='B1',
+            category='grammar',
+            owner=self.user,
+        )
+
+        res = self.client.get(self.url, {'q': 'irregullar', 'type': 'decks'})
+
+        self.assertEqual([item['id'] for item in res.data['decks']], [deck.id])
@@ -0,0 +1,90 @@
+"""Tests for the orjson renderer and parser."""
+
+import datetime
+import decimal
+import io
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient
+
+from core.renderers import ORJSONParser, ORJSONRenderer
+
+from ..models import Deck
+
+User = get_user_model()
+
+
+class ORJSONRendererTests(TestCase):
+    """Test the renderer and parser output."""
+
+    def test_native_types(self):
+        """Test datetimes, decimals, UUIDs and lazy strings are rendered."""
+        value = uuid.uuid4()
+        data = {
+            'when': datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+            'price': decimal.Decimal('1.50'),
+            'id': value,
+            'detail': _('Deck não encontrado.'),
+            1: 'int key',
+        }
+
+        content = ORJSONRenderer().render(data)
+
+        self.assertEqual(
+            content,
+            b'{"when":"2024-01-02T03:04:05Z","price":1.5,"id":"%s",'
+            b'"detail":"Deck n\xc3\xa3o encontrado.","1":"int key"}' % str(value).encode(),
+        )
+
+    def test_parse(self):
+        """Test request bodies are parsed and invalid JSON rejected."""
+        parser = ORJSONParser()
+
+        self.assertEqual(parser.parse(io.BytesIO('{"front": "Olá"}'.encode())), {'front': 'Olá'})
+        with self.assertRaises(ParseError):
+            parser.parse(io.BytesIO(b'{"front": '))
+
+
+class ORJSONResponseTests(TestCase):
+    """Test API responses go through the orjson renderer."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.deck = Deck.objects.create(
+            name='Test Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+            last_studied_at=timezone.now(),
+        )
+
+    def test_json_response(self):
+        """Test JSON responses and requests round-trip through orjson."""
+        res = self.client.get(reverse('flashcards:deck-detail', args=[self.deck.id]))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res['Content-Type'], 'application/json')
+        self.assertEqual(res.json()['name'], 'Test Deck')
+
+        res = self.client.post(
+            reverse('flashcards:flashcard-list'),
+            {'deck': self.deck.id, 'front': 'Olá', 'back': 'Hello'},
+            format='json',
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.json()['front'], 'Olá')
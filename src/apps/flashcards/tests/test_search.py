@@ -0,0 +1,118 @@
+"""Tests for full-text search."""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from .. import search
+from ..models import Deck, Flashcard
+
+User = get_user_model()
+
+
+class SearchTests(TestCase):
+    """Test the search index and the search endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.travel_deck = Deck.objects.create(
+            name='Travel phrases',
+            description='Useful phrases for the airport',
+            language='en',
+            level='A1',
+            category='expressions',
+            owner=self.user,
+            tags='travel,airport',
+        )
+        self.food_deck = Deck.objects.create(
+            name='Food',
+            description='Restaurant vocabulary and a short travel section',
+            language='en',
+            level='A2',
+            category='vocabulary',
+            owner=self.user,
+        )
+        self.private_deck = Deck.objects.create(
+            name='Secret travel notes',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.other_user,
+            is_public=False,
+        )
+        self.flashcard = Flashcard.objects.create(
+            deck=self.travel_deck,
+            front='Where is the gate?',
+            back='Onde fica o portão?',
+        )
+        self.url = reverse('flashcards:search')
+
+    def test_index_installed(self):
+        """Test the search index exists in the test database."""
+        self.assertEqual(
+            search.is_installed(connection), connection.vendor in ('sqlite', 'postgresql'),
+        )
+
+    def test_ranked_decks(self):
+        """Test matches in the name rank above matches in the description."""
+        res = self.client.get(self.url, {'q': 'travel', 'type': 'decks'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        ids = [deck['id'] for deck in res.data['decks']]
+        self.assertEqual(ids, [self.travel_deck.id, self.food_deck.id])
+        self.assertNotIn('flashcards', res.data)
+
+    def test_flashcards_follow_updates(self):
+        """Test the index is kept in sync with writes."""
+        res = self.client.get(self.url, {'q': 'gate', 'type': 'flashcards'})
+        self.assertEqual([card['id'] for card in res.data['flashcards']], [self.flashcard.id])
+
+        self.flashcard.front = 'Where is the platform?'
+        self.flashcard.save()
+        res = self.client.get(self.url, {'q': 'gate'})
+        self.assertEqual(res.data['flashcards'], [])
+
+        self.flashcard.delete()
+        res = self.client.get(self.url, {'q': 'platform'})
+        self.assertEqual(res.data['flashcards'], [])
+
+    def test_query_operators_are_escaped(self):
+        """Test user input is not interpreted as search syntax."""
+        res = self.client.get(self.url, {'q': 'gate" OR (NEAR'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_missing_query(self):
+        """Test the query parameter is required."""
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_limit_clamped(self):
+        """Test out of range limits are clamped instead of failing."""
+        res = self.client.get(self.url, {'q': 'airport', 'limit': -3})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data['decks']), 1)
+
+    def test_deck_list_search_param(self):
+        """Test the deck listing search uses the index."""
+        res = self.client.get(reverse('flashcards:deck-list'), {'search': 'airport'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([deck['id'] for deck in res.data['results']], [self.travel_deck.id])
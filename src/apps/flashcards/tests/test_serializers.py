@@ -1,10 +1,19 @@
 """Tests for flashcards serializers."""
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
 
 from ..models import Deck, Flashcard
-from ..serializers import DeckDetailSerializer, DeckSerializer, FlashcardSerializer
+from ..serializers import (
+    DeckDetailSerializer,
+    DeckListSerializer,
+    DeckSerializer,
+    FlashcardSerializer,
+)
 
 User = get_user_model()
 
@@ -123,7 +132,101 @@ class DeckDetailSerializerTests(TestCase):
         self.assertEqual(data['owner'], self.user.id)
         self.assertEqual(data['owner_username'], self.user.username)
         self.assertEqual(data['flashcards_count'], 1)
-        self.assertEqual(len(data['flashcards']), 1)
-        self.assertEqual(data['flashcards'][0]['front'], self.flashcard.front)
-        self.assertEqual(data['flashcards'][0]['back'], self.flashcard.back)
-        self.assertEqual(data['flashcards'][0]['example'], self.flashcard.example) 
\ No newline at end of file
+        self.assertNotIn('flashcards', data)
+        self.assertEqual(data['cards_url'], reverse('flashcards:deck-cards', args=[self.deck.id]))
+
+
+class DynamicFieldsTests(TestCase):
+    """Test sparse fieldsets and expansions."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.parent = Deck.objects.create(
+            name='Original Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+        )
+        self.deck = Deck.objects.create(
+            name='Copied Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+            parent_deck=self.parent,
+        )
+        self.flashcard = Flashcard.objects.create(deck=self.deck, front='Front', back='Back')
+
+    def test_fields_argument(self):
+        """Test only the requested fields are serialized."""
+        data = DeckSerializer(self.deck, fields=['id', 'name']).data
+
+        self.assertEqual(set(data), {'id', 'name'})
+
+    def test_expand_argument(self):
+        """Test expandable fields are replaced by nested representations."""
+        data = DeckSerializer(self.deck, expand=['parent_deck']).data
+
+        self.assertEqual(data['parent_deck']['name'], self.parent.name)
+
+    def test_compact_list_serializer(self):
+        """Test the catalog serializer only has the compact fields."""
+        data = DeckListSerializer(self.deck).data
+
+        self.assertNotIn('description', data)
+        self.assertEqual(data['owner_username'], self.user.username)
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    })
+    def test_sparse_list(self):
+        """Test ?fields= trims the listing and loads only the needed columns."""
+        cache.clear()
+        url = reverse('flashcards:deck-list')
+        # Atividade recente: o LastActivityMiddleware não grava nesta requisição
+        self.assertFalse(self.user.touch_activity())
+
+        # Contagem e página da listagem
+        with self.assertNumQueries(2):
+            res = self.client.get(url, {'fields': 'id,name,owner_username'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(res.data['results'][0]), {'id', 'name', 'owner_username'})
+
+    def test_sparse_detail(self):
+        """Test ?fields= and ?expand= on the deck detail."""
+        url = reverse('flashcards:deck-detail', args=[self.deck.id])
+
+        res = self.client.get(url, {'fields': 'id,is_favorite', 'expand': 'parent_deck'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(res.data), {'id', 'is_favorite', 'parent_deck'})
+        self.assertEqual(res.data['parent_deck']['id'], self.parent.id)
+
+    def test_expand_flashcard_deck(self):
+        """Test flashcards can embed their deck."""
+        url = reverse('flashcards:flashcard-list')
+
+        res = self.client.get(url, {'fields': 'id,front', 'expand': 'deck'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['results'][0]['deck']['name'], self.deck.name)
+
+    def test_writes_ignore_query_parameters(self):
+        """Test sparse fieldsets do not restrict writes."""
+        url = reverse('flashcards:flashcard-list')
+
+        res = self.client.post(
+            f'{url}?fields=id', {'deck': self.deck.id, 'front': 'New', 'back': 'Novo'},
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['front'], 'New')
@@ -0,0 +1,130 @@
+"""Tests for normalized deck tags."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import Deck, DeckTag, Flashcard, Tag
+
+User = get_user_model()
+
+
+class TagSyncTests(TestCase):
+    """Test the tag tables follow the deck's tags field."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.deck = Deck.objects.create(
+            name='Travel',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+            tags='Travel, airport,travel,',
+        )
+
+    def test_created_with_tags(self):
+        """Test tags are normalized and deduplicated on creation."""
+        self.assertEqual(
+            sorted(self.deck.tag_set.values_list('name', flat=True)),
+            ['airport', 'travel'],
+        )
+
+    def test_tags_updated(self):
+        """Test removed tags are unlinked and new ones created."""
+        self.deck.tags = 'travel,hotel'
+        self.deck.save()
+
+        self.assertEqual(
+            sorted(self.deck.tag_set.values_list('name', flat=True)),
+            ['hotel', 'travel'],
+        )
+        self.assertTrue(Tag.objects.filter(name='airport').exists())
+
+    def test_unchanged_tags_not_synced(self):
+        """Test saving a loaded deck without tag changes skips the tag tables."""
+        deck = Deck.objects.get(pk=self.deck.pk)
+
+        with self.assertNumQueries(1):
+            deck.increment_study_count()
+
+    def test_duplicate_copies_tags(self):
+        """Test duplicated decks get the same tags."""
+        copy = self.deck.duplicate()
+
+        self.assertEqual(DeckTag.objects.filter(deck=copy).count(), 2)
+
+
+class TagFilterTests(TestCase):
+    """Test tag filters on deck and flashcard listings."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.travel_deck = Deck.objects.create(
+            name='Travel',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+            tags='travel,airport',
+        )
+        self.hotel_deck = Deck.objects.create(
+            name='Hotel',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.user,
+            tags='travel,hotel',
+        )
+        Deck.objects.create(
+            name='Grammar',
+            language='en',
+            level='A1',
+            category='grammar',
+            owner=self.user,
+        )
+        self.flashcard = Flashcard.objects.create(
+            deck=self.travel_deck,
+            front='Gate',
+            back='Portão',
+        )
+        Flashcard.objects.create(deck=self.hotel_deck, front='Room', back='Quarto')
+
+    def _deck_ids(self, params):
+        res = self.client.get(reverse('flashcards:deck-list'), params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return sorted(deck['id'] for deck in res.data['results'])
+
+    def test_decks_with_any_tag(self):
+        """Test decks matching any of the tags are listed once."""
+        ids = self._deck_ids({'tags': 'airport,Hotel'})
+
+        self.assertEqual(ids, sorted([self.travel_deck.id, self.hotel_deck.id]))
+        self.assertEqual(self._deck_ids({'tags': 'travel'}), ids)
+
+    def test_decks_with_all_tags(self):
+        """Test decks must have every tag with tags_all."""
+        ids = self._deck_ids({'tags_all': 'travel,airport'})
+
+        self.assertEqual(ids, [self.travel_deck.id])
+
+    def test_flashcards_by_deck_tags(self):
+        """Test flashcards are filtered by the tags of their deck."""
+        res = self.client.get(reverse('flashcards:flashcard-list'), {'tags': 'airport'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([card['id'] for card in res.data['results']], [self.flashcard.id])
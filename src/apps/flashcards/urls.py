@@ -3,7 +3,13 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import DeckFavoriteViewSet, DeckViewSet, FlashcardViewSet
+from .views import (
+    AutocompleteView,
+    DeckFavoriteViewSet,
+    DeckViewSet,
+    FlashcardViewSet,
+    SearchView,
+)
 
 app_name = 'flashcards'
 
@@ -13,5 +19,7 @@ router.register('favorites', DeckFavoriteViewSet, basename='favorite')
 router.register('flashcards', FlashcardViewSet, basename='flashcard')
 
 urlpatterns = [
+    path('search/', SearchView.as_view(), name='search'),
+    path('search/autocomplete/', AutocompleteView.as_view(), name='search-autocomplete'),
     path('', include(router.urls)),
 ] 
\ No newline at end of file
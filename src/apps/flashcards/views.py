@@ -1,49 +1,101 @@
-from django.db.models import Q
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, Q
+from django.http import StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
 from django.core.cache import cache
 from django.conf import settings
 from rest_framework import viewsets, permissions, status, parsers
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from django_filters import rest_framework as filters
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 
-from .models import Flashcard, FlashcardProgress, Deck, DeckFavorite
+from core.cache import normalize_query_params
+from core.conditional import get_not_modified_response, make_etag, set_validators
+from core.serializers import EXPAND_PARAM, FIELDS_PARAM, SparseFieldsetMixin, parse_field_list
+from core.views import AsyncActionsMixin
+
+from .models import Flashcard, FlashcardProgress, Deck, DeckFavorite, LANGUAGE_CHOICES
+from .fuzzy import autocomplete_decks, autocomplete_flashcards, autocomplete_tags
+from .pagination import FlashcardCursorPagination
+from .search import FullTextSearchFilter, search_decks, search_flashcards
 from .serializers import (
     FlashcardSerializer,
     FlashcardProgressSerializer,
     FlashcardReviewSerializer,
     DeckDetailSerializer,
     DeckSerializer,
+    DeckListSerializer,
     DeckFavoriteSerializer,
 )
-from .services import DeckRecommendationService, DeckExportService, DeckImportService
+from .services import (
+    DeckRecommendationService,
+    DeckExportService,
+    DeckImportService,
+    aget_deck_content_version,
+    catalog_cache,
+    deck_cache,
+    get_content_version,
+    get_deck_content_version,
+    get_favorite_deck_ids,
+    get_tagged_deck_ids,
+)
+from .signals import review_committed
+
+
+class DeckFilter(filters.FilterSet):
+    """
+    Filtros para o modelo Deck.
+    """
+    tags = filters.CharFilter(
+        method='filter_tags',
+        help_text=_('Decks com qualquer uma das tags (separadas por vírgula).'),
+    )
+    tags_all = filters.CharFilter(
+        method='filter_tags',
+        help_text=_('Decks com todas as tags (separadas por vírgula).'),
+    )
+
+    def filter_tags(self, queryset, name, value):
+        return queryset.filter(pk__in=get_tagged_deck_ids(value, match_all=name == 'tags_all'))
+
+    class Meta:
+        model = Deck
+        fields = ['language', 'level', 'category', 'is_public', 'is_featured', 'tags', 'tags_all']
 
 
 class FlashcardFilter(filters.FilterSet):
     """
     Filtros para o modelo Flashcard.
     """
-    level = filters.CharFilter(lookup_expr='exact')
-    category = filters.CharFilter(lookup_expr='icontains')
-    tags = filters.CharFilter(method='filter_tags')
-    search = filters.CharFilter(method='filter_search')
+    level = filters.CharFilter(field_name='deck__level', lookup_expr='exact')
+    category = filters.CharFilter(field_name='deck__category', lookup_expr='icontains')
+    tags = filters.CharFilter(
+        method='filter_tags',
+        help_text=_('Flashcards de decks com qualquer uma das tags.'),
+    )
+    tags_all = filters.CharFilter(
+        method='filter_tags',
+        help_text=_('Flashcards de decks com todas as tags.'),
+    )
 
     def filter_tags(self, queryset, name, value):
-        tags = value.split(',')
-        return queryset.filter(tags__contains=tags)
-
-    def filter_search(self, queryset, name, value):
-        return queryset.filter(Q(front__icontains=value) | Q(back__icontains=value))
+        return queryset.filter(deck_id__in=get_tagged_deck_ids(value, match_all=name == 'tags_all'))
 
     class Meta:
         model = Flashcard
-        fields = ['level', 'category', 'tags']
+        fields = ['deck', 'level', 'category', 'tags', 'tags_all']
 
 
 @extend_schema(tags=['decks'])
-class DeckViewSet(viewsets.ModelViewSet):
+class DeckViewSet(AsyncActionsMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """
     ViewSet para gerenciamento de decks de flashcards.
     
@@ -54,8 +106,10 @@ class DeckViewSet(viewsets.ModelViewSet):
     queryset = Deck.objects.all()
     serializer_class = DeckSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filterset_fields = ['language', 'level', 'category', 'is_public', 'is_featured']
+    filter_backends = [filters.DjangoFilterBackend, FullTextSearchFilter, OrderingFilter]
+    filterset_class = DeckFilter
     search_fields = ['name', 'description', 'tags']
+    full_text_search = staticmethod(search_decks)
     ordering_fields = [
         'name',
         'created_at',
@@ -69,6 +123,23 @@ class DeckViewSet(viewsets.ModelViewSet):
     ]
     ordering = ['name']
     parser_classes = [parsers.MultiPartParser, parsers.FormParser]
+    sparse_actions = ('list', 'public_decks', 'featured')
+
+    def get_queryset(self):
+        """Return queryset."""
+        queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            # Total de cards calculado no mesmo SELECT do deck
+            queryset = queryset.annotate(flashcards_count=Count('flashcards'))
+        return queryset
+
+    def get_serializer_class(self):
+        """Return the serializer for the current action."""
+        if self.action in ('public_decks', 'featured'):
+            return DeckListSerializer
+        if self.action == 'retrieve':
+            return DeckDetailSerializer
+        return self.serializer_class
 
     @extend_schema(
         summary="Listar decks",
@@ -96,7 +167,52 @@ class DeckViewSet(viewsets.ModelViewSet):
         tags=['decks'],
     )
     def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
+        try:
+            # /decks/05/ e /decks/5/ compartilham a mesma entrada
+            pk = int(kwargs[self.lookup_url_kwarg or self.lookup_field])
+        except ValueError:
+            raise NotFound()
+        expand = parse_field_list(request.query_params.get(EXPAND_PARAM))
+
+        def get_entry():
+            instance = self.get_object()
+            version, last_modified = get_deck_content_version(instance)
+            data = self._serialize_shared(instance, fields=(), expand=expand)
+            if 'cards_url' in data:
+                # A entrada não depende do host: a URL absoluta é montada por resposta
+                data['cards_url'] = reverse('flashcards:deck-cards', args=[instance.pk])
+            return {
+                'data': data,
+                'version': version,
+                'last_modified': last_modified,
+            }
+
+        if expand:
+            # Representações expandidas não passam pelo cache
+            entry = get_entry()
+        else:
+            # Apenas decks públicos são compartilhados entre usuários
+            entry = deck_cache.get_or_set(
+                pk,
+                get_entry,
+                should_cache=lambda entry: entry['data']['is_public'],
+            )
+        data = entry['data']
+        requested = parse_field_list(request.query_params.get(FIELDS_PARAM))
+        if requested:
+            data = {name: value for name, value in data.items() if name in requested | expand}
+        if 'cards_url' in data:
+            data = {**data, 'cards_url': request.build_absolute_uri(data['cards_url'])}
+        data = self._overlay_favorites(data)
+        etag = make_etag(
+            entry['version'],
+            data.get('is_favorite'),
+            normalize_query_params(request.query_params),
+        )
+        response = get_not_modified_response(request, etag, entry['last_modified'])
+        if response is None:
+            response = Response(data)
+        return set_validators(response, etag, entry['last_modified'])
 
     @extend_schema(
         summary="Atualizar deck",
@@ -134,12 +250,65 @@ class DeckViewSet(viewsets.ModelViewSet):
         tags=['decks'],
     )
     @action(detail=False, methods=['get'])
-    def recommendations(self, request):
+    async def recommendations(self, request):
         """Return deck recommendations."""
         service = DeckRecommendationService(request.user)
-        recommendations = service.get_recommendations()
-        serializer = self.get_serializer(recommendations, many=True)
-        return Response(serializer.data)
+        recommendations = await service.aget_recommendations()
+
+        # O serializer acessa relações (dono, deck original, favoritos)
+        def serialize():
+            return self.get_serializer(recommendations, many=True).data
+
+        return Response(await sync_to_async(serialize)())
+
+    @extend_schema(
+        summary="Flashcards do deck",
+        description=(
+            "Lista os flashcards de um deck com paginação por cursor. "
+            "Suporta ETag/Last-Modified e os parâmetros fields/expand."
+        ),
+        parameters=[
+            OpenApiParameter(name='cursor', type=str, location=OpenApiParameter.QUERY),
+            OpenApiParameter(
+                name='page_size', type=int, location=OpenApiParameter.QUERY, default=50,
+            ),
+        ],
+        responses={200: FlashcardSerializer(many=True)},
+        tags=['decks'],
+    )
+    @action(detail=True, methods=['get'])
+    def cards(self, request, pk=None):
+        """Return a page of the deck's flashcards."""
+        deck = self.get_object()
+        if not deck.is_public and deck.owner_id != request.user.id:
+            raise NotFound()
+
+        version, last_modified = get_deck_content_version(deck)
+        etag = make_etag(version, normalize_query_params(request.query_params))
+        response = get_not_modified_response(request, etag, last_modified)
+        if response is not None:
+            return response
+
+        paginator = FlashcardCursorPagination()
+        context = self.get_serializer_context()
+        serializer = FlashcardSerializer(context=context)
+        queryset = deck.flashcards.all()
+        columns = serializer.get_only_fields()
+        if columns is not None:
+            only, related = columns
+            if 'deck' in related:
+                # O deck expandido exibe o dono e se é favorito do usuário
+                related.append('deck__owner')
+                context['favorite_ids'] = get_favorite_deck_ids(request.user, [deck.pk])
+            if related:
+                queryset = queryset.select_related(*related)
+            # O cursor da próxima página é lido dos campos de ordenação
+            queryset = queryset.only(*only, *(field.lstrip('-') for field in paginator.ordering))
+        # Sem a view: a ordenação do cursor não segue a ordenação dos decks
+        page = paginator.paginate_queryset(queryset, request)
+        data = FlashcardSerializer(page, many=True, context=context).data
+        response = paginator.get_paginated_response(data)
+        return set_validators(response, etag, last_modified)
 
     @extend_schema(
         summary="Exportar deck",
@@ -158,32 +327,47 @@ class DeckViewSet(viewsets.ModelViewSet):
         tags=['decks'],
     )
     @action(detail=True, methods=['get'])
-    def export(self, request, pk=None):
-        """Export deck."""
-        deck = self.get_object()
+    async def export(self, request, pk=None):
+        """Export deck, streaming the file as its flashcards are read."""
+        deck = await sync_to_async(self.get_object)()
         format = request.query_params.get('format', 'json')
-
-        try:
-            service = DeckExportService(deck)
-            content = service.export(format)
-
-            # Define o tipo de conteúdo e nome do arquivo
-            if format == 'json':
-                content_type = 'application/json'
-                filename = f'{deck.name}.json'
-            else:
-                content_type = 'text/csv'
-                filename = f'{deck.name}.csv'
-
-            response = Response(content, content_type=content_type)
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
-            return response
-        except ValueError as e:
+        if format not in DeckExportService.SUPPORTED_FORMATS:
             return Response(
-                {'detail': str(e)},
+                {'detail': 'Formato não suportado. Use um dos seguintes: '
+                           f'{DeckExportService.SUPPORTED_FORMATS}'},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # Evita gerar o arquivo quando o cliente já tem a versão atual
+        version, last_modified = await aget_deck_content_version(deck)
+        etag = make_etag(version, format)
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        service = DeckExportService(deck)
+        # Sob WSGI a resposta precisa de um iterador síncrono
+        if isinstance(request._request, ASGIRequest):
+            content = service.astream(format)
+        else:
+            content = service.stream(format)
+
+        # Define o tipo de conteúdo e nome do arquivo
+        if format == 'json':
+            content_type = 'application/json'
+            filename = f'{deck.name}.json'
+        else:
+            content_type = 'text/csv'
+            filename = f'{deck.name}.csv'
+
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return set_validators(response, etag, last_modified)
+
+    def perform_content_negotiation(self, request, force=False):
+        """Let ``?format=csv`` select the export format instead of a renderer."""
+        return super().perform_content_negotiation(request, force=force or self.action == 'export')
+
     @extend_schema(
         summary="Importar deck",
         description="Importa um deck de um arquivo JSON ou CSV.",
@@ -237,36 +421,24 @@ class DeckViewSet(viewsets.ModelViewSet):
     @extend_schema(
         summary="Decks públicos",
         description="Lista todos os decks públicos.",
-        responses={200: DeckSerializer(many=True)},
+        responses={200: DeckListSerializer(many=True)},
         tags=['decks'],
     )
     @action(detail=False, methods=['get'])
     def public_decks(self, request):
         """Return public decks."""
-        queryset = self.get_queryset().filter(is_public=True)
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self._catalog_response(settings.CACHE_KEY_PUBLIC_DECKS, is_public=True)
 
     @extend_schema(
         summary="Decks em destaque",
         description="Lista todos os decks em destaque.",
-        responses={200: DeckSerializer(many=True)},
+        responses={200: DeckListSerializer(many=True)},
         tags=['decks'],
     )
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Return featured decks."""
-        queryset = self.get_queryset().filter(is_featured=True)
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self._catalog_response(settings.CACHE_KEY_FEATURED_DECKS, is_featured=True)
 
     @extend_schema(
         summary="Decks arquivados",
@@ -351,6 +523,71 @@ class DeckViewSet(viewsets.ModelViewSet):
         deck.increment_share_count()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    # Cache de respostas
+    #
+    # As respostas das listagens públicas e dos detalhes de decks públicos são
+    # iguais para todos os usuários, exceto por ``is_favorite``. Elas são
+    # armazenadas sem esse campo (serializado como False) e ele é aplicado
+    # após a leitura do cache. A invalidação é feita pelos contadores de versão
+    # incrementados nos sinais de Deck e Flashcard.
+
+    def _serialize_shared(self, instance, many=False, **kwargs):
+        """Serialize decks without user-specific data."""
+        context = self.get_serializer_context()
+        context['favorite_ids'] = frozenset()
+        return self.get_serializer(instance, many=many, context=context, **kwargs).data
+
+    def _catalog_response(self, prefix, **lookup):
+        """Return a cached, paginated listing of the decks matching ``lookup``."""
+        request = self.request
+        cache_key = '|'.join([
+            prefix,
+            request.get_host(),
+            request.path,
+            normalize_query_params(request.query_params),
+        ])
+
+        def get_listing():
+            queryset = self.filter_queryset(self.get_queryset().filter(**lookup))
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                return self.get_paginated_response(
+                    self._serialize_shared(page, many=True),
+                ).data
+            return self._serialize_shared(queryset, many=True)
+
+        data = catalog_cache.get_or_set(cache_key, get_listing)
+        return Response(self._overlay_favorites(data))
+
+    def _overlay_favorites(self, data):
+        """
+        Return a copy of serialized deck data with the current user's ``is_favorite``.
+
+        Cached data is shared between requests, so it is never modified in place.
+        """
+        if isinstance(data, dict) and 'results' in data:
+            items = data['results']
+        elif isinstance(data, list):
+            items = data
+        else:
+            items = [data]
+        if not any('is_favorite' in item for item in items):
+            # Campo não solicitado (?fields=)
+            return data
+        favorite_ids = get_favorite_deck_ids(
+            self.request.user,
+            [item['id'] for item in items],
+        )
+        items = [
+            {**item, 'is_favorite': item['id'] in favorite_ids}
+            for item in items
+        ]
+        if isinstance(data, dict) and 'results' in data:
+            return {**data, 'results': items}
+        if isinstance(data, list):
+            return items
+        return items[0]
+
 
 @extend_schema(tags=['favorites'])
 class DeckFavoriteViewSet(viewsets.ModelViewSet):
@@ -395,14 +632,16 @@ class DeckFavoriteViewSet(viewsets.ModelViewSet):
 
 
 @extend_schema(tags=['flashcards'])
-class FlashcardViewSet(viewsets.ModelViewSet):
+class FlashcardViewSet(AsyncActionsMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """ViewSet for Flashcard model."""
 
     queryset = Flashcard.objects.all()
     serializer_class = FlashcardSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filterset_fields = ['deck']
+    filter_backends = [filters.DjangoFilterBackend, FullTextSearchFilter, OrderingFilter]
+    filterset_class = FlashcardFilter
     search_fields = ['front', 'back', 'example']
+    full_text_search = staticmethod(search_flashcards)
     ordering_fields = ['front', 'created_at', 'updated_at']
     ordering = ['front']
 
@@ -421,6 +660,19 @@ class FlashcardViewSet(viewsets.ModelViewSet):
         queryset = queryset.filter(deck__is_archived=False)
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        """List flashcards, answering 304 when the listing did not change."""
+        # O deck expandido pode mudar sem alterar os flashcards
+        expand = parse_field_list(request.query_params.get(EXPAND_PARAM))
+        related = ('deck',) if 'deck' in expand else ()
+        version, _ = get_content_version(self.filter_queryset(self.get_queryset()), related)
+        # Sem Last-Modified: remoções não alteram a maior data de atualização
+        etag = make_etag(request.user.pk, normalize_query_params(request.query_params), version)
+        response = get_not_modified_response(request, etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        return set_validators(response, etag)
+
     @action(detail=False, methods=['get'])
     def my_flashcards(self, request):
         """Return user's flashcards."""
@@ -469,30 +721,43 @@ class FlashcardViewSet(viewsets.ModelViewSet):
             progress.calculate_next_review(serializer.validated_data['quality'])
             progress.save()
 
+            # Notifica os interessados (ex.: conquistas) após o commit
+            transaction.on_commit(lambda: review_committed.send(
+                sender=FlashcardProgress,
+                user=request.user,
+                progress=progress,
+                quality=serializer.validated_data['quality'],
+                response_time=serializer.validated_data['response_time'],
+            ))
+
             return Response(FlashcardProgressSerializer(progress).data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=False)
-    def due_review(self, request):
+    async def due_review(self, request):
         """
         Retorna os flashcards que precisam ser revisados.
         """
         now = timezone.now()
-        progress = FlashcardProgress.objects.filter(
-            user=request.user,
-            next_review_date__lte=now
-        ).select_related('flashcard')
+        progress = [
+            item async for item in FlashcardProgress.objects.filter(
+                user=request.user,
+                next_review_date__lte=now
+            ).select_related('flashcard')
+        ]
 
         # Se não houver cards para revisar, retorna novos cards
-        if not progress.exists():
+        if not progress:
             reviewed_cards = FlashcardProgress.objects.filter(
                 user=request.user
             ).values_list('flashcard_id', flat=True)
-            
-            new_cards = Flashcard.objects.exclude(
-                id__in=reviewed_cards
-            )[:10]
-            
+
+            new_cards = [
+                card async for card in Flashcard.objects.exclude(
+                    id__in=reviewed_cards
+                )[:10]
+            ]
+
             return Response(FlashcardSerializer(new_cards, many=True).data)
 
         return Response(FlashcardProgressSerializer(progress, many=True).data)
@@ -509,6 +774,93 @@ class FlashcardViewSet(viewsets.ModelViewSet):
         return Response(FlashcardProgressSerializer(progress, many=True).data)
 
 
+@extend_schema(tags=['search'])
+class SearchView(APIView):
+    """Ranked full-text search across decks and flashcards."""
+
+    permission_classes = [permissions.IsAuthenticated]
+    default_limit = 10
+    max_limit = 50
+
+    @extend_schema(
+        summary="Buscar decks e flashcards",
+        description=(
+            "Busca textual ordenada por relevância em decks e flashcards "
+            "visíveis ao usuário."
+        ),
+        parameters=[
+            OpenApiParameter(name='q', type=str, location=OpenApiParameter.QUERY, required=True),
+            OpenApiParameter(
+                name='type',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                enum=['all', 'decks', 'flashcards'],
+                default='all',
+            ),
+            OpenApiParameter(
+                name='language',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                enum=[code for code, _ in LANGUAGE_CHOICES],
+            ),
+            OpenApiParameter(name='limit', type=int, location=OpenApiParameter.QUERY, default=10),
+        ],
+        responses={200: dict},
+    )
+    def get(self, request):
+        """Search decks and flashcards."""
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response(
+                {'detail': _('Informe o termo de busca (q).')},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        search_type = request.query_params.get('type', 'all')
+        language = request.query_params.get('language') or None
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        limit = min(max(limit, 1), self.max_limit)
+
+        results = {'query': query}
+        if search_type in ('all', 'decks'):
+            results['decks'] = self.search_decks(query, language, limit)
+        if search_type in ('all', 'flashcards'):
+            results['flashcards'] = self.search_flashcards(query, language, limit)
+        return Response(results)
+
+    def search_decks(self, query, language, limit):
+        """Return the best ranked decks visible to the user."""
+        queryset = Deck.objects.filter(
+            Q(is_public=True) | Q(owner=self.request.user),
+            is_archived=False,
+        ).select_related('owner', 'parent_deck')
+        if language:
+            queryset = queryset.filter(language=language)
+        decks = list(search_decks(queryset, query, language).order_by('-rank', 'pk')[:limit])
+        context = {
+            'request': self.request,
+            'favorite_ids': get_favorite_deck_ids(self.request.user, [deck.pk for deck in decks]),
+        }
+        data = DeckSerializer(decks, many=True, context=context).data
+        return [{**item, 'rank': deck.rank} for item, deck in zip(data, decks)]
+
+    def search_flashcards(self, query, language, limit):
+        """Return the best ranked flashcards visible to the user."""
+        queryset = Flashcard.objects.filter(
+            Q(deck__is_public=True) | Q(deck__owner=self.request.user),
+            deck__is_archived=False,
+        )
+        if language:
+            queryset = queryset.filter(deck__language=language)
+        flashcards = list(
+            search_flashcards(queryset, query, language).order_by('-rank', 'pk')[:limit],
+        )
+        data = FlashcardSerializer(flashcards, many=True, context={'request': self.request}).data
+        return [{**item, 'rank': flashcard.rank} for item, flashcard in zip(data, flashcards)]
+
+
 class FlashcardProgressViewSet(viewsets.ModelViewSet):
     serializer_class = FlashcardProgressSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -522,4 +874,78 @@ class FlashcardProgressViewSet(viewsets.ModelViewSet):
         return FlashcardProgress.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user) 
\ No newline at end of file
+        serializer.save(user=self.request.user)
+
+
+class AutocompleteView(APIView):
+    """Typo-tolerant suggestions for deck names, tags and flashcard fronts."""
+
+    permission_classes = [permissions.IsAuthenticated]
+    default_limit = 5
+    max_limit = 20
+
+    @extend_schema(
+        summary="Autocompletar busca",
+        description=(
+            "Sugestões tolerantes a erros de digitação (similaridade de trigramas) "
+            "para nomes de decks, tags e frente dos flashcards."
+        ),
+        parameters=[
+            OpenApiParameter(name='q', type=str, location=OpenApiParameter.QUERY, required=True),
+            OpenApiParameter(
+                name='type',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                enum=['all', 'decks', 'tags', 'flashcards'],
+                default='all',
+            ),
+            OpenApiParameter(name='limit', type=int, location=OpenApiParameter.QUERY, default=5),
+        ],
+        responses={200: dict},
+    )
+    def get(self, request):
+        """Return the best matching suggestions."""
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response(
+                {'detail': _('Informe o termo de busca (q).')},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        suggestion_type = request.query_params.get('type', 'all')
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        limit = min(max(limit, 1), self.max_limit)
+
+        visible_decks = Deck.objects.filter(
+            Q(is_public=True) | Q(owner=request.user),
+            is_archived=False,
+        )
+        results = {'query': query}
+        if suggestion_type in ('all', 'decks'):
+            results['decks'] = [
+                {'id': deck.pk, 'name': deck.name, 'similarity': deck.similarity}
+                for deck in autocomplete_decks(visible_decks.only('id', 'name'), query, limit)
+            ]
+        if suggestion_type in ('all', 'tags'):
+            # Tags sugeridas vêm apenas de decks públicos
+            public_decks = Deck.objects.filter(is_public=True, is_archived=False)
+            results['tags'] = [
+                {'tag': tag, 'similarity': similarity}
+                for tag, similarity in autocomplete_tags(public_decks, query, limit)
+            ]
+        if suggestion_type in ('all', 'flashcards'):
+            flashcards = Flashcard.objects.filter(
+                deck__in=visible_decks,
+            ).only('id', 'deck_id', 'front')
+            results['flashcards'] = [
+                {
+                    'id': flashcard.pk,
+                    'deck': flashcard.deck_id,
+                    'front': flashcard.front,
+                    'similarity': flashcard.similarity,
+                }
+                for flashcard in autocomplete_flashcards(flashcards, query, limit)
+            ]
+        return Response(results)
@@ -0,0 +1,231 @@
+"""Leaderboards backed by Redis sorted sets."""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.utils import timezone
+from redis.exceptions import RedisError
+
+from core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+METRICS = ['experience', 'streak', 'points']
+SCOPES = ['global', 'language', 'weekly']
+
+# Campo de origem de cada métrica, usado na reconciliação com o banco
+METRIC_FIELDS = {
+    'experience': 'experience',
+    'streak': 'progress__longest_streak',
+    'points': 'total_points',
+}
+
+KEY_PREFIX = 'leaderboard'
+WEEKLY_TTL = 60 * 60 * 24 * 14
+REBUILD_CHUNK_SIZE = 5000
+
+
+class LeaderboardService:
+    """
+    Service for leaderboard queries and updates.
+
+    Scores live in Redis sorted sets (one per metric and scope), so top-N and
+    rank lookups are O(log n). Without Redis the service falls back to
+    ordering the database, which is only meant for development and tests.
+    """
+
+    def __init__(self, client=None):
+        """Initialize service."""
+        self.client = client if client is not None else get_redis_client()
+
+    @staticmethod
+    def get_week():
+        """Return the current ISO week identifier (e.g. 2024-W13)."""
+        year, week, _ = timezone.now().isocalendar()
+        return f'{year}-W{week:02d}'
+
+    def get_key(self, metric: str, scope: str = 'global', language: Optional[str] = None) -> str:
+        """Return the sorted set key of a leaderboard."""
+        if scope == 'language':
+            return f'{KEY_PREFIX}:{metric}:lang:{language}'
+        if scope == 'weekly':
+            return f'{KEY_PREFIX}:{metric}:week:{self.get_week()}'
+        return f'{KEY_PREFIX}:{metric}:global'
+
+    # Atualizações
+
+    def increment(self, user_id: int, language: str, metric: str, amount: int) -> None:
+        """Increment the score of a user in the global, language and weekly boards."""
+        if self.client is None or not amount:
+            return
+        weekly_key = self.get_key(metric, 'weekly')
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zincrby(self.get_key(metric), amount, user_id)
+        pipe.zincrby(self.get_key(metric, 'language', language), amount, user_id)
+        pipe.zincrby(weekly_key, amount, user_id)
+        pipe.expire(weekly_key, WEEKLY_TTL)
+        try:
+            pipe.execute()
+        except RedisError as e:
+            # O placar é derivado e corrigido pela reconciliação periódica
+            logger.warning(f'Leaderboard update failed: {str(e)}')
+
+    def set_score(self, user_id: int, language: str, metric: str, score: int) -> None:
+        """
+        Set the absolute score of a user in the global, language and weekly boards.
+
+        The weekly board ranks the users whose score was set during the week.
+        """
+        if self.client is None:
+            return
+        weekly_key = self.get_key(metric, 'weekly')
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zadd(self.get_key(metric), {user_id: score})
+        pipe.zadd(self.get_key(metric, 'language', language), {user_id: score})
+        pipe.zadd(weekly_key, {user_id: score})
+        pipe.expire(weekly_key, WEEKLY_TTL)
+        try:
+            pipe.execute()
+        except RedisError as e:
+            logger.warning(f'Leaderboard update failed: {str(e)}')
+
+    def move_language(self, user_id: int, old_language: str, new_language: str) -> None:
+        """Move a user between the language boards of every metric."""
+        if self.client is None or old_language == new_language:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for metric in METRICS:
+                pipe.zscore(self.get_key(metric), user_id)
+            scores = pipe.execute()
+            for metric, score in zip(METRICS, scores):
+                pipe.zrem(self.get_key(metric, 'language', old_language), user_id)
+                if score is not None:
+                    pipe.zadd(self.get_key(metric, 'language', new_language), {user_id: score})
+            pipe.execute()
+        except RedisError as e:
+            logger.warning(f'Leaderboard update failed: {str(e)}')
+
+    def rebuild(self, metric: str) -> int:
+        """
+        Rebuild the global and language boards of ``metric`` from the database.
+
+        Boards are written to temporary keys and swapped in atomically. Weekly
+        boards are not rebuilt, since the database keeps no history per week.
+        Returns the number of users written.
+        """
+        if self.client is None:
+            return 0
+        field = METRIC_FIELDS[metric]
+        suffix = ':rebuild'
+        written_keys = set()
+        total = 0
+        pipe = self.client.pipeline(transaction=False)
+        for key in self.client.scan_iter(match=f'{KEY_PREFIX}:{metric}:*{suffix}'):
+            pipe.delete(key)
+        rows = User.objects.filter(is_active=True).values_list('id', 'language', field)
+        for user_id, language, score in rows.iterator(chunk_size=REBUILD_CHUNK_SIZE):
+            score = score or 0
+            global_key = self.get_key(metric) + suffix
+            language_key = self.get_key(metric, 'language', language) + suffix
+            pipe.zadd(global_key, {user_id: score})
+            pipe.zadd(language_key, {user_id: score})
+            written_keys.update([global_key, language_key])
+            total += 1
+            if total % REBUILD_CHUNK_SIZE == 0:
+                pipe.execute()
+        pipe.execute()
+
+        pipe = self.client.pipeline(transaction=True)
+        for key in self.client.scan_iter(match=f'{KEY_PREFIX}:{metric}:*'):
+            key = key.decode() if isinstance(key, bytes) else key
+            stale = ':week:' not in key and not key.endswith(suffix)
+            if stale and key + suffix not in written_keys:
+                pipe.delete(key)
+        for key in written_keys:
+            pipe.rename(key, key[:-len(suffix)])
+        pipe.execute()
+        return total
+
+    # Consultas
+
+    def top(
+        self, metric: str, scope: str = 'global', language: Optional[str] = None, limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Return the ``limit`` best ranked users of a leaderboard."""
+        if self.client is None:
+            return self._db_range(metric, scope, language, 0, limit)
+        entries = self.client.zrevrange(
+            self.get_key(metric, scope, language), 0, limit - 1, withscores=True,
+        )
+        return self._hydrate(entries, 0)
+
+    def around(
+        self, user, metric: str, scope: str = 'global', language: Optional[str] = None, k: int = 5,
+    ) -> Dict[str, Any]:
+        """Return the rank of ``user`` and the ``k`` users above and below them."""
+        if self.client is None:
+            return self._db_around(user, metric, scope, language, k)
+        key = self.get_key(metric, scope, language)
+        rank = self.client.zrevrank(key, user.pk)
+        if rank is None:
+            return {'rank': None, 'score': None, 'results': []}
+        start = max(rank - k, 0)
+        entries = self.client.zrevrange(key, start, rank + k, withscores=True)
+        results = self._hydrate(entries, start)
+        return {
+            'rank': rank + 1,
+            'score': results[rank - start]['score'],
+            'results': results,
+        }
+
+    def _hydrate(self, entries, start: int) -> List[Dict[str, Any]]:
+        """Attach usernames to (member, score) pairs with a single query."""
+        user_ids = [int(member) for member, _ in entries]
+        usernames = dict(User.objects.filter(pk__in=user_ids).values_list('id', 'username'))
+        return [
+            {
+                'rank': start + position + 1,
+                'user_id': user_id,
+                'username': usernames.get(user_id),
+                'score': int(score),
+            }
+            for position, (user_id, (_, score)) in enumerate(zip(user_ids, entries))
+        ]
+
+    def _db_queryset(self, metric: str, scope: str, language: Optional[str]):
+        """Return the fallback database queryset of a leaderboard."""
+        # Sem Redis não há histórico semanal: o placar semanal usa o total
+        queryset = User.objects.filter(is_active=True).annotate(score=F(METRIC_FIELDS[metric]))
+        if scope == 'language':
+            queryset = queryset.filter(language=language)
+        return queryset.order_by('-score', '-id')
+
+    def _db_range(self, metric, scope, language, start, stop) -> List[Dict[str, Any]]:
+        rows = self._db_queryset(metric, scope, language).values_list('id', 'username', 'score')
+        return [
+            {
+                'rank': start + position + 1,
+                'user_id': user_id,
+                'username': username,
+                'score': score or 0,
+            }
+            for position, (user_id, username, score) in enumerate(rows[start:stop])
+        ]
+
+    def _db_around(self, user, metric, scope, language, k) -> Dict[str, Any]:
+        ids = list(self._db_queryset(metric, scope, language).values_list('id', flat=True))
+        if user.pk not in ids:
+            return {'rank': None, 'score': None, 'results': []}
+        rank = ids.index(user.pk)
+        start = max(rank - k, 0)
+        results = self._db_range(metric, scope, language, start, rank + k + 1)
+        return {
+            'rank': rank + 1,
+            'score': results[rank - start]['score'],
+            'results': results,
+        }
@@ -0,0 +1,33 @@
+"""Rebuild the leaderboards from the database."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.progress.leaderboards import METRICS, LeaderboardService
+
+
+class Command(BaseCommand):
+    """
+    Reconcile the Redis leaderboards with the database.
+
+    Incremental updates keep the boards current; run this periodically
+    (e.g. hourly via cron) to repair drift from failed updates, profile
+    language changes or edits made outside the application.
+    """
+
+    help = 'Reconstrói os placares (leaderboards) a partir do banco de dados.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--metric',
+            choices=METRICS,
+            action='append',
+            help='Métrica a reconstruir (padrão: todas).',
+        )
+
+    def handle(self, *args, **options):
+        service = LeaderboardService()
+        if service.client is None:
+            raise CommandError('O cache padrão não usa Redis; não há placares a reconstruir.')
+        for metric in options['metric'] or METRICS:
+            total = service.rebuild(metric)
+            self.stdout.write(self.style.SUCCESS(f'{metric}: {total} usuários'))
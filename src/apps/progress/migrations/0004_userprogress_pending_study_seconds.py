@@ -0,0 +1,22 @@
+# Generated by Django 5.0.2 on 2026-10-19 16:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("progress", "0003_alter_userprogress_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userprogress",
+            name="pending_study_seconds",
+            field=models.FloatField(
+                default=0,
+                help_text="Segundos de revisão ainda não somados ao tempo gasto",
+                verbose_name="segundos de estudo pendentes",
+            ),
+        ),
+    ]
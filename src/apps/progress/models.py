@@ -55,6 +55,11 @@ class UserProgress(models.Model):
         help_text=_('Tempo total gasto estudando em minutos'),
         default=0,
     )
+    pending_study_seconds = models.FloatField(
+        _('segundos de estudo pendentes'),
+        help_text=_('Segundos de revisão ainda não somados ao tempo gasto'),
+        default=0,
+    )
     last_study_date = models.DateTimeField(
         _('última data de estudo'),
         null=True,
@@ -84,6 +89,7 @@ class UserProgress(models.Model):
         """Update user streak."""
         from django.utils import timezone
         from datetime import timedelta
+        from .signals import streak_updated
 
         now = timezone.now()
         if self.last_study_date:
@@ -96,14 +102,105 @@ class UserProgress(models.Model):
                 if self.current_streak > self.longest_streak:
                     self.longest_streak = self.current_streak
         self.last_study_date = now
+        self.save(update_fields=[
+            'current_streak', 'longest_streak', 'last_study_date', 'updated_at',
+        ])
+        streak_updated.send(sender=self.__class__, user=self.user, progress=self)
+
+    def set_level(self, level):
+        """Update the current level, notifying listeners when it changes."""
+        from .signals import level_changed
+
+        if level == self.current_level:
+            return
+        self.current_level = level
         self.save()
+        level_changed.send(sender=self.__class__, user=self.user, progress=self)
+
+    def add_time_spent(self, minutes):
+        """Add study time (in minutes) to the user progress."""
+        from .signals import time_spent_updated
+
+        if minutes <= 0:
+            return
+        self.time_spent += minutes
+        self.save()
+        time_spent_updated.send(sender=self.__class__, user=self.user, progress=self)
 
     def update_stats(self, correct_attempts=0, incorrect_attempts=0, response_time=0):
-        """Update user statistics."""
+        """Update user statistics, notifying listeners when they change."""
+        from .signals import stats_updated
+
         total_attempts = correct_attempts + incorrect_attempts
         if total_attempts > 0:
             self.accuracy_rate = (correct_attempts / total_attempts) * 100
             self.average_response_time = response_time
             self.total_cards = total_attempts
             self.mastered_cards = correct_attempts
-            self.save() 
\ No newline at end of file
+            self.save()
+            stats_updated.send(sender=self.__class__, user=self.user, progress=self)
+
+    def refresh_stats(self):
+        """Recompute the statistics from the user's flashcard progress."""
+        from django.db.models import Avg, Count, Q
+        from apps.flashcards.models import FlashcardProgress
+
+        stats = FlashcardProgress.objects.filter(user_id=self.user_id).aggregate(
+            avg_response_time=Avg('average_response_time'),
+            total_correct=Count('id', filter=Q(correct_attempts__gt=0)),
+            total_incorrect=Count('id', filter=Q(incorrect_attempts__gt=0)),
+        )
+        self.update_stats(
+            correct_attempts=stats['total_correct'],
+            incorrect_attempts=stats['total_incorrect'],
+            response_time=stats['avg_response_time'] or 0,
+        )
+
+    def record_review(self, flashcard_progress, quality, response_time):
+        """
+        Record a committed flashcard review.
+
+        The counters are updated in the database from the review's own outcome,
+        counting cards as ``refresh_stats`` does: a card is added once on its
+        first correct answer and once on its first incorrect one. The response
+        time (in seconds) is added to the time spent; seconds short of a whole
+        minute carry over to the next review.
+        """
+        from django.db.models import F
+        from django.utils import timezone
+        from .signals import stats_updated, time_spent_updated
+
+        if quality >= 3:
+            new_cards = mastered = int(flashcard_progress.correct_attempts == 1)
+        else:
+            new_cards, mastered = int(flashcard_progress.incorrect_attempts == 1), 0
+
+        manager = type(self)._default_manager.filter(pk=self.pk)
+        updates = {
+            'pending_study_seconds': F('pending_study_seconds') + response_time,
+            'updated_at': timezone.now(),
+        }
+        if new_cards:
+            updates.update(
+                total_cards=F('total_cards') + new_cards,
+                mastered_cards=F('mastered_cards') + mastered,
+                accuracy_rate=(
+                    (F('mastered_cards') + mastered) * 100.0 / (F('total_cards') + new_cards)
+                ),
+            )
+        manager.update(**updates)
+        self.refresh_from_db()
+
+        minutes = int(self.pending_study_seconds // 60)
+        if minutes:
+            manager.update(
+                time_spent=F('time_spent') + minutes,
+                pending_study_seconds=F('pending_study_seconds') - minutes * 60,
+            )
+            self.time_spent += minutes
+            self.pending_study_seconds -= minutes * 60
+
+        if new_cards:
+            stats_updated.send(sender=self.__class__, user=self.user, progress=self)
+        if minutes:
+            time_spent_updated.send(sender=self.__class__, user=self.user, progress=self)
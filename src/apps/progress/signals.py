@@ -1,13 +1,29 @@
 """Signals for progress app."""
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.dispatch import Signal, receiver
+from django.utils import timezone
 
+from apps.flashcards.signals import review_committed
+from apps.users.signals import experience_gained, user_changed
+
+from .leaderboards import LeaderboardService
 from .models import UserProgress
 
 User = get_user_model()
 
+# Eventos de domínio do progresso do usuário.
+# Argumentos: user, progress
+streak_updated = Signal()
+level_changed = Signal()
+time_spent_updated = Signal()
+stats_updated = Signal()
+
+# Campos do usuário que afetam o progresso
+PROGRESS_RELATED_FIELDS = {'level', 'experience', 'streak'}
+
 
 @receiver(post_save, sender=User)
 def create_user_progress(sender, instance, created, **kwargs):
@@ -16,8 +32,44 @@ def create_user_progress(sender, instance, created, **kwargs):
         UserProgress.objects.create(user=instance)
 
 
-@receiver(post_save, sender=User)
-def save_user_progress(sender, instance, **kwargs):
-    """Save UserProgress instance when user is updated."""
-    if hasattr(instance, 'progress'):
-        instance.progress.save() 
\ No newline at end of file
+@receiver(user_changed)
+def touch_user_progress(sender, user, changed_fields, **kwargs):
+    """Touch UserProgress only when a progress related field changed."""
+    if changed_fields is not None and not PROGRESS_RELATED_FIELDS & changed_fields.keys():
+        return
+    UserProgress.objects.filter(user=user).update(updated_at=timezone.now())
+
+
+@receiver(review_committed)
+def grant_review_experience(sender, user, quality, **kwargs):
+    """Grant experience for a correctly answered review."""
+    if quality >= 3:
+        user.add_experience(settings.REVIEW_EXPERIENCE)
+
+
+@receiver(review_committed)
+def record_review(sender, user, progress, quality, response_time, **kwargs):
+    """Update the user progress and streak with a committed review."""
+    user_progress = UserProgress.objects.get_or_create(user=user)[0]
+    user_progress.record_review(progress, quality, response_time)
+    user_progress.update_streak()
+
+
+@receiver(user_changed)
+def move_language_leaderboards(sender, user, changed_fields, **kwargs):
+    """Move the user to the leaderboards of their new language."""
+    if not changed_fields or 'language' not in changed_fields:
+        return
+    LeaderboardService().move_language(user.pk, changed_fields['language'], user.language)
+
+
+@receiver(experience_gained)
+def update_experience_leaderboards(sender, user, amount, **kwargs):
+    """Add the gained experience to the leaderboards."""
+    LeaderboardService().increment(user.pk, user.language, 'experience', amount)
+
+
+@receiver(streak_updated)
+def update_streak_leaderboards(sender, user, progress, **kwargs):
+    """Store the longest streak in the leaderboards."""
+    LeaderboardService().set_score(user.pk, user.language, 'streak', progress.longest_streak)
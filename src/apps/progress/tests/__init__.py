@@ -0,0 +1 @@
+"""Tests package for progress app."""
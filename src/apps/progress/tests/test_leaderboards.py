@@ -0,0 +1,146 @@
+"""Tests for leaderboards."""
+
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.flashcards.models import Deck, Flashcard
+
+from ..leaderboards import LeaderboardService
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+User = get_user_model()
+
+
+class LeaderboardTestMixin:
+    """Create users with different scores."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.users = []
+        for index, (experience, language) in enumerate([(50, 'en'), (300, 'es'), (120, 'en')]):
+            user = User.objects.create_user(
+                username=f'user{index}',
+                email=f'user{index}@example.com',
+                password='testpass123',
+                language=language,
+            )
+            user.add_experience(experience)
+            self.users.append(user)
+
+
+class LeaderboardViewTests(LeaderboardTestMixin, TestCase):
+    """Test the leaderboard endpoints (database fallback)."""
+
+    def setUp(self):
+        """Set up test data."""
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.users[0])
+
+    def test_global_leaderboard(self):
+        """Test the global experience leaderboard."""
+        res = self.client.get(reverse('progress-leaderboard'), {'limit': 2})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['username'] for row in res.data['results']], ['user1', 'user2'])
+        self.assertEqual(res.data['results'][0]['rank'], 1)
+        self.assertEqual(res.data['results'][0]['score'], 300)
+
+    def test_language_leaderboard(self):
+        """Test the leaderboard restricted to the user's language."""
+        res = self.client.get(reverse('progress-leaderboard'), {'scope': 'language'})
+
+        self.assertEqual([row['username'] for row in res.data['results']], ['user2', 'user0'])
+
+    def test_my_rank(self):
+        """Test the rank of the current user with neighbours."""
+        res = self.client.get(reverse('progress-my-rank'), {'k': 1})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['rank'], 3)
+        self.assertEqual(res.data['score'], 50)
+        self.assertEqual([row['username'] for row in res.data['results']], ['user2', 'user0'])
+
+    def test_invalid_metric(self):
+        """Test that unknown metrics are rejected."""
+        res = self.client.get(reverse('progress-leaderboard'), {'metric': 'invalid'})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(REVIEW_EXPERIENCE=300)
+    def test_review_grants_experience(self):
+        """Test that correct reviews feed the experience leaderboard."""
+        deck = Deck.objects.create(
+            name='Test Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=self.users[0],
+        )
+        flashcard = Flashcard.objects.create(deck=deck, front='Front', back='Back')
+        url = reverse('flashcards:flashcard-review', args=[flashcard.id])
+        for quality in (2, 5):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(url, {'quality': quality, 'response_time': 2.0})
+
+        res = self.client.get(reverse('progress-my-rank'), {'k': 0})
+        self.assertEqual(res.data['rank'], 1)
+        self.assertEqual(res.data['score'], 350)
+
+
+@skipUnless(fakeredis, 'fakeredis não está instalado')
+class LeaderboardServiceRedisTests(LeaderboardTestMixin, TestCase):
+    """Test the sorted set leaderboards."""
+
+    def setUp(self):
+        """Set up test data."""
+        super().setUp()
+        self.service = LeaderboardService(client=fakeredis.FakeRedis())
+        self.service.rebuild('experience')
+
+    def test_top(self):
+        """Test the top-N query."""
+        top = self.service.top('experience', limit=2)
+        self.assertEqual([row['username'] for row in top], ['user1', 'user2'])
+        self.assertEqual([row['score'] for row in top], [300, 120])
+
+    def test_around(self):
+        """Test the rank query with neighbours."""
+        data = self.service.around(self.users[2], 'experience', k=1)
+        self.assertEqual(data['rank'], 2)
+        self.assertEqual([row['rank'] for row in data['results']], [1, 2, 3])
+
+    def test_increment(self):
+        """Test incremental updates on the global, language and weekly boards."""
+        self.service.increment(self.users[0].pk, 'en', 'experience', 500)
+
+        self.assertEqual(self.service.top('experience', limit=1)[0]['username'], 'user0')
+        self.assertEqual(
+            self.service.top('experience', 'language', 'en', limit=1)[0]['score'], 550,
+        )
+        self.assertEqual(self.service.top('experience', 'weekly', limit=1)[0]['score'], 500)
+
+    def test_set_score_weekly(self):
+        """Test absolute scores are also written to the weekly board."""
+        self.service.set_score(self.users[0].pk, 'en', 'streak', 7)
+
+        self.assertEqual(self.service.top('streak', 'weekly', limit=1)[0]['score'], 7)
+        weekly_key = self.service.get_key('streak', 'weekly')
+        self.assertGreater(self.service.client.ttl(weekly_key), 0)
+
+    def test_move_language(self):
+        """Test moving a user between language boards."""
+        self.service.move_language(self.users[1].pk, 'es', 'en')
+
+        self.assertEqual(self.service.top('experience', 'language', 'es'), [])
+        self.assertEqual(
+            self.service.top('experience', 'language', 'en', limit=1)[0]['username'], 'user1',
+        )
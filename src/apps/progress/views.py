@@ -1,9 +1,9 @@
-from rest_framework import viewsets, permissions
+from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Avg, Count
 from django.utils import timezone
 
+from .leaderboards import METRICS, SCOPES, LeaderboardService
 from .models import UserProgress
 from .serializers import UserProgressSerializer
 from apps.flashcards.models import FlashcardProgress
@@ -29,21 +29,8 @@ class UserProgressViewSet(viewsets.ReadOnlyModelViewSet):
         progress = UserProgress.objects.get_or_create(user=request.user)[0]
         flashcard_progress = FlashcardProgress.objects.filter(user=request.user)
 
-        # Calcula estatísticas dos flashcards
-        stats = flashcard_progress.aggregate(
-            total_reviews=Count('id'),
-            avg_response_time=Avg('average_response_time'),
-            total_correct=Count('id', filter={'correct_attempts__gt': 0}),
-            total_incorrect=Count('id', filter={'incorrect_attempts__gt': 0})
-        )
-
         # Atualiza o progresso do usuário
-        if stats['total_reviews'] > 0:
-            progress.update_stats(
-                correct_attempts=stats['total_correct'],
-                incorrect_attempts=stats['total_incorrect'],
-                response_time=stats['avg_response_time'] or 0
-            )
+        progress.refresh_stats()
 
         # Atualiza o streak
         progress.update_streak()
@@ -64,6 +51,53 @@ class UserProgressViewSet(viewsets.ReadOnlyModelViewSet):
             'level_distribution': self._get_level_distribution(flashcard_progress)
         })
 
+    @action(detail=False)
+    def leaderboard(self, request):
+        """
+        Retorna os primeiros colocados de um placar.
+
+        Parâmetros: ``metric`` (experience, streak, points), ``scope`` (global,
+        language, weekly), ``language`` (padrão: idioma do usuário) e ``limit``.
+        """
+        params = self._get_leaderboard_params(request)
+        if isinstance(params, Response):
+            return params
+        metric, scope, language = params
+        limit = self._get_int_param(request, 'limit', default=10, maximum=100)
+        results = LeaderboardService().top(metric, scope, language, limit=limit)
+        return Response({'metric': metric, 'scope': scope, 'results': results})
+
+    @action(detail=False, url_path='leaderboard/me')
+    def my_rank(self, request):
+        """
+        Retorna a posição do usuário e os ``k`` vizinhos acima e abaixo dele.
+        """
+        params = self._get_leaderboard_params(request)
+        if isinstance(params, Response):
+            return params
+        metric, scope, language = params
+        k = self._get_int_param(request, 'k', default=5, maximum=50)
+        data = LeaderboardService().around(request.user, metric, scope, language, k=k)
+        return Response({'metric': metric, 'scope': scope, **data})
+
+    def _get_leaderboard_params(self, request):
+        metric = request.query_params.get('metric', 'experience')
+        scope = request.query_params.get('scope', 'global')
+        if metric not in METRICS or scope not in SCOPES:
+            return Response(
+                {'detail': f'Use metric em {METRICS} e scope em {SCOPES}.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        language = request.query_params.get('language', request.user.language)
+        return metric, scope, language
+
+    def _get_int_param(self, request, name, default, maximum):
+        try:
+            value = int(request.query_params.get(name, default))
+        except ValueError:
+            value = default
+        return min(max(value, 1), maximum)
+
     def _get_level_distribution(self, flashcard_progress):
         """
         Calcula a distribuição de níveis dos flashcards do usuário.
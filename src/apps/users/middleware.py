@@ -0,0 +1,37 @@
+"""Middleware for users app."""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+
+class LastActivityMiddleware:
+    """
+    Record the activity of authenticated users.
+
+    Runs after the view so that users authenticated by DRF (e.g. JWT) are
+    seen; the write itself is coalesced by ``User.touch_activity``.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        self.record_activity(request)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        await sync_to_async(self.record_activity)(request)
+        return response
+
+    def record_activity(self, request):
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            user.touch_activity()
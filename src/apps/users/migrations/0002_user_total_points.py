@@ -0,0 +1,38 @@
+# Generated by Django 5.0.2 on 2026-10-19 14:07
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_total_points(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    Achievement = apps.get_model("achievements", "Achievement")
+    points = (
+        Achievement.objects.filter(user=OuterRef("pk"))
+        .values("user")
+        .annotate(total=Sum("points"))
+        .values("total")
+    )
+    User.objects.update(total_points=Coalesce(Subquery(points), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+        ("achievements", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="total_points",
+            field=models.IntegerField(
+                default=0,
+                help_text="Soma dos pontos das conquistas do usuário.",
+                verbose_name="pontos totais",
+            ),
+        ),
+        migrations.RunPython(backfill_total_points, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.2 on 2026-10-19 14:09
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_user_total_points"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="last_activity",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, verbose_name="última atividade"
+            ),
+        ),
+    ]
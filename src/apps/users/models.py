@@ -1,7 +1,11 @@
 """Models for users app."""
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.db import models
+from django.db.models import F
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -55,9 +59,14 @@ class User(AbstractUser):
         _('sequência'),
         default=0,
     )
+    total_points = models.IntegerField(
+        _('pontos totais'),
+        default=0,
+        help_text=_('Soma dos pontos das conquistas do usuário.'),
+    )
     last_activity = models.DateTimeField(
         _('última atividade'),
-        auto_now=True,
+        default=timezone.now,
     )
     is_premium = models.BooleanField(
         _('é premium'),
@@ -74,6 +83,63 @@ class User(AbstractUser):
         """Return string representation."""
         return self.get_full_name() or self.username
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Keep a snapshot of the loaded values to detect changed fields."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def get_changed_fields(self):
+        """
+        Return the fields changed since the user was loaded or last saved.
+
+        Maps each changed field (attname) to its previous value. Returns None
+        when no snapshot is available (e.g. instances built in memory).
+        """
+        loaded_values = getattr(self, '_loaded_values', None)
+        if loaded_values is None:
+            return None
+        return {
+            name: value
+            for name, value in loaded_values.items()
+            if name in self.__dict__ and getattr(self, name) != value
+        }
+
+    def _mark_persisted(self, *field_names):
+        """Update the snapshot of fields written to the database."""
+        loaded_values = getattr(self, '_loaded_values', None)
+        if loaded_values is None:
+            loaded_values = self._loaded_values = {}
+        for field in self._meta.concrete_fields:
+            if field.attname in self.__dict__ and (
+                not field_names or field.name in field_names or field.attname in field_names
+            ):
+                loaded_values[field.attname] = getattr(self, field.attname)
+
+    def save(self, *args, **kwargs):
+        """
+        Save the user, notifying ``user_changed`` listeners of changed fields.
+
+        Listeners receive only the fields that actually changed, so related rows
+        are not touched by saves that do not affect them (e.g. last_login).
+        """
+        from .signals import user_changed
+
+        adding = self._state.adding
+        changed_fields = self.get_changed_fields()
+        update_fields = kwargs.get('update_fields')
+        if changed_fields is not None and update_fields is not None:
+            changed_fields = {
+                name: value for name, value in changed_fields.items()
+                if name in update_fields or self._meta.get_field(name).name in update_fields
+            }
+        super().save(*args, **kwargs)
+        self._mark_persisted(*(update_fields or ()))
+
+        if not adding and changed_fields != {}:
+            user_changed.send(sender=self.__class__, user=self, changed_fields=changed_fields)
+
     def get_avatar_url(self):
         """Return avatar URL."""
         if self.avatar:
@@ -81,6 +147,37 @@ class User(AbstractUser):
         return None
 
     def add_experience(self, amount):
-        """Add experience points to user."""
+        """
+        Add experience points to user.
+
+        The increment is applied atomically in the database without rewriting
+        the rest of the row; the in-memory value is updated alongside it.
+        """
+        from .signals import experience_gained
+
+        type(self)._default_manager.filter(pk=self.pk).update(
+            experience=F('experience') + amount,
+        )
         self.experience += amount
-        self.save() 
\ No newline at end of file
+        self._mark_persisted('experience')
+        experience_gained.send(sender=self.__class__, user=self, amount=amount)
+
+    def touch_activity(self):
+        """
+        Record user activity.
+
+        Writes ``last_activity`` at most once per ``USER_ACTIVITY_UPDATE_INTERVAL``
+        seconds per user: skipped when the loaded value is recent enough, and
+        guarded by a cache key across processes. Returns whether it was written.
+        """
+        interval = getattr(settings, 'USER_ACTIVITY_UPDATE_INTERVAL', 5 * 60)
+        now = timezone.now()
+        # O usuário é carregado do banco a cada requisição: vale mesmo sem cache compartilhado
+        if self.last_activity and (now - self.last_activity).total_seconds() < interval:
+            return False
+        if not cache.add(f'user_activity_{self.pk}', 1, timeout=interval):
+            return False
+        type(self)._default_manager.filter(pk=self.pk).update(last_activity=now)
+        self.last_activity = now
+        self._mark_persisted('last_activity')
+        return True
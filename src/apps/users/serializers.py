@@ -38,6 +38,7 @@ class UserSerializer(serializers.ModelSerializer):
             'level',
             'experience',
             'streak',
+            'total_points',
             'last_activity',
             'is_premium',
             'date_joined',
@@ -47,6 +48,7 @@ class UserSerializer(serializers.ModelSerializer):
             'level',
             'experience',
             'streak',
+            'total_points',
             'last_activity',
             'is_premium',
             'date_joined',
@@ -100,6 +102,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             'level',
             'experience',
             'streak',
+            'total_points',
             'last_activity',
             'is_premium',
             'date_joined',
@@ -109,6 +112,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             'level',
             'experience',
             'streak',
+            'total_points',
             'last_activity',
             'is_premium',
             'date_joined',
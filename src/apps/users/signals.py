@@ -2,10 +2,18 @@
 
 from django.contrib.auth import get_user_model
 from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.dispatch import Signal, receiver
 
 User = get_user_model()
 
+# Enviado quando o usuário ganha pontos de experiência.
+# Argumentos: user, amount
+experience_gained = Signal()
+
+# Enviado quando um usuário existente é salvo com campos alterados.
+# Argumentos: user, changed_fields (campo -> valor anterior, ou None se desconhecido)
+user_changed = Signal()
+
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
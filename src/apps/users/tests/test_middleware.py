@@ -0,0 +1,46 @@
+"""Tests for users middleware."""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+User = get_user_model()
+
+
+@override_settings(
+    USER_ACTIVITY_UPDATE_INTERVAL=60,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+)
+class LastActivityMiddlewareTests(TestCase):
+    """Test the activity of authenticated users is recorded."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        an_hour_ago = timezone.now() - timedelta(hours=1)
+        User.objects.filter(pk=self.user.pk).update(last_activity=an_hour_ago)
+        self.client = APIClient()
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_activity_written_once_per_interval(self):
+        """Test JWT requests record the activity once, even without a shared cache."""
+        url = reverse('user-me')
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertGreater(self.user.last_activity, timezone.now() - timedelta(minutes=1))
+
+        # Mesma requisição: apenas a consulta do usuário autenticado, sem UPDATE
+        with self.assertNumQueries(1):
+            self.client.get(url)
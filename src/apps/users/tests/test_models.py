@@ -1,7 +1,11 @@
 """Tests for users models."""
 
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
 User = get_user_model()
 
@@ -54,4 +58,87 @@ class UserModelTests(TestCase):
         initial_exp = self.user.experience
         exp_to_add = 100
         self.user.add_experience(exp_to_add)
-        self.assertEqual(self.user.experience, initial_exp + exp_to_add) 
\ No newline at end of file
+        self.assertEqual(self.user.experience, initial_exp + exp_to_add)
+
+    def test_user_add_experience_is_atomic(self):
+        """Test that add_experience issues a single targeted UPDATE."""
+        stale = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(1):
+            self.user.add_experience(10)
+        stale.add_experience(5)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.experience, 15)
+        self.assertTrue(self.user.check_password(self.user_data['password']))
+
+    @override_settings(
+        USER_ACTIVITY_UPDATE_INTERVAL=60,
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    )
+    def test_user_touch_activity_is_coalesced(self):
+        """Test that last_activity is written at most once per interval."""
+        cache.delete(f'user_activity_{self.user.pk}')
+        self.user.last_activity = timezone.now() - timedelta(hours=1)
+        stale = User.objects.get(pk=self.user.pk)
+        stale.last_activity = self.user.last_activity
+
+        self.assertTrue(self.user.touch_activity())
+        with self.assertNumQueries(0):
+            self.assertFalse(self.user.touch_activity())
+            # Outro processo com o valor antigo carregado: barrado pela chave no cache
+            self.assertFalse(stale.touch_activity())
+
+    @override_settings(
+        USER_ACTIVITY_UPDATE_INTERVAL=60,
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+    )
+    def test_user_touch_activity_skips_recent_write_without_cache(self):
+        """Test that a recently written last_activity is not rewritten, whatever the cache."""
+        an_hour_ago = timezone.now() - timedelta(hours=1)
+        User.objects.filter(pk=self.user.pk).update(last_activity=an_hour_ago)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.touch_activity())
+
+        reloaded = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertFalse(reloaded.touch_activity())
+
+
+class UserChangeTrackingTests(TestCase):
+    """Test cases for the User changed fields tracking."""
+
+    def setUp(self):
+        """Set up test data."""
+        User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.user = User.objects.get(username='testuser')
+
+    def test_get_changed_fields(self):
+        """Test that only modified fields are reported."""
+        self.assertEqual(self.user.get_changed_fields(), {})
+
+        self.user.bio = 'Nova biografia'
+        self.assertEqual(self.user.get_changed_fields(), {'bio': ''})
+
+        self.user.save()
+        self.assertEqual(self.user.get_changed_fields(), {})
+
+    def test_last_login_save_does_not_touch_progress(self):
+        """Test that saving unrelated fields costs a single UPDATE."""
+        from django.contrib.auth.models import update_last_login
+
+        with self.assertNumQueries(1):
+            update_last_login(None, self.user)
+
+    def test_related_field_change_touches_progress(self):
+        """Test that progress related fields touch UserProgress."""
+        progress_updated_at = self.user.progress.updated_at
+
+        self.user.streak = 3
+        self.user.save(update_fields=['streak'])
+
+        self.user.progress.refresh_from_db()
+        self.assertGreater(self.user.progress.updated_at, progress_updated_at)
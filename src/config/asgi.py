@@ -2,6 +2,9 @@
 ASGI config for fala-facil-api project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Served by gunicorn with uvicorn workers when ``SERVER_INTERFACE=asgi`` (see
+``config/gunicorn.py``); async views then wait for the database and Redis
+without holding a thread.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
@@ -14,3 +17,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_asgi_application()
+
+# O event loop do servidor dura o processo todo: clientes Redis asyncio podem ser reutilizados
+from core.redis import enable_async_clients  # noqa: E402
+
+enable_async_clients()
@@ -0,0 +1,51 @@
+"""
+Gunicorn configuration.
+
+Workers write their Prometheus metrics to ``PROMETHEUS_MULTIPROC_DIR`` so that
+``/metrics`` reports the sum of every worker, whichever one is scraped. The
+directory is emptied when the server starts and the files of dead workers are
+marked as such.
+
+``SERVER_INTERFACE`` selects the application: ``wsgi`` (default) runs
+``config.wsgi`` on threaded workers; ``asgi`` runs ``config.asgi`` on uvicorn
+workers, where async views (health checks, due reviews, recommendations,
+exports) serve many concurrent requests per worker.
+
+Usage: ``gunicorn -c config/gunicorn.py`` (from ``src/``)
+"""
+
+import os
+import shutil
+import tempfile
+
+# Precisa estar definido antes de o prometheus_client ser importado pelos workers
+os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR',
+    os.path.join(tempfile.gettempdir(), 'fala_facil_metrics'),
+)
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('GUNICORN_WORKERS', 4))
+
+if os.getenv('SERVER_INTERFACE', 'wsgi') == 'asgi':
+    wsgi_app = 'config.asgi:application'
+    worker_class = 'config.uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'config.wsgi:application'
+    threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+
+def on_starting(server):
+    """Discard the metrics left by a previous run."""
+    path = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Stop reporting the live gauges of a worker that exited."""
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
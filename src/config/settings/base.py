@@ -49,13 +49,17 @@ LOCAL_APPS = [
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
+    'core.metrics.MetricsMiddleware',
+    'core.querylog.QueryLogMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.profiling.ProfilingMiddleware',
+    'apps.users.middleware.LastActivityMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -79,6 +83,9 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
+ASGI_APPLICATION = 'config.asgi.application'
+# Interface servida pelo gunicorn (wsgi ou asgi), a mesma lida por config/gunicorn.py
+SERVER_INTERFACE = os.getenv('SERVER_INTERFACE', 'wsgi')
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
@@ -90,6 +97,13 @@ DATABASES = {
     }
 }
 
+# Tempo (s) de reuso das conexões com o PostgreSQL. Sob ASGI cada requisição roda em uma
+# thread nova e não reaproveita conexões persistentes: o padrão é 0 e o pool fica no pgbouncer
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE', 0 if SERVER_INTERFACE == 'asgi' else 600))
+# Modo do pgbouncer entre a aplicação e o PostgreSQL ('', 'session' ou 'transaction');
+# em 'transaction' os cursores do lado do servidor (QuerySet.iterator()) são desativados
+DATABASE_POOL_MODE = os.getenv('DATABASE_POOL_MODE', '')
+
 # Cache
 CACHES = {
     'default': {
@@ -98,6 +112,25 @@ CACHES = {
     }
 }
 
+# Cache time to live is 15 minutes
+CACHE_TTL = int(os.getenv('CACHE_TTL', 60 * 15))
+
+# Cache keys
+CACHE_KEY_FEATURED_DECKS = 'featured_decks'
+CACHE_KEY_PUBLIC_DECKS = 'public_decks'
+CACHE_KEY_DECK_DETAIL = 'deck_detail_{}'
+
+# Segundos durante os quais o resultado de /readyz é reutilizado
+HEALTH_CHECK_CACHE_TTL = float(os.getenv('HEALTH_CHECK_CACHE_TTL', 2))
+
+# Perfis de requisições (cabeçalho X-Profile): validade do token e do resultado
+PROFILING_TOKEN_MAX_AGE = int(os.getenv('PROFILING_TOKEN_MAX_AGE', 60 * 60))
+PROFILING_RESULT_TTL = int(os.getenv('PROFILING_RESULT_TTL', 60 * 60))
+
+# Log de consultas (core.querylog): consultas lentas e repetidas numa requisição
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', 100))
+QUERY_REPEAT_THRESHOLD = int(os.getenv('QUERY_REPEAT_THRESHOLD', 10))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -147,6 +180,12 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Custom user model
 AUTH_USER_MODEL = 'users.User'
 
+# Intervalo mínimo (em segundos) entre gravações de last_activity por usuário
+USER_ACTIVITY_UPDATE_INTERVAL = int(os.getenv('USER_ACTIVITY_UPDATE_INTERVAL', 5 * 60))
+
+# Experiência ganha por revisão de flashcard respondida corretamente (qualidade >= 3)
+REVIEW_EXPERIENCE = int(os.getenv('REVIEW_EXPERIENCE', 10))
+
 # REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
@@ -180,10 +219,14 @@ REST_FRAMEWORK = {
         'rest_framework.renderers.MultiPartRenderer',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
-    'JSON_ENCODER': 'core.utils.CustomJSONEncoder'
+    'DEFAULT_PARSER_CLASSES': [
+        'core.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 # CORS
@@ -244,6 +287,11 @@ LOGGING = {
             "level": "ERROR",
             "propagate": False,
         },
+        "core.querylog": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "drf_spectacular": {
             "handlers": ["console"],
             "level": "DEBUG",
@@ -303,4 +351,7 @@ SPECTACULAR_SETTINGS = {
         'hideDownloadButton': False,
         'hideHostname': False,
     }
-} 
\ No newline at end of file
+}
+
+# Schema OpenAPI pré-renderizado (manage.py generate_schema), servido em /api/schema/
+OPENAPI_SCHEMA_FILE = os.getenv('OPENAPI_SCHEMA_FILE', str(BASE_DIR / 'openapi.json'))
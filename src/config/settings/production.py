@@ -98,7 +98,11 @@ DATABASE_URL = os.environ.get('DATABASE_URL')
 # Configuração do banco de dados com fallback mais robusto
 if DATABASE_URL:
     DATABASES = {
-        'default': dj_database_url.config(conn_max_age=600)
+        'default': dj_database_url.config(
+            conn_max_age=DB_CONN_MAX_AGE,
+            conn_health_checks=True,
+            disable_server_side_cursors=DATABASE_POOL_MODE == 'transaction',
+        )
     }
     # Garantir que o ENGINE está definido
     if 'ENGINE' not in DATABASES['default']:
@@ -107,6 +111,9 @@ if DATABASE_URL:
         print(f"DATABASE_URL: {DATABASE_URL}", file=sys.stderr)
         # Fallback para PostgreSQL
         DATABASES['default']['ENGINE'] = 'django.db.backends.postgresql'
+    # Mede o tempo de abertura das conexões (inclui a espera pelo pgbouncer)
+    if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+        DATABASES['default']['ENGINE'] = 'core.backends.postgresql'
 else:
     # Fallback para SQLite se DATABASE_URL não estiver definido
     DATABASES = {
@@ -24,6 +24,8 @@ from drf_spectacular.views import (
     SpectacularRedocView,
     SpectacularSwaggerView,
 )
+from core.health import livez, readyz
+from core.metrics import metrics
 from core.utils import CustomSchemaAPIView
 
 
@@ -42,6 +44,9 @@ api_v1_patterns = [
 
 urlpatterns = [
     path('', redirect_to_docs),
+    path('livez', livez, name='livez'),
+    path('readyz', readyz, name='readyz'),
+    path('metrics', metrics, name='metrics'),
     path('admin/', admin.site.urls),
     path('accounts/login/', auth_views.LoginView.as_view(template_name='admin/login.html'), name='login'),
     path('api/v1/', include(api_v1_patterns)),
@@ -0,0 +1,14 @@
+"""
+Uvicorn worker for gunicorn.
+
+Django does not implement the ASGI lifespan protocol; turning it off avoids
+the startup probe and its log line in every worker.
+"""
+
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """Uvicorn worker without lifespan events."""
+
+    CONFIG_KWARGS = {**BaseUvicornWorker.CONFIG_KWARGS, 'lifespan': 'off'}
@@ -0,0 +1,14 @@
+"""Configuration for core app."""
+
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """Configuration class for core app."""
+
+    name = 'core'
+    verbose_name = 'Core'
+
+    def ready(self):
+        """Register the system checks."""
+        import core.checks  # noqa
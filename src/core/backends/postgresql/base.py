@@ -0,0 +1,15 @@
+"""
+PostgreSQL backend observing the time taken to open connections.
+
+Without persistent connections (``CONN_MAX_AGE=0``, the default under ASGI)
+every request opens one; behind pgbouncer the time includes the wait for a
+free client slot. Exported as ``db_connect_duration_seconds``.
+"""
+
+from django.db.backends.postgresql import base
+
+from core.db import ConnectTimingMixin
+
+
+class DatabaseWrapper(ConnectTimingMixin, base.DatabaseWrapper):
+    """PostgreSQL database wrapper with connection timing."""
@@ -0,0 +1,292 @@
+"""
+Cache helpers.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from redis.exceptions import RedisError
+
+from . import metrics, singleflight
+from .redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = 'version'
+
+# Canal Redis usado para propagar invalidações entre workers e nós
+INVALIDATION_CHANNEL = 'cache:invalidate'
+INVALIDATION_RECONNECT_DELAY = 5
+
+_missing = object()
+
+
+def _version_key(name: str) -> str:
+    return f'{VERSION_KEY_PREFIX}:{name}'
+
+
+def get_version(name: str) -> int:
+    """Return the current value of the shared version counter ``name``."""
+    version = cache.get(_version_key(name))
+    if version is None:
+        cache.add(_version_key(name), 1, timeout=None)
+        version = cache.get(_version_key(name)) or 1
+    return version
+
+
+def bump_version(name: str) -> int:
+    """Invalidate everything cached under the version counter ``name``."""
+    try:
+        return cache.incr(_version_key(name))
+    except ValueError:
+        cache.set(_version_key(name), 2, timeout=None)
+        return 2
+
+
+def normalize_query_params(query_params) -> str:
+    """
+    Return a canonical string for a QueryDict.
+
+    Keys and repeated values are sorted and empty values dropped, so equivalent
+    requests share the same cache key.
+    """
+    items = sorted(
+        (key, value)
+        for key in query_params
+        for value in query_params.getlist(key)
+        if value != ''
+    )
+    return urlencode(items)
+
+
+def make_versioned_key(prefix: str, version: int, *parts: str) -> str:
+    """Build a cache key from a prefix, a version and hashed extra parts."""
+    key = f'{prefix}:v{version}'
+    if parts:
+        key = f"{key}:{hashlib.md5('|'.join(parts).encode()).hexdigest()}"
+    return key
+
+
+class TwoTierCache:
+    """
+    Bounded in-process LRU cache in front of the Django (Redis) cache.
+
+    Reads are served from the local tier while fresh, falling back to the shared
+    tier and finally to the ``default`` callable, which runs in a single worker
+    at a time (see :mod:`core.singleflight`). Invalidations are applied to
+    both tiers and broadcast over Redis pub/sub, so every worker drops its local
+    copy. Broadcasts are best effort: ``local_timeout`` bounds how long a worker
+    that missed one may serve a stale value.
+
+    Local values are shared between requests and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        local_timeout: float = 30,
+        timeout: Optional[int] = 60 * 15,
+        stale_timeout: Optional[int] = None,
+    ):
+        """Initialize cache."""
+        self.name = name
+        self.maxsize = maxsize
+        self.local_timeout = local_timeout
+        self.timeout = timeout
+        self.stale_timeout = stale_timeout
+        self._data = OrderedDict()
+        self._generation = None
+        self._lock = threading.Lock()
+        _listener.register(self)
+
+    def _get_generation(self) -> int:
+        """Return the shared generation, cached locally like any other entry."""
+        generation = self._generation
+        if generation is not None and generation[0] > time.monotonic():
+            return generation[1]
+        value = get_version(self.name)
+        self._generation = (time.monotonic() + self.local_timeout, value)
+        return value
+
+    def _shared_key(self, key: str) -> str:
+        return make_versioned_key(self.name, self._get_generation(), key)
+
+    def _get_local(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _missing
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return _missing
+            self._data.move_to_end(key)
+            return value
+
+    def _set_local(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.local_timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` when missing."""
+        key = str(key)
+        _listener.ensure_started()
+        value = self._get_local(key)
+        if value is not _missing:
+            metrics.record_cache(self.name, 'hit_local')
+            return value
+
+        value = cache.get(self._shared_key(key), _missing)
+        if value is _missing:
+            metrics.record_cache(self.name, 'miss')
+            return default
+        metrics.record_cache(self.name, 'hit_shared')
+        self._set_local(key, value)
+        return value
+
+    def set(self, key: Hashable, value: Any, timeout: Optional[int] = None) -> None:
+        """Store ``value`` in both tiers."""
+        key = str(key)
+        cache.set(self._shared_key(key), value, timeout or self.timeout)
+        self._set_local(key, value)
+
+    def get_or_set(
+        self,
+        key: Hashable,
+        default: Callable[[], Any],
+        timeout: Optional[int] = None,
+        should_cache: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached value for ``key``, computing it with ``default`` on a miss.
+
+        Values for which ``should_cache`` returns False are returned but not stored.
+        """
+        key = str(key)
+        _listener.ensure_started()
+        value = self._get_local(key)
+        if value is not _missing:
+            metrics.record_cache(self.name, 'hit_local')
+            return value
+
+        computed = False
+
+        def compute():
+            nonlocal computed
+            computed = True
+            return default()
+
+        value = singleflight.load(
+            self._shared_key(key),
+            compute,
+            timeout or self.timeout,
+            name=self.name,
+            stale_timeout=self.stale_timeout,
+            should_cache=should_cache,
+        )
+        metrics.record_cache(self.name, 'miss' if computed else 'hit_shared')
+        if should_cache is None or should_cache(value):
+            self._set_local(key, value)
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        """Remove ``key`` from both tiers in every process."""
+        key = str(key)
+        shared_key = self._shared_key(key)
+        cache.delete_many([shared_key, f'{shared_key}{singleflight.STALE_SUFFIX}'])
+        self.evict_local(key)
+        _listener.publish(self.name, key)
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers in every process."""
+        bump_version(self.name)
+        self.evict_local()
+        _listener.publish(self.name, None)
+
+    def evict_local(self, key: Optional[str] = None) -> None:
+        """Drop ``key`` (or everything when None) from the local tier only."""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+                self._generation = None
+            else:
+                self._data.pop(key, None)
+
+
+class _InvalidationListener:
+    """Subscribes to the invalidation channel and evicts local entries."""
+
+    def __init__(self):
+        self._caches = {}
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def register(self, two_tier_cache: TwoTierCache) -> None:
+        self._caches[two_tier_cache.name] = two_tier_cache
+
+    def ensure_started(self) -> None:
+        """Start the listener thread once per process (and again after a fork)."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            client = get_redis_client()
+            if client is None:
+                return
+            thread = threading.Thread(
+                target=self._listen,
+                args=(client,),
+                name='cache-invalidation',
+                daemon=True,
+            )
+            thread.start()
+
+    def publish(self, name: str, key: Optional[str]) -> None:
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            client.publish(INVALIDATION_CHANNEL, json.dumps({'cache': name, 'key': key}))
+        except RedisError as e:
+            logger.warning(f'Cache invalidation broadcast failed: {str(e)}')
+
+    def handle(self, data) -> None:
+        try:
+            message = json.loads(data)
+            two_tier_cache = self._caches.get(message['cache'])
+        except (TypeError, ValueError, KeyError):
+            return
+        if two_tier_cache is not None:
+            two_tier_cache.evict_local(message.get('key'))
+
+    def _listen(self, client) -> None:
+        while True:
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Invalidações podem ter sido perdidas enquanto desconectado
+                for two_tier_cache in list(self._caches.values()):
+                    two_tier_cache.evict_local()
+                for message in pubsub.listen():
+                    if message.get('type') == 'message':
+                        self.handle(message['data'])
+            except RedisError as e:
+                logger.warning(f'Cache invalidation listener disconnected: {str(e)}')
+                time.sleep(INVALIDATION_RECONNECT_DELAY)
+
+
+_listener = _InvalidationListener()
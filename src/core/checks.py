@@ -0,0 +1,64 @@
+"""
+System checks for the database connection settings.
+
+Validates ``CONN_MAX_AGE``, ``CONN_HEALTH_CHECKS`` and
+``DISABLE_SERVER_SIDE_CURSORS`` against the server interface and the
+pgbouncer pool mode (``SERVER_INTERFACE`` and ``DATABASE_POOL_MODE``).
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Warning, register
+
+POOL_MODES = ('', 'session', 'transaction')
+
+
+@register()
+def check_database_connections(app_configs, **kwargs):
+    """Check persistent connections and server-side cursors fit the deployment."""
+    return get_connection_errors(
+        settings.DATABASES,
+        getattr(settings, 'DATABASE_POOL_MODE', ''),
+        getattr(settings, 'SERVER_INTERFACE', 'wsgi'),
+    )
+
+
+def get_connection_errors(databases, pool_mode, server_interface):
+    """Return the problems of the ``databases`` setting for this deployment."""
+    errors = []
+    if pool_mode not in POOL_MODES:
+        errors.append(Error(
+            f'DATABASE_POOL_MODE must be one of {POOL_MODES}, not {pool_mode!r}.',
+            id='core.E001',
+        ))
+
+    for alias, config in databases.items():
+        persistent = config.get('CONN_MAX_AGE', 0) != 0
+        if persistent and not config.get('CONN_HEALTH_CHECKS'):
+            errors.append(Warning(
+                f"Database '{alias}' keeps persistent connections without CONN_HEALTH_CHECKS.",
+                hint='A connection closed by the server or the pooler fails the next request; '
+                     'set CONN_HEALTH_CHECKS to True.',
+                id='core.W001',
+            ))
+        if persistent and server_interface == 'asgi':
+            errors.append(Warning(
+                f"Database '{alias}' keeps persistent connections under ASGI.",
+                hint='Each ASGI request runs in a new thread, so its connection is never reused; '
+                     'set DB_CONN_MAX_AGE=0 and pool the connections with pgbouncer.',
+                id='core.W002',
+            ))
+        # DATABASE_POOL_MODE descreve a conexão padrão (DATABASE_URL)
+        if (
+            alias == 'default'
+            and pool_mode == 'transaction'
+            and config.get('ENGINE', '').endswith('postgresql')
+            and not config.get('DISABLE_SERVER_SIDE_CURSORS')
+        ):
+            errors.append(Error(
+                f"Database '{alias}' uses server-side cursors behind a transaction-mode pooler.",
+                hint='QuerySet.iterator() keeps a cursor across transactions, which pgbouncer '
+                     'does not support in transaction mode; '
+                     'set DISABLE_SERVER_SIDE_CURSORS to True.',
+                id='core.E002',
+            ))
+    return errors
@@ -0,0 +1,46 @@
+"""
+HTTP conditional request helpers (ETag / Last-Modified).
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def make_etag(*parts) -> str:
+    """Return a strong ETag built from the string form of ``parts``."""
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def set_validators(response, etag: str, last_modified: Optional[datetime] = None):
+    """
+    Add ETag and Last-Modified headers to ``response``.
+
+    Responses are marked private and must be revalidated, so clients always
+    ask again but usually get an empty 304.
+    """
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def get_not_modified_response(request, etag: str, last_modified: Optional[datetime] = None):
+    """
+    Return a 304 (or 412) response when the request's validators match, else None.
+
+    Only safe methods are evaluated; If-None-Match takes precedence over
+    If-Modified-Since as in Django's ``condition`` decorator.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
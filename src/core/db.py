@@ -0,0 +1,145 @@
+"""
+Database helpers.
+
+Execute wrappers that follow the request, not the thread
+---------------------------------------------------------
+
+Django keeps one connection per thread and ``connection.execute_wrapper()``
+only applies to the connection of the calling thread. Under ASGI, the queries
+of an async view run in a worker thread (``sync_to_async``), so wrappers
+installed by a middleware on the event loop thread would never see them.
+
+:func:`execute_wrapper` stores the wrappers in a context variable instead;
+``sync_to_async`` copies the context into the worker thread, where a
+dispatcher installed on every connection applies them.
+
+Chunked reads without server-side cursors
+-----------------------------------------
+
+On PostgreSQL ``QuerySet.iterator()`` keeps a server-side cursor open until
+the last row is read, which transaction-mode poolers (pgbouncer) do not
+support; with ``DISABLE_SERVER_SIDE_CURSORS`` it reads every row at once.
+:func:`iterate_in_chunks` runs one short query per chunk instead, continuing
+after the last row read (keyset pagination).
+
+Connection time
+---------------
+
+:class:`ConnectTimingMixin` records how long opening a connection takes (see
+``core.backends.postgresql``).
+"""
+
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.models import Q
+
+_wrappers: ContextVar[tuple] = ContextVar('db_execute_wrappers', default=())
+
+
+def _dispatch(execute, sql, params, many, context):
+    """Run the query through the wrappers of the current context."""
+    wrappers = _wrappers.get()
+    # Como no Django, o primeiro wrapper registrado é o mais externo
+    for wrapper in reversed(wrappers):
+        execute = functools.partial(wrapper, execute)
+    return execute(sql, params, many, context)
+
+
+def install(connection) -> None:
+    """Add the dispatcher to ``connection`` once."""
+    if _dispatch not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_dispatch)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    install(connection)
+
+
+connection_created.connect(_on_connection_created, dispatch_uid='core.db.install')
+
+
+@contextmanager
+def execute_wrapper(wrapper):
+    """
+    Apply ``wrapper`` to the queries run in the current context.
+
+    Accepts the same callables as ``connection.execute_wrapper()``; queries
+    run by ``sync_to_async`` code called from this context are included.
+    """
+    # Conexões abertas antes da importação deste módulo
+    for connection in connections.all(initialized_only=True):
+        install(connection)
+    token = _wrappers.set(_wrappers.get() + (wrapper,))
+    try:
+        yield
+    finally:
+        _wrappers.reset(token)
+
+
+def _keyset(queryset):
+    """Return ``queryset`` ordered by its ordering plus the pk, and that ordering."""
+    ordering = list(queryset.query.order_by)
+    if not ordering:
+        raise ValueError('iterate_in_chunks() needs a queryset ordered with order_by().')
+    if 'pk' not in ordering and '-pk' not in ordering:
+        ordering.append('pk')
+    return queryset.order_by(*ordering), ordering
+
+
+def _after(ordering, obj) -> Q:
+    """Return the filter selecting the rows after ``obj`` in ``ordering``."""
+    condition = Q()
+    equal = {}
+    for field in ordering:
+        name = field.lstrip('-')
+        value = getattr(obj, name)
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        condition |= Q(**equal, **{f'{name}__{lookup}': value})
+        equal[name] = value
+    return condition
+
+
+def iterate_in_chunks(queryset, chunk_size):
+    """
+    Yield the objects of ``queryset`` reading ``chunk_size`` rows per query.
+
+    The queryset must be ordered with ``order_by()`` on non-null fields of
+    the model itself; the pk is added to break ties.
+    """
+    queryset, ordering = _keyset(queryset)
+    chunk = list(queryset[:chunk_size])
+    while chunk:
+        yield from chunk
+        if len(chunk) < chunk_size:
+            return
+        chunk = list(queryset.filter(_after(ordering, chunk[-1]))[:chunk_size])
+
+
+async def aiterate_in_chunks(queryset, chunk_size):
+    """Async version of :func:`iterate_in_chunks`."""
+    queryset, ordering = _keyset(queryset)
+    chunk = [obj async for obj in queryset[:chunk_size]]
+    while chunk:
+        for obj in chunk:
+            yield obj
+        if len(chunk) < chunk_size:
+            return
+        chunk = [obj async for obj in queryset.filter(_after(ordering, chunk[-1]))[:chunk_size]]
+
+
+class ConnectTimingMixin:
+    """Database wrapper mixin observing the time taken to open each connection."""
+
+    def get_new_connection(self, conn_params):
+        # Importação tardia: core.metrics importa este módulo
+        from . import metrics
+
+        started = time.perf_counter()
+        connection = super().get_new_connection(conn_params)
+        metrics.record_db_connect(self.alias, time.perf_counter() - started)
+        return connection
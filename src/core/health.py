@@ -1,47 +1,151 @@
 """
-Health check endpoint.
+Health check endpoints.
+
+``/livez`` answers without any I/O: it only shows the process is serving
+requests. ``/readyz`` checks the database and the cache, reusing their pooled
+connections, and keeps the result for ``HEALTH_CHECK_CACHE_TTL`` seconds so
+frequent probes from every replica do not reach the dependencies each time.
+
+The views are plain async Django views, skipping DRF authentication and
+throttling. Under ASGI the checks run concurrently and Redis is pinged with
+the asyncio client, so probes hold no thread while waiting.
 """
 
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
-from django.db import connections
-from django.db.utils import OperationalError
-from redis import Redis
-from django.conf import settings
+import asyncio
 import logging
+import time
+import weakref
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+
+from .redis import get_async_redis_client, get_redis_client
 
 logger = logging.getLogger(__name__)
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
-def health_check(request):
+_result = None
+_locks = weakref.WeakKeyDictionary()
+
+
+def check_database():
+    """Run a trivial query on the default database."""
+    with connections['default'].cursor() as cursor:
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+
+
+def check_cache():
+    """Ping Redis through the cache's connection pool."""
+    client = get_redis_client()
+    if client is not None:
+        client.ping()
+    else:
+        # Cache sem Redis (desenvolvimento e testes)
+        cache.get('health:ping')
+
+
+async def acheck_cache():
+    """Ping Redis with the asyncio client, falling back to :func:`check_cache`."""
+    client = get_async_redis_client()
+    if client is not None:
+        await client.ping()
+    else:
+        await sync_to_async(check_cache)()
+
+
+# Verificações síncronas rodam numa thread; as assíncronas no próprio event loop
+CHECKS = {
+    'database': check_database,
+    'cache': acheck_cache,
+}
+
+
+async def run_check(name, check):
+    """Run a single check, returning ``{'ok', 'duration_ms'}``."""
+    started = time.perf_counter()
+    try:
+        if iscoroutinefunction(check):
+            await check()
+        else:
+            await sync_to_async(check)()
+        ok = True
+    except Exception as e:
+        ok = False
+        logger.error(f'{name} health check failed: {str(e)}')
+    return {
+        'ok': ok,
+        'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
+async def run_checks():
+    """Run every dependency check concurrently, returning ``(ready, results)``."""
+    outcomes = await asyncio.gather(*(run_check(name, check) for name, check in CHECKS.items()))
+    results = dict(zip(CHECKS, outcomes))
+    return all(result['ok'] for result in results.values()), results
+
+
+async def get_readiness():
+    """Return ``(ready, results, cached)``, reusing a recent result."""
+    global _result
+    ttl = getattr(settings, 'HEALTH_CHECK_CACHE_TTL', 2)
+    result = _result
+    if result is not None and result[0] > time.monotonic():
+        return result[1], result[2], True
+    lock = _locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+    async with lock:
+        # Outra requisição pode ter refeito as verificações enquanto esperávamos
+        result = _result
+        if result is not None and result[0] > time.monotonic():
+            return result[1], result[2], True
+        ready, results = await run_checks()
+        _result = (time.monotonic() + ttl, ready, results)
+    return ready, results, False
+
+
+def reset_readiness():
+    """Discard the cached readiness result."""
+    global _result
+    _result = None
+
+
+@never_cache
+@require_GET
+async def livez(request):
+    """Liveness probe: the process is up and serving requests."""
+    return JsonResponse({'status': 'alive'})
+
+
+@never_cache
+@require_GET
+async def readyz(request):
+    """Readiness probe: the database and the cache are reachable."""
+    ready, results, cached = await get_readiness()
+    return JsonResponse(
+        {'status': 'ready' if ready else 'unavailable', 'checks': results, 'cached': cached},
+        status=200 if ready else 503,
+    )
+
+
+@never_cache
+@require_GET
+async def health_check(request):
     """
     Check the health of the application.
+
+    Kept for existing probes; uses the same cached checks as ``/readyz``.
     """
+    ready, results, cached = await get_readiness()
     health_status = {
-        'status': 'healthy',
-        'database': True,
-        'cache': True,
+        'status': 'healthy' if ready else 'unhealthy',
+        'database': results['database']['ok'],
+        'cache': results['cache']['ok'],
+        'checks': results,
+        'cached': cached,
     }
-
-    # Check database connection
-    try:
-        db_conn = connections['default']
-        db_conn.cursor()
-    except OperationalError:
-        health_status['database'] = False
-        health_status['status'] = 'unhealthy'
-        logger.error('Database health check failed')
-
-    # Check Redis connection
-    try:
-        redis_client = Redis.from_url(settings.CACHES['default']['LOCATION'])
-        redis_client.ping()
-    except Exception as e:
-        health_status['cache'] = False
-        health_status['status'] = 'unhealthy'
-        logger.error(f'Redis health check failed: {str(e)}')
-
-    status_code = 200 if health_status['status'] == 'healthy' else 503
-    return Response(health_status, status=status_code) 
\ No newline at end of file
+    return JsonResponse(health_status, status=200 if ready else 503)
@@ -0,0 +1,31 @@
+"""Render the OpenAPI schema to a static artifact."""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.schema import get_schema_path, write_schema
+
+
+class Command(BaseCommand):
+    """
+    Write the OpenAPI schema served by ``/api/schema/``.
+
+    Run once per deploy, after the code is in place; running processes keep
+    the schema they loaded until restarted.
+    """
+
+    help = 'Gera o schema OpenAPI e o grava no arquivo servido por /api/schema/.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            help='Arquivo de destino (padrão: settings.OPENAPI_SCHEMA_FILE).',
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['output']) if options['output'] else get_schema_path()
+        if path is None:
+            raise CommandError('Informe --output ou defina OPENAPI_SCHEMA_FILE.')
+        content = write_schema(path)
+        self.stdout.write(self.style.SUCCESS(f'{path}: {len(content)} bytes'))
@@ -0,0 +1,95 @@
+"""Populate the database with synthetic data for scale testing."""
+
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.seeding import SCALES, make_plan, seed
+
+
+class Command(BaseCommand):
+    """
+    Generate users, decks, flashcards and study activity at production scale.
+
+    Deck popularity and user activity are skewed like real traffic, and the
+    data depends only on ``--seed`` and the sizes, so runs are reproducible.
+    Rows are appended after the existing ones; use a disposable database.
+    On PostgreSQL chunks are loaded with ``COPY`` by ``--workers`` processes.
+    """
+
+    help = 'Gera dados sintéticos (usuários, decks, flashcards e progresso) para testes de escala.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale',
+            choices=SCALES,
+            default='small',
+            help='Volume pré-definido (padrão: small).',
+        )
+        parser.add_argument('--seed', type=int, default=20240601, help='Semente dos geradores.')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Processos de escrita em paralelo (apenas PostgreSQL).',
+        )
+        for name in ('users', 'decks', 'flashcards', 'progress'):
+            parser.add_argument(
+                f'--{name}',
+                type=int,
+                help=f'Substitui o número de {name} do volume escolhido.',
+            )
+        parser.add_argument(
+            '--favorites',
+            type=float,
+            default=5,
+            help='Média de decks favoritos por usuário.',
+        )
+        parser.add_argument(
+            '--achievements',
+            type=float,
+            default=3,
+            help='Média de conquistas por usuário.',
+        )
+        parser.add_argument(
+            '--password',
+            default='seed-password',
+            help='Senha de todos os usuários gerados.',
+        )
+        parser.add_argument(
+            '--yes',
+            action='store_true',
+            help='Não pede confirmação com DEBUG=False.',
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['yes']:
+            raise CommandError('DEBUG=False: confirme com --yes que o banco não é o de produção.')
+        sizes = {name: options[name] if options[name] is not None else value
+                 for name, value in SCALES[options['scale']].items()}
+        if min(sizes.values()) < 0 or not sizes['users'] or not sizes['decks']:
+            raise CommandError('São necessários ao menos um usuário e um deck.')
+
+        self.verbosity = options['verbosity']
+        started = time.monotonic()
+        plan = make_plan(
+            options['seed'],
+            favorites=options['favorites'],
+            achievements=options['achievements'],
+            password=options['password'],
+            **sizes,
+        )
+        totals = seed(plan, workers=max(1, options['workers']), progress=self.report)
+        for stage, rows in totals.items():
+            self.stdout.write(self.style.SUCCESS(f'{stage}: {rows} linhas'))
+        self.stdout.write(self.style.SUCCESS(
+            f'{sum(totals.values())} linhas em {time.monotonic() - started:.1f}s. '
+            f'Usuários: {plan.user_start}..{plan.user_start + plan.users - 1}; '
+            'execute rebuild_leaderboards para atualizar os placares.'
+        ))
+
+    def report(self, stage, done, total):
+        if self.verbosity > 1 or done == total:
+            self.stdout.write(f'{stage}: {done}/{total} blocos')
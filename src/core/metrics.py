@@ -0,0 +1,236 @@
+"""
+Prometheus metrics.
+
+Exposes request latency per view, responses by status, database queries and
+time per request and per query fingerprint, time to open database
+connections, cache hits and misses per cache, single-flight coalescing and
+review throughput at ``/metrics``. ``prometheus_client`` is optional: without
+it the helpers are no-ops and the endpoint answers 404.
+
+Under gunicorn every worker has its own registry; with
+``PROMETHEUS_MULTIPROC_DIR`` set (see ``config/gunicorn.py``) the values are
+written to that directory and aggregated across workers when scraped.
+"""
+
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import Http404, HttpResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+
+from .db import execute_wrapper
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:
+    prometheus_client = None
+
+# Visões sem rota resolvida (404, redirecionamentos do CommonMiddleware)
+UNRESOLVED_VIEW = '<unresolved>'
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 0.75, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+QUERY_DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+CONNECT_DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+SINGLE_FLIGHT_WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5)
+
+if prometheus_client is not None:
+    REQUEST_LATENCY = prometheus_client.Histogram(
+        'http_request_latency_seconds',
+        'Time spent handling a request, by view and method.',
+        ['view', 'method'],
+        buckets=LATENCY_BUCKETS,
+    )
+    RESPONSES_BY_STATUS = prometheus_client.Counter(
+        'django_http_responses_total_by_status',
+        'Responses sent, by view and status code.',
+        ['view', 'status'],
+    )
+    REQUEST_DB_QUERIES = prometheus_client.Histogram(
+        'http_request_db_queries',
+        'Database queries run while handling a request, by view.',
+        ['view'],
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+    REQUEST_DB_DURATION = prometheus_client.Histogram(
+        'http_request_db_duration_seconds',
+        'Time spent in database queries while handling a request, by view.',
+        ['view'],
+        buckets=QUERY_DURATION_BUCKETS,
+    )
+    DB_CONNECT_DURATION = prometheus_client.Histogram(
+        'db_connect_duration_seconds',
+        'Time spent opening database connections, including the wait for the pooler, by alias.',
+        ['alias'],
+        buckets=CONNECT_DURATION_BUCKETS,
+    )
+    CACHE_REQUESTS = prometheus_client.Counter(
+        'cache_requests',
+        'Cache lookups, by cache and result (hit_local, hit_shared or miss).',
+        ['cache', 'result'],
+    )
+    QUERY_FINGERPRINTS = prometheus_client.Counter(
+        'db_queries_by_fingerprint',
+        'Database queries, by view, action and fingerprint (see core.querylog).',
+        ['view', 'action', 'fingerprint'],
+    )
+    QUERY_FINGERPRINT_DURATION = prometheus_client.Counter(
+        'db_query_duration_seconds_by_fingerprint',
+        'Time spent in database queries, by view, action and fingerprint.',
+        ['view', 'action', 'fingerprint'],
+    )
+    SINGLE_FLIGHT = prometheus_client.Counter(
+        'single_flight_calls',
+        'Single-flight cache misses, by name and outcome '
+        '(leader, coalesced, stale, timeout or uncached).',
+        ['name', 'outcome'],
+    )
+    SINGLE_FLIGHT_WAIT = prometheus_client.Histogram(
+        'single_flight_wait_seconds',
+        'Time spent waiting for a single-flight leader, by name.',
+        ['name'],
+        buckets=SINGLE_FLIGHT_WAIT_BUCKETS,
+    )
+    REVIEWS = prometheus_client.Counter(
+        'flashcard_reviews',
+        'Flashcard reviews committed.',
+    )
+
+
+def is_enabled() -> bool:
+    """Return whether metrics are being collected."""
+    return prometheus_client is not None
+
+
+def record_cache(cache: str, result: str) -> None:
+    """Count a lookup in ``cache`` with ``result`` (hit_local, hit_shared or miss)."""
+    if prometheus_client is not None:
+        CACHE_REQUESTS.labels(cache, result).inc()
+
+
+def record_db_connect(alias: str, duration: float) -> None:
+    """Observe the time taken to open a connection to the database ``alias``."""
+    if prometheus_client is not None:
+        DB_CONNECT_DURATION.labels(alias).observe(duration)
+
+
+def record_query_fingerprint(
+    view: str, action: str, fingerprint: str, count: int, duration: float,
+) -> None:
+    """Count the queries with ``fingerprint`` run by a request."""
+    if prometheus_client is not None:
+        QUERY_FINGERPRINTS.labels(view, action, fingerprint).inc(count)
+        QUERY_FINGERPRINT_DURATION.labels(view, action, fingerprint).inc(duration)
+
+
+def record_single_flight(name: str, outcome: str) -> None:
+    """Count a single-flight miss of ``name`` with ``outcome``."""
+    if prometheus_client is not None:
+        SINGLE_FLIGHT.labels(name, outcome).inc()
+
+
+def record_single_flight_wait(name: str, duration: float) -> None:
+    """Observe the time a caller of ``name`` waited for the single-flight leader."""
+    if prometheus_client is not None:
+        SINGLE_FLIGHT_WAIT.labels(name).observe(duration)
+
+
+def record_review() -> None:
+    """Count a committed flashcard review."""
+    if prometheus_client is not None:
+        REVIEWS.inc()
+
+
+def get_view_name(request) -> str:
+    """Return the URL name of the view that handled ``request``."""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return UNRESOLVED_VIEW
+    return match.view_name or match.route or UNRESOLVED_VIEW
+
+
+class QueryStats:
+    """Database execute wrapper counting queries and their total time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """
+    Observe the latency, status and database usage of every request.
+
+    Should be the first middleware so the latency covers the whole stack.
+    Works under WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if prometheus_client is None:
+            return self.get_response(request)
+
+        stats = QueryStats()
+        started = time.perf_counter()
+        with execute_wrapper(stats):
+            response = self.get_response(request)
+        self.observe(request, response, stats, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        if prometheus_client is None:
+            return await self.get_response(request)
+
+        stats = QueryStats()
+        started = time.perf_counter()
+        with execute_wrapper(stats):
+            response = await self.get_response(request)
+        self.observe(request, response, stats, time.perf_counter() - started)
+        return response
+
+    def observe(self, request, response, stats, duration):
+        view = get_view_name(request)
+        REQUEST_LATENCY.labels(view, request.method).observe(duration)
+        RESPONSES_BY_STATUS.labels(view, str(response.status_code)).inc()
+        REQUEST_DB_QUERIES.labels(view).observe(stats.count)
+        REQUEST_DB_DURATION.labels(view).observe(stats.duration)
+
+
+def generate_latest() -> bytes:
+    """Render the current metrics in the Prometheus text format."""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        # Soma os valores gravados por todos os workers
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry)
+
+
+@never_cache
+@require_GET
+def metrics(request):
+    """Prometheus scrape endpoint."""
+    if prometheus_client is None:
+        raise Http404('Metrics are disabled: prometheus_client is not installed.')
+    return HttpResponse(generate_latest(), content_type=prometheus_client.CONTENT_TYPE_LATEST)
@@ -0,0 +1,262 @@
+"""
+On-demand profiling of single requests.
+
+A request carrying the ``X-Profile`` header is run under cProfile with every
+SQL query recorded on a timeline. The header holds a signed token issued to
+staff users by ``POST /api/profiles/token/``, or ``1`` for a staff user logged
+in through the admin session. The result is kept in the cache for
+``PROFILING_RESULT_TTL`` seconds; its id is returned in the ``X-Profile-Id``
+response header and it can be read at ``/api/profiles/<id>/`` or downloaded
+in pstats format (for ``snakeviz``, ``pstats`` or ``gprof2dot``) at
+``/api/profiles/<id>/download/``.
+
+Requests without the header only pay for a single ``META`` lookup.
+"""
+
+import asyncio
+import cProfile
+import io
+import logging
+import marshal
+import pstats
+import time
+import uuid
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.urls import reverse
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .db import execute_wrapper
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+PROFILE_TOKEN_SALT = 'core.profiling'
+PROFILE_KEY_PREFIX = 'profile'
+# Linhas do relatório textual e consultas guardadas por perfil
+PROFILE_REPORT_LINES = 60
+PROFILE_MAX_QUERIES = 1000
+
+# Sob ASGI só um perfil por vez: o cProfile não aceita dois ativos na mesma thread
+_async_profiling = asyncio.Lock()
+
+
+def make_token(user) -> str:
+    """Return a signed profiling token for ``user``."""
+    return signing.dumps({'user': user.pk}, salt=PROFILE_TOKEN_SALT)
+
+
+def get_token_user_id(token: str):
+    """Return the user id of a valid token, or None."""
+    try:
+        data = signing.loads(
+            token, salt=PROFILE_TOKEN_SALT, max_age=settings.PROFILING_TOKEN_MAX_AGE,
+        )
+    except signing.BadSignature:
+        return None
+    return data.get('user')
+
+
+def _cache_key(profile_id: str) -> str:
+    return f'{PROFILE_KEY_PREFIX}:{profile_id}'
+
+
+def get_profile(profile_id: str):
+    """Return a stored profile, or None when unknown or expired."""
+    return cache.get(_cache_key(profile_id))
+
+
+class QueryTimeline:
+    """Database execute wrapper recording when each query ran and for how long."""
+
+    def __init__(self, started: float):
+        self.started = started
+        self.queries = []
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.count += 1
+            self.duration += duration
+            # Os parâmetros não são guardados: podem conter dados pessoais
+            if len(self.queries) < PROFILE_MAX_QUERIES:
+                self.queries.append({
+                    'alias': context['connection'].alias,
+                    'start_ms': round((started - self.started) * 1000, 3),
+                    'duration_ms': round(duration * 1000, 3),
+                    'sql': sql,
+                    'many': many,
+                })
+
+
+class ProfilingMiddleware:
+    """
+    Profile the requests that ask for it with a valid ``X-Profile`` header.
+
+    Must come after ``AuthenticationMiddleware`` so session staff users are
+    recognized. Under ASGI the profiler sees the event loop thread, so the
+    report may include other requests served concurrently, and only one
+    request per process is profiled at a time.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        value = request.META.get(PROFILE_HEADER)
+        if not value:
+            return self.get_response(request)
+        user_id = self.get_profiling_user_id(getattr(request, 'user', None), value)
+        if user_id is None:
+            return self.get_response(request)
+        return self.profile(request, user_id)
+
+    async def __acall__(self, request):
+        value = request.META.get(PROFILE_HEADER)
+        if not value:
+            return await self.get_response(request)
+        user = await request.auser() if hasattr(request, 'auser') else None
+        user_id = self.get_profiling_user_id(user, value)
+        if user_id is None or _async_profiling.locked():
+            return await self.get_response(request)
+        async with _async_profiling:
+            return await self.aprofile(request, user_id)
+
+    def get_profiling_user_id(self, user, value: str):
+        """Return the id of the staff user asking for a profile, or None."""
+        if value == '1':
+            if user is not None and user.is_authenticated and user.is_staff:
+                return user.pk
+            return None
+        return get_token_user_id(value)
+
+    def profile(self, request, user_id):
+        """Run the request under the profiler and store the result."""
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        timeline = QueryTimeline(started)
+        with execute_wrapper(timeline):
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        return self.finish(request, response, user_id, profiler, timeline, started)
+
+    async def aprofile(self, request, user_id):
+        """Async version of :meth:`profile`."""
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        timeline = QueryTimeline(started)
+        with execute_wrapper(timeline):
+            profiler.enable()
+            try:
+                response = await self.get_response(request)
+            finally:
+                profiler.disable()
+        return await sync_to_async(self.finish)(
+            request, response, user_id, profiler, timeline, started,
+        )
+
+    def finish(self, request, response, user_id, profiler, timeline, started):
+        """Store the profile and point to it from the response headers."""
+        duration = time.perf_counter() - started
+        profile_id = uuid.uuid4().hex
+        try:
+            self.store(profile_id, request, response, user_id, profiler, timeline, duration)
+        except Exception as e:
+            logger.error(f'Failed to store request profile: {str(e)}')
+            return response
+        response['X-Profile-Id'] = profile_id
+        response['X-Profile-Url'] = request.build_absolute_uri(
+            reverse('profile-detail', args=[profile_id]),
+        )
+        return response
+
+    def store(self, profile_id, request, response, user_id, profiler, timeline, duration):
+        """Save the profile of a request in the cache."""
+        stats = pstats.Stats(profiler, stream=io.StringIO())
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_REPORT_LINES)
+        cache.set(_cache_key(profile_id), {
+            'id': profile_id,
+            'method': request.method,
+            'path': request.get_full_path(),
+            'status': response.status_code,
+            'user': user_id,
+            'created_at': timezone.now().isoformat(),
+            'duration_ms': round(duration * 1000, 3),
+            'query_count': timeline.count,
+            'query_time_ms': round(timeline.duration * 1000, 3),
+            'queries': timeline.queries,
+            'report': stats.stream.getvalue(),
+            'stats': marshal.dumps(stats.stats),
+        }, settings.PROFILING_RESULT_TTL)
+
+
+@extend_schema(tags=['profiling'], exclude=True)
+class ProfileTokenView(APIView):
+    """Issue a token enabling profiling through the ``X-Profile`` header."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request):
+        """Return a new profiling token."""
+        return Response({
+            'token': make_token(request.user),
+            'header': 'X-Profile',
+            'expires_in': settings.PROFILING_TOKEN_MAX_AGE,
+        })
+
+
+@extend_schema(tags=['profiling'], exclude=True)
+class ProfileDetailView(APIView):
+    """Show a stored request profile: the report and the SQL timeline."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, profile_id):
+        """Return the profile without the raw stats."""
+        profile = get_profile(profile_id)
+        if profile is None:
+            return Response({'detail': 'Profile not found.'}, status=status.HTTP_404_NOT_FOUND)
+        data = {key: value for key, value in profile.items() if key != 'stats'}
+        data['download_url'] = request.build_absolute_uri(
+            reverse('profile-download', args=[profile_id]),
+        )
+        return Response(data)
+
+
+@extend_schema(tags=['profiling'], exclude=True)
+class ProfileDownloadView(APIView):
+    """Download the raw stats of a stored profile in pstats format."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, profile_id):
+        """Return the marshalled stats as a ``.prof`` file."""
+        profile = get_profile(profile_id)
+        if profile is None:
+            return Response({'detail': 'Profile not found.'}, status=status.HTTP_404_NOT_FOUND)
+        response = HttpResponse(profile['stats'], content_type='application/octet-stream')
+        response['Content-Disposition'] = f'attachment; filename="{profile_id}.prof"'
+        return response
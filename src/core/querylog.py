@@ -0,0 +1,212 @@
+"""
+SQL query fingerprinting and slow-query log.
+
+Every query is normalized to a fingerprint (literals, placeholders and IN lists
+replaced) and counted per view and action, both in process (see
+:func:`get_query_stats`) and in Prometheus when it is available. Queries slower
+than ``SLOW_QUERY_THRESHOLD_MS`` and fingerprints repeated
+``QUERY_REPEAT_THRESHOLD`` times in a single request (usually an N+1) are
+logged as JSON with the view, the action, the serializer being rendered and
+the line of project code that ran them.
+"""
+
+import functools
+import hashlib
+import logging
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from rest_framework.serializers import BaseSerializer
+
+from . import db, metrics
+from .db import execute_wrapper
+
+logger = logging.getLogger(__name__)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'(?<![\w"])-?\d+(?:\.\d+)?(?![\w"])')
+_PLACEHOLDER = re.compile(r'%s|%\(\w+\)s')
+_IN_LIST = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+_VALUES_ROWS = re.compile(r'(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+')
+_WHITESPACE = re.compile(r'\s+')
+
+_stats: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+_stats_lock = threading.Lock()
+
+_PROJECT_DIR = str(Path(settings.BASE_DIR).resolve())
+# Arquivos dos wrappers, ignorados ao procurar o código que fez a consulta
+_WRAPPER_FILES = {str(Path(__file__).resolve()), str(Path(db.__file__).resolve())}
+
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint(sql: str) -> Tuple[str, str]:
+    """Return ``(id, normalized SQL)`` for a statement."""
+    normalized = _STRING.sub('?', sql)
+    normalized = _PLACEHOLDER.sub('?', normalized)
+    normalized = _NUMBER.sub('?', normalized)
+    normalized = _IN_LIST.sub('IN (...)', normalized)
+    normalized = _VALUES_ROWS.sub(r'\1, ...', normalized)
+    normalized = _WHITESPACE.sub(' ', normalized).strip()
+    return hashlib.md5(normalized.encode()).hexdigest()[:12], normalized
+
+
+def get_query_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Return the queries run by this process, grouped by view, action and fingerprint.
+
+    Keys are ``"view action fingerprint"``; values hold the ``count``, the total
+    ``duration`` in seconds and the normalized ``sql``.
+    """
+    with _stats_lock:
+        return {' '.join(key): dict(value) for key, value in _stats.items()}
+
+
+def reset_query_stats() -> None:
+    """Forget the per-process query stats."""
+    with _stats_lock:
+        _stats.clear()
+
+
+def get_query_context() -> Dict[str, Optional[str]]:
+    """
+    Return the serializer being rendered and the project code running a query.
+
+    Walks the current stack, so it is only called for queries that are logged.
+    """
+    serializer = None
+    caller = None
+    frame = sys._getframe(1)
+    while frame is not None and (serializer is None or caller is None):
+        filename = frame.f_code.co_filename
+        if caller is None and filename.startswith(_PROJECT_DIR) and filename not in _WRAPPER_FILES:
+            path = Path(filename).relative_to(_PROJECT_DIR)
+            caller = f'{path}:{frame.f_lineno} in {frame.f_code.co_name}'
+        if serializer is None:
+            instance = frame.f_locals.get('self')
+            if isinstance(instance, BaseSerializer):
+                serializer = type(instance).__name__
+        frame = frame.f_back
+    return {'serializer': serializer, 'caller': caller}
+
+
+class RequestQueryLog:
+    """Database execute wrapper aggregating the queries of a single request."""
+
+    def __init__(self, request=None):
+        self.request = request
+        self.view = metrics.UNRESOLVED_VIEW
+        self.action = ''
+        self.queries: Dict[str, list] = {}
+        self.slow_threshold = settings.SLOW_QUERY_THRESHOLD_MS / 1000
+        self.repeat_threshold = settings.QUERY_REPEAT_THRESHOLD
+
+    def set_view(self, request, view_func) -> None:
+        """Remember the view and action handling the request."""
+        self.view = metrics.get_view_name(request)
+        actions = getattr(view_func, 'actions', None)
+        if actions:
+            # ViewSets: o método HTTP define a ação
+            self.action = actions.get(request.method.lower(), '')
+        else:
+            self.action = request.method.lower()
+
+    def resolve_view(self) -> None:
+        """Take the view and action from the request once its URL is resolved."""
+        if self.request is None or self.view != metrics.UNRESOLVED_VIEW:
+            return
+        match = getattr(self.request, 'resolver_match', None)
+        if match is not None:
+            self.set_view(self.request, match.func)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, time.perf_counter() - started)
+
+    def record(self, sql: str, duration: float) -> None:
+        """Count a query, logging it when slow or repeated too often."""
+        fingerprint_id, normalized = fingerprint(sql)
+        entry = self.queries.get(fingerprint_id)
+        if entry is None:
+            entry = self.queries[fingerprint_id] = [0, 0.0, normalized]
+        entry[0] += 1
+        entry[1] += duration
+        if duration >= self.slow_threshold:
+            self.log(
+                'slow_query', fingerprint_id, normalized, duration_ms=round(duration * 1000, 3),
+            )
+        if entry[0] == self.repeat_threshold:
+            self.log('repeated_query', fingerprint_id, normalized, count=entry[0])
+
+    def log(self, event: str, fingerprint_id: str, normalized: str, **fields) -> None:
+        """Emit a structured log entry for a query."""
+        self.resolve_view()
+        data = {
+            'event': event,
+            'view': self.view,
+            'action': self.action,
+            'fingerprint': fingerprint_id,
+            **fields,
+            **get_query_context(),
+            'sql': normalized,
+        }
+        logger.warning(orjson.dumps(data).decode(), extra={'query': data})
+
+    def flush(self) -> None:
+        """Add the request's queries to the process and Prometheus stats."""
+        self.resolve_view()
+        with _stats_lock:
+            for fingerprint_id, (count, duration, normalized) in self.queries.items():
+                key = (self.view, self.action, fingerprint_id)
+                stats = _stats.get(key)
+                if stats is None:
+                    stats = _stats[key] = {'count': 0, 'duration': 0.0, 'sql': normalized}
+                stats['count'] += count
+                stats['duration'] += duration
+        for fingerprint_id, (count, duration, _) in self.queries.items():
+            metrics.record_query_fingerprint(
+                self.view, self.action, fingerprint_id, count, duration,
+            )
+
+
+class QueryLogMiddleware:
+    """
+    Fingerprint and log the queries run while handling each request.
+
+    The view and action are read from the resolved URL when first needed, so
+    no ``process_view`` hook is required (under ASGI it would cost a thread
+    switch per request).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        query_log = RequestQueryLog(request)
+        with execute_wrapper(query_log):
+            response = self.get_response(request)
+        query_log.flush()
+        return response
+
+    async def __acall__(self, request):
+        query_log = RequestQueryLog(request)
+        with execute_wrapper(query_log):
+            response = await self.get_response(request)
+        query_log.flush()
+        return response
@@ -0,0 +1,102 @@
+"""
+Access to the Redis client behind the Django cache.
+"""
+
+import asyncio
+import weakref
+from typing import Any, Optional, Tuple
+
+import redis.asyncio
+from django.core.cache import caches
+
+
+def get_redis_client(alias: str = 'default', write: bool = True):
+    """
+    Return a redis-py client sharing the connection pool of the cache ``alias``.
+
+    Returns None when the cache is not backed by Redis (e.g. local memory or
+    dummy caches in development and tests), so callers can fall back.
+    """
+    backend = caches[alias]
+
+    # django.core.cache.backends.redis.RedisCache
+    cache_client = getattr(backend, '_cache', None)
+    if cache_client is not None and hasattr(cache_client, 'get_client'):
+        return cache_client.get_client(write=write)
+
+    # django_redis.cache.RedisCache
+    django_redis_client = getattr(backend, 'client', None)
+    if django_redis_client is not None and hasattr(django_redis_client, 'get_client'):
+        return django_redis_client.get_client(write=write)
+
+    return None
+
+
+# Clientes assíncronos por event loop: conexões asyncio não podem trocar de loop
+_async_clients = weakref.WeakKeyDictionary()
+_async_enabled = False
+
+
+def enable_async_clients() -> None:
+    """
+    Allow :func:`get_async_redis_client` to return clients.
+
+    Called by the ASGI entry point. Under WSGI each async view runs in a
+    short-lived event loop, where a pooled asyncio client would reconnect on
+    every request, so callers fall back to the synchronous client instead.
+    """
+    global _async_enabled
+    _async_enabled = True
+
+
+def _get_backend_server(backend) -> Optional[Tuple[str, dict]]:
+    """Return the URL and connection options of the cache's primary Redis server."""
+    cache_client = getattr(backend, '_cache', None)
+    if cache_client is not None and hasattr(cache_client, '_pool_options'):
+        options = {
+            key: value for key, value in cache_client._pool_options.items() if key != 'parser_class'
+        }
+        return cache_client._servers[0], options
+    django_redis_client = getattr(backend, 'client', None)
+    if django_redis_client is not None and hasattr(django_redis_client, '_server'):
+        return django_redis_client._server[0], {}
+    return None
+
+
+def get_async_redis_client(alias: str = 'default'):
+    """
+    Return a ``redis.asyncio`` client for the Redis server of the cache ``alias``.
+
+    Clients are kept per event loop. Returns None outside the ASGI server (see
+    :func:`enable_async_clients`) or when the cache is not backed by Redis.
+    """
+    if not _async_enabled:
+        return None
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    if alias not in clients:
+        server = _get_backend_server(caches[alias])
+        clients[alias] = redis.asyncio.Redis.from_url(server[0], **server[1]) if server else None
+    return clients[alias]
+
+
+async def acache_get(key: str, default: Any = None, alias: str = 'default') -> Any:
+    """
+    Read ``key`` from the cache ``alias`` without blocking the event loop.
+
+    Uses the asyncio client when available, decoding the value as the cache
+    backend does; otherwise falls back to the backend's ``aget``.
+    """
+    client = get_async_redis_client(alias)
+    backend = caches[alias]
+    if client is None:
+        return await backend.aget(key, default)
+
+    cache_client = getattr(backend, '_cache', None)
+    if hasattr(cache_client, '_serializer'):
+        # django.core.cache.backends.redis.RedisCache
+        value = await client.get(backend.make_and_validate_key(key))
+        return default if value is None else cache_client._serializer.loads(value)
+    # django_redis.cache.RedisCache
+    value = await client.get(backend.client.make_key(key))
+    return default if value is None else backend.client.decode(value)
@@ -0,0 +1,80 @@
+"""
+Fast JSON renderer and parser for API responses, backed by orjson.
+"""
+
+import datetime
+import decimal
+
+import orjson
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+
+# Chaves não-texto são convertidas como no json da biblioteca padrão
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def default(obj):
+    """
+    Serialize the types orjson does not handle natively.
+
+    datetime, date, time, UUID, dataclasses and dict/list subclasses never reach
+    this function. The remaining cases follow DRF's JSON encoder; anything else
+    falls back to ``str()`` as the previous ``CustomJSONEncoder`` did.
+    """
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, QuerySet):
+        return tuple(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, '__iter__'):
+        return tuple(obj)
+    return str(obj)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render API responses as JSON with orjson."""
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render ``data`` into JSON bytes."""
+        if data is None:
+            return b''
+        options = ORJSON_OPTIONS
+        renderer_context = renderer_context or {}
+        # Indentação pedida pelo cliente ou pela API navegável
+        if renderer_context.get('indent') or 'indent=' in (accepted_media_type or ''):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=default, option=options)
+
+
+class ORJSONParser(BaseParser):
+    """Parse JSON request bodies with orjson."""
+
+    media_type = 'application/json'
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parse the request body into Python data."""
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', 'utf-8')
+        try:
+            data = stream.read()
+            if encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+                data = data.decode(encoding)
+            return orjson.loads(data)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError(f'JSON parse error - {exc}')
@@ -0,0 +1,95 @@
+"""
+Pre-rendered OpenAPI schema.
+
+Generating the drf-spectacular schema walks every view and serializer, so it is
+rendered once per deploy (``manage.py generate_schema``) and served from
+memory. Without the artifact, or with DEBUG on, it is generated on first use
+and kept for the life of the process.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_schema: Optional[Tuple[bytes, str]] = None
+_lock = threading.Lock()
+
+
+def _stringify_types(obj: Any) -> Any:
+    """Replace type objects left in the schema by their names."""
+    if isinstance(obj, type):
+        return str(obj.__name__)
+    if isinstance(obj, dict):
+        return {key: _stringify_types(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_stringify_types(item) for item in obj]
+    return obj
+
+
+def render_schema() -> bytes:
+    """Generate the public OpenAPI schema and render it as JSON."""
+    # Importados aqui para evitar importações circulares
+    from drf_spectacular.generators import SchemaGenerator
+    from drf_spectacular.settings import spectacular_settings
+
+    from .utils import CustomJSONRenderer
+
+    generator = SchemaGenerator(urlconf=getattr(spectacular_settings, 'SERVE_URLCONF', None))
+    schema = generator.get_schema(request=None, public=True)
+    return CustomJSONRenderer().render(_stringify_types(schema))
+
+
+def get_schema_path() -> Optional[Path]:
+    """Return the path of the schema artifact, if one is configured."""
+    path = getattr(settings, 'OPENAPI_SCHEMA_FILE', None)
+    return Path(path) if path else None
+
+
+def write_schema(path: Path) -> bytes:
+    """Render the schema and write it atomically to ``path``."""
+    content = render_schema()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+        tmp.write(content)
+    os.replace(tmp.name, path)
+    return content
+
+
+def _make_etag(content: bytes) -> str:
+    return f'"{hashlib.md5(content).hexdigest()}"'
+
+
+def _load() -> bytes:
+    path = get_schema_path()
+    if path is not None and not settings.DEBUG:
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            logger.warning(f'OpenAPI schema artifact not found at {path}; generating it in process')
+    return render_schema()
+
+
+def get_schema() -> Tuple[bytes, str]:
+    """Return the rendered schema and its ETag, loading them once per process."""
+    global _schema
+    if _schema is None:
+        with _lock:
+            if _schema is None:
+                content = _load()
+                _schema = (content, _make_etag(content))
+    return _schema
+
+
+def reset_schema() -> None:
+    """Forget the in-memory schema; the next request loads it again."""
+    global _schema
+    with _lock:
+        _schema = None
@@ -0,0 +1,567 @@
+"""
+Synthetic data for scale testing.
+
+Generates users, decks (with their tags), flashcards, flashcard progress,
+favorites, achievements and user progress with production-like skew: deck
+sizes are log-normal, deck popularity follows a Zipf law and user activity is
+Pareto-distributed, so a few decks and users concentrate most of the rows.
+
+Rows are produced in fixed-size chunks, each with a generator seeded from
+``(seed, stage, chunk)``, so the data depends only on the seed and the
+requested sizes, not on the number of worker processes. PostgreSQL chunks are
+written with ``COPY`` by parallel processes; other databases get
+``executemany`` in a single process.
+
+Timestamps are relative to the start of the run, so due reviews and recent
+activity look the same whenever the data is generated.
+"""
+
+import functools
+import io
+import multiprocessing
+import random
+from bisect import bisect
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, connections, transaction
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.achievements.models import Achievement
+from apps.flashcards.models import (
+    CATEGORY_CHOICES,
+    LANGUAGE_CHOICES,
+    LEVEL_CHOICES,
+    Deck,
+    DeckFavorite,
+    DeckTag,
+    Flashcard,
+    FlashcardProgress,
+    Tag,
+)
+from apps.progress.models import UserProgress
+
+User = get_user_model()
+
+# Volumes por preset: usuários, decks, flashcards e registros de progresso
+SCALES = {
+    'small': {'users': 1_000, 'decks': 500, 'flashcards': 50_000, 'progress': 500_000},
+    'medium': {'users': 10_000, 'decks': 5_000, 'flashcards': 500_000, 'progress': 5_000_000},
+    'production': {
+        'users': 100_000, 'decks': 50_000, 'flashcards': 5_000_000, 'progress': 50_000_000,
+    },
+}
+
+USERNAME_PREFIX = 'seed_'
+USER_CHUNK = 10_000
+DECK_CHUNK = 2_000
+# Usuários por bloco na etapa de atividade (progresso, favoritos, conquistas)
+ACTIVITY_CHUNK = 500
+
+ZIPF_EXPONENT = 1.1
+ACTIVITY_ALPHA = 1.5
+MASTERED_INTERVAL = 21
+
+WORDS = [
+    'airport', 'hotel', 'ticket', 'breakfast', 'meeting', 'invoice', 'doctor', 'weather', 'station',
+    'market', 'kitchen', 'family', 'school', 'office', 'holiday', 'restaurant', 'museum', 'beach',
+    'train', 'city', 'music', 'movie', 'garden', 'coffee', 'bakery', 'pharmacy', 'bank', 'library',
+    'street', 'river', 'mountain', 'winter', 'summer', 'birthday', 'wedding', 'interview', 'email',
+    'phone', 'computer', 'football', 'shopping', 'clothes', 'health', 'verbs', 'grammar', 'idioms',
+]
+LEVELS = [code for code, _ in LEVEL_CHOICES]
+CATEGORIES = [code for code, _ in CATEGORY_CHOICES]
+LANGUAGES = [code for code, _ in LANGUAGE_CHOICES]
+USER_LANGUAGES = [code for code, _ in User._meta.get_field('language').choices]
+# Inglês e espanhol concentram a maior parte dos decks e estudantes
+LANGUAGE_WEIGHTS = list(accumulate([40, 20, 8, 7, 5, 6, 5, 3, 3, 3]))
+ACHIEVEMENTS = [
+    (achievement_type, f'{achievement_type.title()} {tier}', points)
+    for achievement_type, _ in Achievement.ACHIEVEMENT_TYPES
+    for tier, points in (('I', 10), ('II', 25), ('III', 50), ('IV', 100))
+]
+
+
+@dataclass
+class Plan:
+    """Sizes, id ranges and shared distributions of a seeding run."""
+
+    seed: int
+    users: int
+    decks: int
+    flashcards: int
+    progress: int
+    favorites: float
+    achievements: float
+    now: datetime
+    password: str
+    user_start: int
+    deck_start: int
+    card_start: int
+    tag_ids: List[int] = field(default_factory=list)
+    deck_sizes: List[int] = field(default_factory=list)
+    deck_first_card: List[int] = field(default_factory=list)
+    deck_public: List[bool] = field(default_factory=list)
+    popular_decks: List[int] = field(default_factory=list)
+    popularity: List[float] = field(default_factory=list)
+
+    def chunks(self, stage: str) -> int:
+        """Return the number of chunks of ``stage``."""
+        total, size = {
+            'users': (self.users, USER_CHUNK),
+            'decks': (self.decks, DECK_CHUNK),
+            'flashcards': (self.decks, DECK_CHUNK),
+            'activity': (self.users, ACTIVITY_CHUNK),
+        }[stage]
+        return -(-total // size)
+
+
+def zipf_weights(count: int, exponent: float = ZIPF_EXPONENT) -> List[float]:
+    """Return cumulative Zipf weights for ranks ``0..count - 1``."""
+    return list(accumulate(1 / (rank + 1) ** exponent for rank in range(count)))
+
+
+def _next_id(model) -> int:
+    return (model.objects.aggregate(value=Max('pk'))['value'] or 0) + 1
+
+
+def make_plan(
+    seed: int,
+    users: int,
+    decks: int,
+    flashcards: int,
+    progress: int,
+    favorites: float = 5,
+    achievements: float = 3,
+    password: str = 'seed-password',
+) -> Plan:
+    """Reserve ids after the existing rows and draw the deck-level distributions."""
+    rng = random.Random(f'{seed}:plan')
+    plan = Plan(
+        seed=seed,
+        users=users,
+        decks=decks,
+        flashcards=flashcards,
+        progress=progress,
+        favorites=favorites,
+        achievements=achievements,
+        now=timezone.now().replace(second=0, microsecond=0),
+        password=make_password(password),
+        user_start=_next_id(User),
+        deck_start=_next_id(Deck),
+        card_start=_next_id(Flashcard),
+    )
+
+    Tag.objects.bulk_create([Tag(name=word) for word in WORDS], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.filter(name__in=WORDS).values_list('name', 'id'))
+    plan.tag_ids = [tag_ids[word] for word in WORDS]
+
+    # Tamanho dos decks: log-normal, somando aproximadamente ``flashcards``
+    weights = [rng.lognormvariate(0, 0.8) for _ in range(decks)]
+    scale = flashcards / sum(weights) if weights else 0
+    plan.deck_sizes = [max(1, round(weight * scale)) for weight in weights]
+    offsets = accumulate([0] + plan.deck_sizes[:-1])
+    plan.deck_first_card = [plan.card_start + offset for offset in offsets]
+    plan.deck_public = [rng.random() < 0.7 for _ in range(decks)]
+
+    # Popularidade: ordem aleatória dos decks públicos com pesos de Zipf
+    plan.popular_decks = [index for index in range(decks) if plan.deck_public[index]]
+    rng.shuffle(plan.popular_decks)
+    plan.popularity = zipf_weights(len(plan.popular_decks))
+    return plan
+
+
+def _rng(plan: Plan, stage: str, chunk: int) -> random.Random:
+    return random.Random(f'{plan.seed}:{stage}:{chunk}')
+
+
+def _pick_deck(plan: Plan, rng: random.Random) -> int:
+    """Return the index of a public deck drawn by popularity."""
+    return plan.popular_decks[bisect(plan.popularity, rng.random() * plan.popularity[-1])]
+
+
+def _pick_language(rng: random.Random, languages: List[str] = LANGUAGES) -> str:
+    weights = LANGUAGE_WEIGHTS[:len(languages)]
+    return languages[bisect(weights, rng.random() * weights[-1])]
+
+
+def _ago(plan: Plan, rng: random.Random, days: float) -> datetime:
+    """Return a timestamp up to ``days`` (exponentially distributed) before the run."""
+    return plan.now - timedelta(minutes=int(min(rng.expovariate(1 / days), 3 * 365) * 24 * 60))
+
+
+Rows = List[Tuple[type, Sequence[str], List[tuple]]]
+
+
+def generate_users(plan: Plan, chunk: int) -> Rows:
+    """Return the users of ``chunk``."""
+    rng = _rng(plan, 'users', chunk)
+    first = chunk * USER_CHUNK
+    rows = []
+    for offset in range(first, min(first + USER_CHUNK, plan.users)):
+        user_id = plan.user_start + offset
+        date_joined = _ago(plan, rng, 240)
+        streak = int(rng.paretovariate(2)) - 1
+        rows.append((
+            user_id,
+            f'{USERNAME_PREFIX}{user_id}',
+            f'{USERNAME_PREFIX}{user_id}@example.com',
+            plan.password,
+            date_joined,
+            max(date_joined, _ago(plan, rng, 20)),
+            _pick_language(rng, USER_LANGUAGES),
+            min(int(rng.paretovariate(2)), 50),
+            int(rng.paretovariate(1.3) * 100),
+            streak,
+        ))
+    columns = (
+        'id', 'username', 'email', 'password', 'date_joined', 'last_activity',
+        'language', 'level', 'experience', 'streak',
+    )
+    return [(User, columns, rows)]
+
+
+def generate_decks(plan: Plan, chunk: int) -> Rows:
+    """Return the decks of ``chunk`` and their tags."""
+    rng = _rng(plan, 'decks', chunk)
+    first = chunk * DECK_CHUNK
+    tag_popularity = zipf_weights(len(plan.tag_ids))
+    decks = []
+    deck_tags = []
+    for index in range(first, min(first + DECK_CHUNK, plan.decks)):
+        deck_id = plan.deck_start + index
+        # Poucos usuários criam a maioria dos decks
+        owner_id = plan.user_start + int(plan.users * rng.random() ** 3)
+        tags = []
+        for _ in range(rng.randint(1, 4)):
+            rank = bisect(tag_popularity, rng.random() * tag_popularity[-1])
+            if rank not in tags:
+                tags.append(rank)
+        created_at = _ago(plan, rng, 300)
+        is_public = plan.deck_public[index]
+        decks.append((
+            deck_id,
+            f'{WORDS[tags[0]].title()} {rng.choice(LEVELS)} #{deck_id}',
+            f'Deck de {WORDS[tags[0]]} gerado para testes de escala.',
+            _pick_language(rng),
+            rng.choice(LEVELS),
+            rng.choice(CATEGORIES),
+            owner_id,
+            is_public,
+            is_public and rng.random() < 0.02,
+            ','.join(WORDS[rank] for rank in tags),
+            round(rng.random(), 2),
+            plan.deck_sizes[index],
+            created_at,
+            max(created_at, _ago(plan, rng, 30)),
+        ))
+        deck_tags.extend((deck_id, plan.tag_ids[rank]) for rank in tags)
+    columns = (
+        'id', 'name', 'description', 'language', 'level', 'category', 'owner_id', 'is_public',
+        'is_featured', 'tags', 'difficulty', 'total_cards', 'created_at', 'updated_at',
+    )
+    return [(Deck, columns, decks), (DeckTag, ('deck_id', 'tag_id'), deck_tags)]
+
+
+def generate_flashcards(plan: Plan, chunk: int) -> Rows:
+    """Return the flashcards of the decks of ``chunk``."""
+    rng = _rng(plan, 'flashcards', chunk)
+    first = chunk * DECK_CHUNK
+    rows = []
+    for index in range(first, min(first + DECK_CHUNK, plan.decks)):
+        deck_id = plan.deck_start + index
+        created_at = _ago(plan, rng, 300)
+        card_id = plan.deck_first_card[index]
+        for position in range(plan.deck_sizes[index]):
+            word = WORDS[rng.randrange(len(WORDS))]
+            rows.append((
+                card_id + position,
+                deck_id,
+                f'{word} {position}',
+                f'tradução de {word} {position}',
+                f'This is an example with {word}.',
+                created_at,
+                created_at,
+            ))
+    columns = ('id', 'deck_id', 'front', 'back', 'example', 'created_at', 'updated_at')
+    return [(Flashcard, columns, rows)]
+
+
+def generate_activity(plan: Plan, chunk: int) -> Rows:
+    """Return the progress, favorites, achievements and stats of the users of ``chunk``."""
+    rng = _rng(plan, 'activity', chunk)
+    first = chunk * ACTIVITY_CHUNK
+    progress_rows = []
+    favorite_rows = []
+    achievement_rows = []
+    stats_rows = []
+    # Pareto com alpha 1.5 tem média 3 * mínimo
+    minimum = plan.progress / plan.users / 3 if plan.users else 0
+    for offset in range(first, min(first + ACTIVITY_CHUNK, plan.users)):
+        user_id = plan.user_start + offset
+        target = min(int(rng.paretovariate(ACTIVITY_ALPHA) * minimum), plan.flashcards)
+        studied = set()
+        cards = correct_total = incorrect_total = mastered = 0
+        last_study = None
+        # Usuários estudam os decks do início, um deck popular por vez
+        attempts = 0
+        while target > 0 and plan.popular_decks and attempts < 50:
+            index = _pick_deck(plan, rng)
+            if index in studied:
+                attempts += 1
+                continue
+            studied.add(index)
+            count = min(target, plan.deck_sizes[index])
+            target -= count
+            cards += count
+            first_card = plan.deck_first_card[index]
+            for position in range(count):
+                interval = int(rng.paretovariate(1.2))
+                correct = rng.randint(0, 3 + interval)
+                incorrect = rng.randint(0, 3)
+                last_reviewed = _ago(plan, rng, 14)
+                correct_total += correct
+                incorrect_total += incorrect
+                mastered += interval >= MASTERED_INTERVAL
+                last_study = max(last_study or last_reviewed, last_reviewed)
+                progress_rows.append((
+                    user_id,
+                    first_card + position,
+                    correct,
+                    incorrect,
+                    round(rng.uniform(1, 15), 2),
+                    last_reviewed,
+                    last_reviewed + timedelta(days=interval),
+                    round(rng.uniform(1.3, 3.0), 2),
+                    interval,
+                    min(correct, rng.randint(0, 10)),
+                    last_reviewed,
+                    last_reviewed,
+                ))
+
+        favorites = set()
+        for _ in range(int(rng.paretovariate(2) * plan.favorites / 2)):
+            if plan.popular_decks:
+                favorites.add(_pick_deck(plan, rng))
+        favorite_rows.extend(
+            (user_id, plan.deck_start + index, _ago(plan, rng, 90)) for index in sorted(favorites)
+        )
+
+        count = int(rng.expovariate(1 / plan.achievements)) if plan.achievements else 0
+        count = min(count, len(ACHIEVEMENTS))
+        for achievement_type, name, points in rng.sample(ACHIEVEMENTS, count):
+            achievement_rows.append((
+                user_id, achievement_type, name, f'{name} desbloqueada', points,
+                _ago(plan, rng, 60),
+            ))
+
+        attempts_total = correct_total + incorrect_total
+        streak = int(rng.paretovariate(1.8)) - 1
+        stats_rows.append((
+            user_id,
+            rng.choice(LEVELS),
+            cards,
+            mastered,
+            streak,
+            streak + int(rng.paretovariate(2)) - 1,
+            round(correct_total / attempts_total * 100, 2) if attempts_total else 0,
+            round(rng.uniform(2, 10), 2),
+            int(rng.paretovariate(1.5) * 10),
+            int(rng.paretovariate(1.3) * 600),
+            last_study,
+            plan.now,
+            plan.now,
+        ))
+
+    return [
+        (FlashcardProgress, (
+            'user_id', 'flashcard_id', 'correct_attempts', 'incorrect_attempts',
+            'average_response_time', 'last_reviewed', 'next_review_date', 'ease_factor',
+            'interval', 'streak', 'created_at', 'updated_at',
+        ), progress_rows),
+        (DeckFavorite, ('user_id', 'deck_id', 'created_at'), favorite_rows),
+        (Achievement, (
+            'user_id', 'type', 'name', 'description', 'points', 'unlocked_at',
+        ), achievement_rows),
+        (UserProgress, (
+            'user_id', 'current_level', 'total_cards', 'mastered_cards', 'current_streak',
+            'longest_streak', 'accuracy_rate', 'average_response_time', 'cards_per_day',
+            'time_spent', 'last_study_date', 'created_at', 'updated_at',
+        ), stats_rows),
+    ]
+
+
+STAGES: Dict[str, Callable[[Plan, int], Rows]] = {
+    'users': generate_users,
+    'decks': generate_decks,
+    'flashcards': generate_flashcards,
+    'activity': generate_activity,
+}
+
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+@functools.lru_cache(maxsize=1 << 20)
+def _isoformat(value: datetime) -> str:
+    return value.isoformat()
+
+
+def _copy_text(value) -> str:
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES)
+    if isinstance(value, datetime):
+        return _isoformat(value)
+    return str(value)
+
+
+def _complete(model, columns: Sequence[str], now: datetime) -> Tuple[List[str], tuple]:
+    """Return the table columns and the constant values of the fields not generated."""
+    names = []
+    constants = []
+    for model_field in model._meta.concrete_fields:
+        if model_field.attname in columns:
+            continue
+        if model_field.primary_key:
+            # Ids não referenciados por outras tabelas vêm da sequência
+            continue
+        names.append(model_field.column)
+        if getattr(model_field, 'auto_now', False) or getattr(model_field, 'auto_now_add', False):
+            constants.append(now)
+        else:
+            constants.append(model_field.get_default())
+    fields = {model_field.attname: model_field for model_field in model._meta.concrete_fields}
+    return [fields[name].column for name in columns] + names, tuple(constants)
+
+
+def write_rows(
+    model, columns: Sequence[str], rows: List[tuple], now: datetime, using: str = 'default',
+) -> None:
+    """Insert ``rows`` (values for ``columns``) into the table of ``model``."""
+    if not rows:
+        return
+    db = connections[using]
+    table_columns, constants = _complete(model, columns, now)
+    quote = db.ops.quote_name
+    table = quote(model._meta.db_table)
+    column_list = ', '.join(quote(column) for column in table_columns)
+    with db.cursor() as cursor:
+        if db.vendor == 'postgresql':
+            buffer = io.StringIO()
+            for row in rows:
+                buffer.write('\t'.join([_copy_text(value) for value in row + constants]))
+                buffer.write('\n')
+            buffer.seek(0)
+            sql = f'COPY {table} ({column_list}) FROM STDIN'
+            raw = cursor.cursor
+            if hasattr(raw, 'copy_expert'):
+                raw.copy_expert(sql, buffer)
+            else:
+                # psycopg 3
+                with raw.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+            return
+        adapt = db.ops.adapt_datetimefield_value
+        placeholders = ', '.join(['%s'] * len(table_columns))
+        cursor.executemany(
+            f'INSERT INTO {table} ({column_list}) VALUES ({placeholders})',
+            [
+                [
+                    adapt(value) if isinstance(value, datetime) else value
+                    for value in row + constants
+                ]
+                for row in rows
+            ],
+        )
+
+
+_plan: Optional[Plan] = None
+
+
+def _init_worker(plan: Plan) -> None:
+    global _plan
+    _plan = plan
+
+
+def run_chunk(task: Tuple[str, int]) -> int:
+    """Generate and write one chunk, returning the number of rows."""
+    stage, chunk = task
+    total = 0
+    with transaction.atomic():
+        for model, columns, rows in STAGES[stage](_plan, chunk):
+            write_rows(model, columns, rows, _plan.now)
+            total += len(rows)
+    return total
+
+
+def seed(
+    plan: Plan,
+    workers: int = 1,
+    progress: Optional[Callable[[str, int, int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Write every stage of ``plan``, returning the number of rows per stage.
+
+    ``progress`` is called with the stage, the chunks done and the chunk count.
+    """
+    if connection.vendor != 'postgresql':
+        # Escritas concorrentes só são seguras no PostgreSQL
+        workers = 1
+    totals = {}
+    for stage in STAGES:
+        tasks = [(stage, chunk) for chunk in range(plan.chunks(stage))]
+        totals[stage] = 0
+        if workers > 1:
+            connections.close_all()
+            context = multiprocessing.get_context('fork')
+            with context.Pool(workers, initializer=_init_worker, initargs=(plan,)) as pool:
+                for done, rows in enumerate(pool.imap_unordered(run_chunk, tasks), 1):
+                    totals[stage] += rows
+                    if progress:
+                        progress(stage, done, len(tasks))
+        else:
+            _init_worker(plan)
+            for done, task in enumerate(tasks, 1):
+                totals[stage] += run_chunk(task)
+                if progress:
+                    progress(stage, done, len(tasks))
+    finalize(plan)
+    return totals
+
+
+def finalize(plan: Plan) -> None:
+    """Reset the sequences of the tables written with explicit ids and fill the counters."""
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), [User, Deck, Flashcard]):
+            cursor.execute(sql)
+
+    Deck.objects.filter(pk__gte=plan.deck_start).update(favorite_count=Coalesce(Subquery(
+        DeckFavorite.objects.filter(deck=OuterRef('pk')).values('deck').annotate(
+            total=Count('pk'),
+        ).values('total'),
+        output_field=IntegerField(),
+    ), 0))
+    User.objects.filter(pk__gte=plan.user_start).update(total_points=Coalesce(Subquery(
+        Achievement.objects.filter(user=OuterRef('pk')).values('user').annotate(
+            total=Sum('points'),
+        ).values('total'),
+        output_field=IntegerField(),
+    ), 0))
+
+    if connection.vendor == 'postgresql':
+        # Estatísticas atualizadas para o planejador após a carga
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
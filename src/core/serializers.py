@@ -0,0 +1,124 @@
+"""
+Serializer helpers.
+"""
+
+from typing import List, Optional, Set, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils.module_loading import import_string
+from rest_framework import serializers
+
+FIELDS_PARAM = 'fields'
+EXPAND_PARAM = 'expand'
+
+
+def parse_field_list(value: Optional[str]) -> Set[str]:
+    """Split a comma separated list of field names."""
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+class DynamicFieldsMixin:
+    """
+    ModelSerializer mixin for sparse fieldsets and on-demand expansions.
+
+    ``?fields=id,name`` limits the output to the listed fields and
+    ``?expand=parent_deck`` adds (or replaces with a nested representation) the
+    fields declared in ``Meta.expandable_fields``, a mapping of field names to
+    ``(serializer class or dotted path, kwargs)``. Both can also be given as
+    ``fields``/``expand`` keyword arguments; the query string is only read on
+    GET/HEAD. Dropped fields are never evaluated, so unrequested
+    SerializerMethodFields do not run.
+
+    Only the top-level serializer reads the query string; nested serializers are
+    built before they have a context and keep all their fields.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize serializer."""
+        requested = kwargs.pop('fields', None)
+        expand = kwargs.pop('expand', None)
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get('request')
+        # Escritas sempre usam todos os campos
+        query_params = {}
+        if getattr(request, 'method', None) in ('GET', 'HEAD'):
+            query_params = request.query_params
+        if requested is None:
+            requested = parse_field_list(query_params.get(FIELDS_PARAM))
+        if expand is None:
+            expand = parse_field_list(query_params.get(EXPAND_PARAM))
+
+        expandable = getattr(self.Meta, 'expandable_fields', {})
+        for name in set(expand) & set(expandable):
+            serializer_class, options = expandable[name]
+            if isinstance(serializer_class, str):
+                serializer_class = import_string(serializer_class)
+            self.fields[name] = serializer_class(**options)
+
+        if requested:
+            for name in set(self.fields) - set(requested) - set(expand):
+                self.fields.pop(name)
+
+    def get_only_fields(self) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Return the model columns and relations needed by the selected fields.
+
+        The result is ``(only, select_related)`` for the queryset, or None when
+        a field's columns cannot be determined. SerializerMethodFields declare
+        theirs in ``Meta.method_field_sources``.
+        """
+        opts = self.Meta.model._meta
+        method_sources = getattr(self.Meta, 'method_field_sources', {})
+        only = {opts.pk.name}
+        related = set()
+        for name, field in self.fields.items():
+            if isinstance(field, serializers.SerializerMethodField):
+                if name not in method_sources:
+                    return None
+                only.update(method_sources[name])
+                continue
+            if field.source == '*':
+                return None
+            parts = field.source.split('.')
+            try:
+                model_field = opts.get_field(parts[0])
+            except FieldDoesNotExist:
+                return None
+            if not model_field.concrete:
+                return None
+            only.add(parts[0])
+            if isinstance(field, serializers.BaseSerializer):
+                # Relação expandida: carregada no mesmo SELECT
+                related.add(parts[0])
+            elif len(parts) > 1:
+                related.add(parts[0])
+                only.add('__'.join(parts))
+        return sorted(only), sorted(related)
+
+
+class SparseFieldsetMixin:
+    """
+    View mixin that loads only the columns used by the ``?fields=`` selection.
+
+    Applied to the actions in ``sparse_actions``, which must serialize their
+    queryset with a serializer using :class:`DynamicFieldsMixin`.
+    """
+
+    sparse_actions = ('list',)
+
+    def get_queryset(self):
+        """Return queryset."""
+        queryset = super().get_queryset()
+        request = getattr(self, 'request', None)
+        if request is None or getattr(self, 'action', None) not in self.sparse_actions:
+            return queryset
+        if not request.query_params.get(FIELDS_PARAM):
+            return queryset
+        columns = self.get_serializer().get_only_fields()
+        if columns is None:
+            return queryset
+        only, related = columns
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*only)
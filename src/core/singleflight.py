@@ -0,0 +1,206 @@
+"""
+Request coalescing (single-flight) for expensive cache misses.
+"""
+
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from redis.exceptions import LockError, RedisError
+
+from . import metrics
+from .redis import acache_get, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+LOCK_TIMEOUT = 30
+WAIT_TIMEOUT = 2.0
+POLL_INTERVAL = 0.05
+STALE_SUFFIX = ':stale'
+UNCACHED_SUFFIX = ':uncached'
+
+_missing = object()
+
+_local_locks = {}
+_local_locks_guard = threading.Lock()
+
+
+@contextmanager
+def _local_lock(key: str):
+    """Per-key process-local lock, used when Redis is not available."""
+    with _local_locks_guard:
+        lock = _local_locks.setdefault(key, threading.Lock())
+    acquired = lock.acquire(blocking=False)
+    try:
+        yield acquired, lock
+    finally:
+        if acquired:
+            lock.release()
+            with _local_locks_guard:
+                if not lock.locked():
+                    _local_locks.pop(key, None)
+
+
+@contextmanager
+def _redis_lock(client, key: str, lock_timeout: float):
+    lock = client.lock(f'{key}:lock', timeout=lock_timeout, blocking=False)
+    try:
+        acquired = lock.acquire()
+    except RedisError as e:
+        logger.warning(f'Single-flight lock failed: {str(e)}')
+        acquired = True
+    try:
+        yield acquired, None
+    finally:
+        if acquired:
+            try:
+                lock.release()
+            except (LockError, RedisError):
+                # O lock expirou antes do fim do cálculo
+                pass
+
+
+def _wait_for_value(key: str, wait_timeout: float, local_lock: Optional[threading.Lock]):
+    """Wait for the leader to store ``key``; returns ``_missing`` on timeout."""
+    deadline = time.monotonic() + wait_timeout
+    if local_lock is not None:
+        # Sem Redis: aguarda o líder no próprio lock do processo
+        if local_lock.acquire(timeout=wait_timeout):
+            local_lock.release()
+        return cache.get(key, _missing)
+    uncached_key = f'{key}{UNCACHED_SUFFIX}'
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        values = cache.get_many([key, uncached_key])
+        if key in values:
+            return values[key]
+        if uncached_key in values:
+            # O líder não armazenou o valor: não há o que aguardar
+            break
+    return _missing
+
+
+def _store(key, value, timeout, stale_timeout, should_cache) -> None:
+    """Store ``value``, or mark ``key`` as not cached when ``should_cache`` rejects it."""
+    uncached_key = f'{key}{UNCACHED_SUFFIX}'
+    if should_cache is None or should_cache(value):
+        cache.set(key, value, timeout)
+        if stale_timeout:
+            cache.set(f'{key}{STALE_SUFFIX}', value, stale_timeout)
+        cache.delete(uncached_key)
+    else:
+        cache.set(uncached_key, True, timeout)
+
+
+def load(
+    key: str,
+    compute: Callable[[], Any],
+    timeout: Optional[int],
+    name: Optional[str] = None,
+    stale_timeout: Optional[int] = None,
+    lock_timeout: float = LOCK_TIMEOUT,
+    wait_timeout: float = WAIT_TIMEOUT,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    """
+    Return ``key`` from the cache, letting a single caller recompute it on a miss.
+
+    The caller that takes the lock recomputes and stores the value (and a stale
+    copy kept for ``stale_timeout`` seconds). Concurrent callers wait up to
+    ``wait_timeout`` for it, serving the stale copy when there is one; after
+    that they give up and compute the value themselves.
+
+    When ``should_cache`` rejects the leader's value, ``key`` is marked as not
+    cached for ``timeout`` seconds: waiting callers stop waiting and later
+    misses compute the value without taking the lock.
+    """
+    name = name or key
+    uncached_key = f'{key}{UNCACHED_SUFFIX}'
+    values = cache.get_many([key, uncached_key])
+    if key in values:
+        return values[key]
+    if uncached_key in values:
+        metrics.record_single_flight(name, 'uncached')
+        value = compute()
+        if should_cache is not None and should_cache(value):
+            _store(key, value, timeout, stale_timeout, should_cache)
+        return value
+
+    stale_key = f'{key}{STALE_SUFFIX}'
+    client = get_redis_client()
+    if client is not None:
+        lock_context = _redis_lock(client, key, lock_timeout)
+    else:
+        lock_context = _local_lock(key)
+
+    with lock_context as (acquired, local_lock):
+        if acquired:
+            # Outro líder pode ter terminado entre a leitura e o lock
+            value = cache.get(key, _missing)
+            if value is not _missing:
+                return value
+            metrics.record_single_flight(name, 'leader')
+            value = compute()
+            _store(key, value, timeout, stale_timeout, should_cache)
+            return value
+
+    stale = cache.get(stale_key, _missing)
+    if stale is not _missing:
+        metrics.record_single_flight(name, 'stale')
+        return stale
+
+    started = time.monotonic()
+    value = _wait_for_value(key, wait_timeout, local_lock)
+    metrics.record_single_flight_wait(name, time.monotonic() - started)
+    if value is not _missing:
+        metrics.record_single_flight(name, 'coalesced')
+        return value
+
+    metrics.record_single_flight(name, 'timeout')
+    return compute()
+
+
+def single_flight(
+    key: Callable[..., str],
+    timeout: Optional[int],
+    name: Optional[str] = None,
+    stale_timeout: Optional[int] = None,
+    lock_timeout: float = LOCK_TIMEOUT,
+    wait_timeout: float = WAIT_TIMEOUT,
+):
+    """
+    Cache the result of the decorated function, coalescing concurrent misses.
+
+    ``key`` receives the same arguments as the function and returns its cache
+    key. See :func:`load` for the locking and stale data behaviour.
+    """
+    def decorator(func):
+        metric_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return load(
+                key(*args, **kwargs),
+                lambda: func(*args, **kwargs),
+                timeout,
+                name=metric_name,
+                stale_timeout=stale_timeout,
+                lock_timeout=lock_timeout,
+                wait_timeout=wait_timeout,
+            )
+
+        async def acall(*args, **kwargs):
+            value = await acache_get(key(*args, **kwargs), _missing)
+            if value is not _missing:
+                return value
+            return await sync_to_async(wrapper)(*args, **kwargs)
+
+        wrapper.acall = acall
+        return wrapper
+
+    return decorator
@@ -0,0 +1,48 @@
+"""Tests for the database connection system checks."""
+
+from django.test import SimpleTestCase
+
+from core.checks import get_connection_errors
+
+POSTGRESQL = {'ENGINE': 'core.backends.postgresql', 'NAME': 'falafacil_db'}
+
+
+def ids(errors):
+    return [error.id for error in errors]
+
+
+class ConnectionChecksTests(SimpleTestCase):
+    """Test persistent connections and server-side cursors are validated."""
+
+    def test_valid_settings(self):
+        """Test health-checked persistent connections under WSGI pass."""
+        databases = {'default': {**POSTGRESQL, 'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': True}}
+
+        self.assertEqual(get_connection_errors(databases, '', 'wsgi'), [])
+
+    def test_persistent_without_health_checks(self):
+        """Test persistent connections need health checks."""
+        databases = {'default': {**POSTGRESQL, 'CONN_MAX_AGE': 600}}
+
+        self.assertEqual(ids(get_connection_errors(databases, '', 'wsgi')), ['core.W001'])
+
+    def test_persistent_under_asgi(self):
+        """Test persistent connections are reported under ASGI."""
+        databases = {'default': {**POSTGRESQL, 'CONN_MAX_AGE': None, 'CONN_HEALTH_CHECKS': True}}
+
+        self.assertEqual(ids(get_connection_errors(databases, '', 'asgi')), ['core.W002'])
+
+    def test_server_side_cursors_in_transaction_mode(self):
+        """Test transaction pooling requires server-side cursors to be disabled."""
+        databases = {'default': dict(POSTGRESQL)}
+
+        self.assertEqual(
+            ids(get_connection_errors(databases, 'transaction', 'asgi')), ['core.E002'],
+        )
+        self.assertEqual(ids(get_connection_errors(databases, 'session', 'asgi')), [])
+        databases['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+        self.assertEqual(get_connection_errors(databases, 'transaction', 'asgi'), [])
+
+    def test_unknown_pool_mode(self):
+        """Test an unknown pool mode is rejected."""
+        self.assertEqual(ids(get_connection_errors({}, 'statement', 'wsgi')), ['core.E001'])
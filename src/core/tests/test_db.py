@@ -0,0 +1,130 @@
+"""Tests for the database helpers."""
+
+from datetime import timedelta
+from unittest import skipUnless
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from apps.flashcards.models import Deck, Flashcard
+from core import metrics
+from core.db import ConnectTimingMixin, aiterate_in_chunks, execute_wrapper, iterate_in_chunks
+
+if metrics.is_enabled():
+    from prometheus_client import REGISTRY
+
+User = get_user_model()
+
+
+class ExecuteWrapperTests(TransactionTestCase):
+    """Test execute wrappers follow the context into worker threads."""
+
+    def test_wrapper_sees_worker_thread_queries(self):
+        """Test queries run by sync_to_async in another thread are wrapped, and only in context."""
+        seen = []
+
+        def wrapper(execute, sql, params, many, context):
+            seen.append(sql)
+            return execute(sql, params, many, context)
+
+        async def run():
+            with execute_wrapper(wrapper):
+                await sync_to_async(User.objects.count, thread_sensitive=False)()
+            await sync_to_async(User.objects.count, thread_sensitive=False)()
+
+        async_to_sync(run)()
+
+        self.assertEqual(len(seen), 1)
+        self.assertIn('COUNT', seen[0])
+
+    def test_wrappers_nest_in_order(self):
+        """Test the first wrapper entered is the outermost, as in Django."""
+        calls = []
+
+        def make_wrapper(name):
+            def wrapper(execute, sql, params, many, context):
+                calls.append(name)
+                return execute(sql, params, many, context)
+            return wrapper
+
+        with execute_wrapper(make_wrapper('outer')), execute_wrapper(make_wrapper('inner')):
+            User.objects.count()
+
+        self.assertEqual(calls, ['outer', 'inner'])
+
+
+class IterateInChunksTests(TestCase):
+    """Test chunked reads with keyset pagination."""
+
+    def setUp(self):
+        """Set up test data."""
+        user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        deck = Deck.objects.create(
+            name='Test Deck',
+            language='en',
+            level='A1',
+            category='vocabulary',
+            owner=user,
+        )
+        now = timezone.now()
+        for i in range(7):
+            card = Flashcard.objects.create(deck=deck, front=f'Front {i}', back='Back')
+            # Datas repetidas: o pk desempata
+            Flashcard.objects.filter(pk=card.pk).update(created_at=now - timedelta(days=i // 2))
+        self.cards = Flashcard.objects.filter(deck=deck)
+
+    def test_same_order_one_query_per_chunk(self):
+        """Test every row is read once, in order, with one query per chunk."""
+        queryset = self.cards.order_by('created_at')
+        with self.assertNumQueries(3):
+            result = list(iterate_in_chunks(queryset, 3))
+
+        self.assertEqual(result, list(queryset.order_by('created_at', 'pk')))
+
+    def test_descending_order(self):
+        """Test descending fields continue after the last row read."""
+        queryset = self.cards.order_by('-created_at', '-pk')
+
+        self.assertEqual(list(iterate_in_chunks(queryset, 2)), list(queryset))
+
+    def test_requires_ordering(self):
+        """Test an unordered queryset is rejected."""
+        with self.assertRaises(ValueError):
+            next(iterate_in_chunks(self.cards.order_by(), 2))
+
+    async def test_async_matches_sync(self):
+        """Test the async version reads the same rows."""
+        queryset = self.cards.order_by('created_at')
+        result = [card async for card in aiterate_in_chunks(queryset, 2)]
+        expected = await sync_to_async(list)(queryset.order_by('created_at', 'pk'))
+
+        self.assertEqual(result, expected)
+
+
+class TimedDatabaseWrapper(ConnectTimingMixin, SQLiteDatabaseWrapper):
+    """SQLite wrapper with connection timing."""
+
+
+@skipUnless(metrics.is_enabled(), 'prometheus_client is not installed')
+class ConnectTimingTests(TestCase):
+    """Test the time to open connections is observed."""
+
+    def test_connect_observed(self):
+        """Test each new connection is observed under its alias."""
+        name = 'db_connect_duration_seconds_count'
+        before = REGISTRY.get_sample_value(name, {'alias': 'timed'}) or 0
+        wrapper = TimedDatabaseWrapper(
+            {**connection.settings_dict, 'NAME': ':memory:'}, alias='timed',
+        )
+        wrapper.ensure_connection()
+        wrapper.close()
+
+        self.assertEqual(REGISTRY.get_sample_value(name, {'alias': 'timed'}), before + 1)
@@ -0,0 +1,62 @@
+"""Tests for the health check endpoints."""
+
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from core import health
+
+
+class HealthCheckTests(TestCase):
+    """Test liveness, readiness and the legacy health endpoint."""
+
+    def setUp(self):
+        """Reset the cached readiness result."""
+        health.reset_readiness()
+        self.addCleanup(health.reset_readiness)
+
+    def test_livez_without_io(self):
+        """Test the liveness probe touches no dependency."""
+        with self.assertNumQueries(0), mock.patch.object(health, 'run_checks') as run_checks:
+            res = self.client.get(reverse('livez'))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json(), {'status': 'alive'})
+        run_checks.assert_not_called()
+
+    def test_readyz_reports_timings(self):
+        """Test the readiness probe reports every dependency with its duration."""
+        res = self.client.get(reverse('readyz'))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        data = res.json()
+        self.assertEqual(data['status'], 'ready')
+        self.assertEqual(set(data['checks']), {'database', 'cache'})
+        self.assertTrue(data['checks']['database']['ok'])
+        self.assertIn('duration_ms', data['checks']['cache'])
+
+    @override_settings(HEALTH_CHECK_CACHE_TTL=60)
+    def test_readyz_result_reused(self):
+        """Test frequent probes reuse the last result."""
+        self.client.get(reverse('readyz'))
+
+        with self.assertNumQueries(0):
+            res = self.client.get(reverse('readyz'))
+
+        self.assertTrue(res.json()['cached'])
+
+    def test_unavailable_dependency(self):
+        """Test a failing dependency makes both probes report 503."""
+        failing = mock.Mock(side_effect=ConnectionError('down'))
+        with mock.patch.dict(health.CHECKS, {'cache': failing}):
+            res = self.client.get(reverse('readyz'))
+            health.reset_readiness()
+            legacy = self.client.get(reverse('health_check'))
+
+        self.assertEqual(res.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertFalse(res.json()['checks']['cache']['ok'])
+        self.assertEqual(legacy.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(legacy.json()['status'], 'unhealthy')
+        self.assertFalse(legacy.json()['cache'])
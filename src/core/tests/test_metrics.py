@@ -0,0 +1,126 @@
+"""Tests for the Prometheus metrics."""
+
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from core import health, metrics
+from core.cache import TwoTierCache
+
+if metrics.is_enabled():
+    from prometheus_client import REGISTRY
+
+
+def sample(name, **labels):
+    """Return the current value of a sample, or 0 when it was never observed."""
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@skipUnless(metrics.is_enabled(), 'prometheus_client is not installed')
+class MetricsMiddlewareTests(TestCase):
+    """Test the request metrics."""
+
+    def setUp(self):
+        """Reset the cached readiness result."""
+        health.reset_readiness()
+        self.addCleanup(health.reset_readiness)
+
+    def test_latency_and_status_by_view(self):
+        """Test requests are observed under their view name and status."""
+        latency = sample('http_request_latency_seconds_count', view='livez', method='GET')
+        responses = sample(
+            'django_http_responses_total_by_status_total', view='livez', status='200',
+        )
+
+        self.client.get(reverse('livez'))
+
+        self.assertEqual(
+            sample('http_request_latency_seconds_count', view='livez', method='GET'), latency + 1,
+        )
+        self.assertEqual(
+            sample('django_http_responses_total_by_status_total', view='livez', status='200'),
+            responses + 1,
+        )
+
+    def test_unresolved_view(self):
+        """Test unknown URLs share a single label."""
+        before = sample(
+            'django_http_responses_total_by_status_total',
+            view=metrics.UNRESOLVED_VIEW,
+            status='404',
+        )
+
+        self.client.get('/does-not-exist/')
+
+        self.assertEqual(
+            sample(
+                'django_http_responses_total_by_status_total',
+                view=metrics.UNRESOLVED_VIEW,
+                status='404',
+            ),
+            before + 1,
+        )
+
+    def test_database_queries_per_request(self):
+        """Test the queries run by a view are counted."""
+        count = sample('http_request_db_queries_count', view='readyz')
+        total = sample('http_request_db_queries_sum', view='readyz')
+
+        self.client.get(reverse('readyz'))
+
+        self.assertEqual(sample('http_request_db_queries_count', view='readyz'), count + 1)
+        self.assertEqual(sample('http_request_db_queries_sum', view='readyz'), total + 1)
+
+    def test_metrics_endpoint(self):
+        """Test the scrape endpoint renders the text format."""
+        self.client.get(reverse('livez'))
+
+        res = self.client.get(reverse('metrics'))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res['Content-Type'].startswith('text/plain'))
+        self.assertIn(b'http_request_latency_seconds_bucket', res.content)
+        self.assertIn(b'django_http_responses_total_by_status_total', res.content)
+
+    def test_metrics_disabled(self):
+        """Test the endpoint is hidden without prometheus_client."""
+        with mock.patch.object(metrics, 'prometheus_client', None):
+            res = self.client.get(reverse('metrics'))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@skipUnless(metrics.is_enabled(), 'prometheus_client is not installed')
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+})
+class CacheMetricsTests(TestCase):
+    """Test the cache hit and miss counters."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.cache = TwoTierCache('test_metrics')
+
+    def counts(self):
+        return {
+            result: sample('cache_requests_total', cache='test_metrics', result=result)
+            for result in ('hit_local', 'hit_shared', 'miss')
+        }
+
+    def test_get_or_set_results(self):
+        """Test misses and hits in each tier are counted."""
+        before = self.counts()
+
+        self.cache.get_or_set('a', lambda: 1)
+        self.cache.get_or_set('a', lambda: 2)
+        self.cache.evict_local()
+        self.cache.get_or_set('a', lambda: 3)
+
+        after = self.counts()
+        self.assertEqual(after['miss'], before['miss'] + 1)
+        self.assertEqual(after['hit_local'], before['hit_local'] + 1)
+        self.assertEqual(after['hit_shared'], before['hit_shared'] + 1)
@@ -0,0 +1,118 @@
+"""Tests for the request profiling hook."""
+
+import marshal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core import health
+from core.profiling import make_token
+
+User = get_user_model()
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+})
+class ProfilingTests(TestCase):
+    """Test profiling requests through the X-Profile header."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        health.reset_readiness()
+        self.addCleanup(health.reset_readiness)
+        self.client = APIClient()
+        self.staff = User.objects.create_user(
+            username='staff',
+            email='staff@example.com',
+            password='testpass123',
+            is_staff=True,
+        )
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+
+    def test_request_without_header(self):
+        """Test requests are not profiled by default."""
+        res = self.client.get(reverse('readyz'))
+
+        self.assertNotIn('X-Profile-Id', res)
+
+    def test_invalid_token_ignored(self):
+        """Test a forged token does not enable profiling."""
+        res = self.client.get(reverse('readyz'), HTTP_X_PROFILE='forged:token')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotIn('X-Profile-Id', res)
+
+    def test_profile_with_token(self):
+        """Test a signed token profiles the request and records its queries."""
+        res = self.client.get(reverse('readyz'), HTTP_X_PROFILE=make_token(self.staff))
+        profile_id = res['X-Profile-Id']
+
+        self.client.force_authenticate(user=self.staff)
+        detail = self.client.get(reverse('profile-detail', args=[profile_id]))
+
+        self.assertEqual(detail.status_code, status.HTTP_200_OK)
+        self.assertEqual(detail.data['path'], reverse('readyz'))
+        self.assertEqual(detail.data['user'], self.staff.pk)
+        self.assertEqual(detail.data['query_count'], 1)
+        self.assertEqual(detail.data['queries'][0]['sql'], 'SELECT 1')
+        self.assertIn('cumulative', detail.data['report'])
+        self.assertNotIn('stats', detail.data)
+
+    def test_download_stats(self):
+        """Test the raw stats are downloadable in pstats format."""
+        res = self.client.get(reverse('livez'), HTTP_X_PROFILE=make_token(self.staff))
+
+        self.client.force_authenticate(user=self.staff)
+        download = self.client.get(reverse('profile-download', args=[res['X-Profile-Id']]))
+
+        self.assertEqual(download.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(marshal.loads(download.content), dict)
+
+    def test_session_staff_flag(self):
+        """Test staff users logged in to the admin may profile with X-Profile: 1."""
+        self.client.force_login(self.user)
+        res = self.client.get(reverse('livez'), HTTP_X_PROFILE='1')
+        self.assertNotIn('X-Profile-Id', res)
+
+        self.client.force_login(self.staff)
+        res = self.client.get(reverse('livez'), HTTP_X_PROFILE='1')
+        self.assertIn('X-Profile-Id', res)
+
+    def test_staff_only(self):
+        """Test regular users can neither get tokens nor read profiles."""
+        res = self.client.get(reverse('livez'), HTTP_X_PROFILE=make_token(self.staff))
+        self.client.force_authenticate(user=self.user)
+
+        detail = self.client.get(reverse('profile-detail', args=[res['X-Profile-Id']]))
+        token = self.client.post(reverse('profile-token'))
+
+        self.assertEqual(detail.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(token.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_issue_token(self):
+        """Test staff users get a working token."""
+        self.client.force_authenticate(user=self.staff)
+        token = self.client.post(reverse('profile-token')).data['token']
+        self.client.force_authenticate(user=None)
+
+        res = self.client.get(reverse('livez'), HTTP_X_PROFILE=token)
+
+        self.assertIn('X-Profile-Id', res)
+
+    def test_unknown_profile(self):
+        """Test an expired or unknown profile returns 404."""
+        self.client.force_authenticate(user=self.staff)
+
+        res = self.client.get(reverse('profile-detail', args=['missing']))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
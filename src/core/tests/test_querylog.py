@@ -0,0 +1,112 @@
+"""Tests for the SQL query fingerprinting and slow-query log."""
+
+import json
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from apps.flashcards.models import Deck, DeckFavorite
+from core import querylog
+
+User = get_user_model()
+
+
+class FavoriteCheckSerializer(serializers.ModelSerializer):
+    """Serializer running one query per deck."""
+
+    is_favorite = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Deck
+        fields = ['id', 'is_favorite']
+
+    def get_is_favorite(self, obj):
+        return DeckFavorite.objects.filter(deck=obj).exists()
+
+
+class FingerprintTests(TestCase):
+    """Test SQL normalization."""
+
+    def test_literals_and_lists_normalized(self):
+        """Test statements differing only in values share a fingerprint."""
+        first = querylog.fingerprint(
+            'SELECT * FROM "deck" WHERE "id" IN (1, 2, 3) AND "name" = \'a\''
+        )
+        second = querylog.fingerprint('SELECT  * FROM "deck" WHERE "id" IN (%s) AND "name" = %s')
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[1], 'SELECT * FROM "deck" WHERE "id" IN (...) AND "name" = ?')
+
+    def test_identifiers_kept(self):
+        """Test digits inside identifiers are not taken for literals."""
+        self.assertEqual(
+            querylog.fingerprint('SELECT "U0"."id" FROM "t2" LIMIT 21')[1],
+            'SELECT "U0"."id" FROM "t2" LIMIT ?',
+        )
+
+
+class QueryLogTests(TestCase):
+    """Test the per-request query log."""
+
+    def setUp(self):
+        """Set up test data."""
+        querylog.reset_query_stats()
+        self.addCleanup(querylog.reset_query_stats)
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        for i in range(3):
+            Deck.objects.create(
+                name=f'Deck {i}',
+                language='en',
+                level='A1',
+                category='vocabulary',
+                owner=self.user,
+            )
+        self.client.force_authenticate(user=self.user)
+
+    def test_stats_by_view_and_action(self):
+        """Test queries are aggregated under the view and the viewset action."""
+        self.client.get(reverse('flashcards:deck-list'))
+
+        stats = querylog.get_query_stats()
+        keys = [key for key in stats if key.startswith('flashcards:deck-list list ')]
+        self.assertTrue(keys)
+        self.assertTrue(all(stats[key]['count'] >= 1 for key in keys))
+
+    @override_settings(SLOW_QUERY_THRESHOLD_MS=0)
+    def test_slow_query_logged(self):
+        """Test queries above the threshold are logged with their view."""
+        with self.assertLogs('core.querylog', 'WARNING') as logs:
+            self.client.get(reverse('flashcards:deck-list'))
+
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertEqual(entry['event'], 'slow_query')
+        self.assertEqual(entry['view'], 'flashcards:deck-list')
+        self.assertEqual(entry['action'], 'list')
+        self.assertIn('duration_ms', entry)
+
+    @override_settings(QUERY_REPEAT_THRESHOLD=3)
+    def test_repeated_query_names_serializer(self):
+        """Test an N+1 is logged once with the serializer and the calling line."""
+        query_log = querylog.RequestQueryLog()
+        decks = list(Deck.objects.all())
+
+        with self.assertLogs('core.querylog', 'WARNING') as logs:
+            with connection.execute_wrapper(query_log):
+                FavoriteCheckSerializer(decks, many=True).data
+
+        self.assertEqual(len(logs.records), 1)
+        entry = logs.records[0].query
+        self.assertEqual(entry['event'], 'repeated_query')
+        self.assertEqual(entry['count'], 3)
+        self.assertEqual(entry['serializer'], 'FavoriteCheckSerializer')
+        self.assertIn('get_is_favorite', entry['caller'])
+        self.assertIn('flashcards_deckfavorite', entry['sql'])
@@ -0,0 +1,68 @@
+"""Tests for the pre-rendered OpenAPI schema."""
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core import schema
+
+User = get_user_model()
+
+
+class SchemaTests(TestCase):
+    """Test the schema artifact and the schema endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / 'openapi.json'
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(schema.reset_schema)
+        schema.reset_schema()
+
+    def test_generate_schema_command(self):
+        """Test the command writes a valid OpenAPI document."""
+        call_command('generate_schema', output=str(self.path), stdout=StringIO())
+
+        document = json.loads(self.path.read_bytes())
+        self.assertIn('/api/v1/flashcards/decks/', document['paths'])
+
+    def test_served_from_artifact(self):
+        """Test the endpoint serves the artifact without generating the schema."""
+        self.path.write_bytes(b'{"openapi": "3.0.3"}')
+
+        with override_settings(OPENAPI_SCHEMA_FILE=str(self.path), DEBUG=False), \
+                mock.patch.object(schema, 'render_schema') as render_schema:
+            res = self.client.get(reverse('schema'))
+            etag = res['ETag']
+            res_again = self.client.get(reverse('schema'), HTTP_IF_NONE_MATCH=etag)
+
+        render_schema.assert_not_called()
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.content, b'{"openapi": "3.0.3"}')
+        self.assertEqual(res_again.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_generated_once_without_artifact(self):
+        """Test the schema is generated on first use and then kept in memory."""
+        with override_settings(OPENAPI_SCHEMA_FILE=str(self.path)), \
+                mock.patch.object(schema, 'render_schema', return_value=b'{}') as render_schema:
+            self.client.get(reverse('schema'))
+            self.client.get(reverse('schema'))
+
+        render_schema.assert_called_once()
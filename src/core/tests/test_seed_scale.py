@@ -0,0 +1,124 @@
+"""Tests for the synthetic data generator."""
+
+from datetime import datetime, timezone
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count
+from django.test import TestCase
+
+from apps.achievements.models import Achievement
+from apps.flashcards.models import Deck, DeckFavorite, DeckTag, Flashcard, FlashcardProgress
+from apps.progress.models import UserProgress
+from core import seeding
+
+User = get_user_model()
+
+NOW = datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+SIZES = {'users': 60, 'decks': 30, 'flashcards': 900, 'progress': 3000}
+
+
+class SeedScaleCommandTests(TestCase):
+    """Test the seed_scale management command."""
+
+    def seed(self, **options):
+        out = StringIO()
+        call_command('seed_scale', yes=True, workers=4, stdout=out, **{**SIZES, **options})
+        return out.getvalue()
+
+    def test_populates_every_table(self):
+        """Test the requested volumes are generated with consistent counters."""
+        existing = User.objects.create_user(
+            username='existing', email='existing@example.com', password='x',
+        )
+
+        output = self.seed()
+
+        self.assertIn('activity:', output)
+        seeded = User.objects.filter(username__startswith=seeding.USERNAME_PREFIX)
+        self.assertEqual(seeded.count(), 60)
+        self.assertEqual(Deck.objects.count(), 30)
+        self.assertAlmostEqual(Flashcard.objects.count(), 900, delta=30)
+        self.assertGreater(FlashcardProgress.objects.count(), 300)
+        self.assertEqual(UserProgress.objects.filter(user__in=seeded).count(), 60)
+        self.assertTrue(DeckFavorite.objects.exists())
+        self.assertTrue(DeckTag.objects.exists())
+        self.assertTrue(Achievement.objects.exists())
+        first = User.objects.get(username=f'{seeding.USERNAME_PREFIX}{existing.pk + 1}')
+        self.assertGreater(first.pk, existing.pk)
+        decks = Deck.objects.annotate(
+            cards=Count('flashcards', distinct=True),
+            favorited=Count('favorites', distinct=True),
+        )
+        for deck in decks:
+            self.assertEqual(deck.total_cards, deck.cards)
+            self.assertEqual(deck.favorite_count, deck.favorited)
+        # Progresso só em decks públicos, sem cards repetidos por usuário
+        self.assertFalse(
+            FlashcardProgress.objects.filter(flashcard__deck__is_public=False).exists()
+        )
+
+    def test_seeded_users_can_log_in(self):
+        """Test the generated users share the given password."""
+        self.seed(password='Scale#2024')
+
+        user = User.objects.filter(username__startswith=seeding.USERNAME_PREFIX).first()
+        self.assertTrue(user.check_password('Scale#2024'))
+
+    def test_sequences_continue_after_seeding(self):
+        """Test new rows get ids after the generated ones."""
+        self.seed()
+
+        user = User.objects.create_user(username='after', email='after@example.com', password='x')
+
+        self.assertEqual(user.pk, User.objects.order_by('-pk').values_list('pk', flat=True)[1] + 1)
+
+    def test_requires_confirmation_without_debug(self):
+        """Test seeding is refused with DEBUG=False unless confirmed."""
+        with self.assertRaises(CommandError):
+            call_command('seed_scale', stdout=StringIO(), **SIZES)
+
+
+class SeedingDeterminismTests(TestCase):
+    """Test the generated rows depend only on the seed."""
+
+    def generate(self, seed):
+        plan = seeding.make_plan(seed, **SIZES)
+        # Hash da senha tem salt aleatório; o horário depende da execução
+        plan.password = 'hash'
+        plan.now = NOW
+        return [
+            seeding.STAGES[stage](plan, chunk)
+            for stage in seeding.STAGES
+            for chunk in range(plan.chunks(stage))
+        ]
+
+    def test_same_seed_same_rows(self):
+        """Test two plans with the same seed generate identical rows."""
+        self.assertEqual(self.generate(7), self.generate(7))
+
+    def test_different_seed_different_rows(self):
+        """Test the seed changes the generated rows."""
+        self.assertNotEqual(self.generate(7), self.generate(8))
+
+    def test_popularity_is_skewed(self):
+        """Test the most popular decks concentrate most of the progress."""
+        plan = seeding.make_plan(7, users=500, decks=200, flashcards=4000, progress=20000)
+        progress = [
+            row
+            for chunk in range(plan.chunks('activity'))
+            for row in seeding.generate_activity(plan, chunk)[0][2]
+        ]
+        card_deck = {}
+        for index, first in enumerate(plan.deck_first_card):
+            for card in range(first, first + plan.deck_sizes[index]):
+                card_deck[card] = index
+        studies = {}
+        for row in progress:
+            deck = card_deck[row[1]]
+            studies[deck] = studies.get(deck, 0) + 1
+        top = sorted(studies.values(), reverse=True)
+
+        self.assertGreater(sum(top[:len(top) // 10]), sum(top) / 3)
@@ -0,0 +1,87 @@
+"""Tests for the async viewset actions."""
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from rest_framework import permissions, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.views import AsyncActionsMixin
+
+User = get_user_model()
+
+
+class ExampleViewSet(AsyncActionsMixin, viewsets.ViewSet):
+    """Viewset mixing sync and async actions."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def list(self, request):
+        return Response({'mode': 'sync'})
+
+    @action(detail=False)
+    async def count(self, request):
+        count = await User.objects.acount()
+        return Response({'mode': 'async', 'count': count})
+
+    @action(detail=False)
+    async def fail(self, request):
+        raise NotFound()
+
+
+class AsyncActionsMixinTests(TestCase):
+    """Test async actions go through DRF's request handling."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+        )
+
+    def call(self, view, path, user=None):
+        request = self.factory.get(path)
+        if user is not None:
+            force_authenticate(request, user=user)
+        if iscoroutinefunction(view):
+            return async_to_sync(view)(request)
+        return view(request)
+
+    def test_sync_action_unchanged(self):
+        """Test routes with sync actions keep a sync view."""
+        view = ExampleViewSet.as_view({'get': 'list'})
+
+        self.assertFalse(iscoroutinefunction(view))
+        self.assertEqual(self.call(view, '/', self.user).data, {'mode': 'sync'})
+
+    def test_async_action(self):
+        """Test routes with async actions get a coroutine view."""
+        view = ExampleViewSet.as_view({'get': 'count'})
+
+        self.assertTrue(iscoroutinefunction(view))
+        response = self.call(view, '/count/', self.user)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'mode': 'async', 'count': 1})
+
+    def test_async_action_checks_permissions(self):
+        """Test authentication and permissions run before async actions."""
+        view = ExampleViewSet.as_view({'get': 'count'})
+
+        self.assertEqual(self.call(view, '/count/').status_code, 401)
+
+    def test_async_action_exception_handled(self):
+        """Test exceptions raised by async actions become error responses."""
+        view = ExampleViewSet.as_view({'get': 'fail'})
+
+        self.assertEqual(self.call(view, '/fail/', self.user).status_code, 404)
+
+    def test_mixed_route_rejected(self):
+        """Test a route cannot map sync and async actions together."""
+        with self.assertRaises(ImproperlyConfigured):
+            ExampleViewSet.as_view({'get': 'list', 'post': 'count'})
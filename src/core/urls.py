@@ -4,7 +4,15 @@ Core URLs configuration.
 
 from django.urls import path
 from .health import health_check
+from .profiling import ProfileDetailView, ProfileDownloadView, ProfileTokenView
 
 urlpatterns = [
     path('health/', health_check, name='health_check'),
-] 
\ No newline at end of file
+    path('profiles/token/', ProfileTokenView.as_view(), name='profile-token'),
+    path('profiles/<str:profile_id>/', ProfileDetailView.as_view(), name='profile-detail'),
+    path(
+        'profiles/<str:profile_id>/download/',
+        ProfileDownloadView.as_view(),
+        name='profile-download',
+    ),
+]
@@ -1,6 +1,8 @@
 """Core utilities."""
 from typing import Any, Dict, Optional
 from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -34,36 +36,24 @@ class CustomJSONRenderer(JSONRenderer):
 
 
 class CustomSchemaAPIView(APIView):
-    """Custom API view for generating OpenAPI schema with proper type handling."""
+    """Serve the pre-rendered OpenAPI schema (see :mod:`core.schema`)."""
     
     renderer_classes = [CustomJSONRenderer]
     
     def get(self, request, *args, **kwargs):
-        """Generate and return the API schema with proper type handling."""
+        """Return the cached API schema, or 304 when the client has it."""
         # Import here to avoid circular imports
-        from drf_spectacular.generators import SchemaGenerator
-        from drf_spectacular.settings import spectacular_settings
-        
-        # Use the default SchemaGenerator
-        generator = SchemaGenerator(
-            urlconf=getattr(spectacular_settings, 'SERVE_URLCONF', None),
-            api_version=request.GET.get('api_version', None)
-        )
-        schema = generator.get_schema(request=request, public=True)
-        
-        # Process schema to convert type objects to strings
-        def process_schema(obj: Any) -> Any:
-            if isinstance(obj, type):
-                return str(obj.__name__)
-            elif isinstance(obj, dict):
-                return {k: process_schema(v) for k, v in obj.items()}
-            elif isinstance(obj, (list, tuple)):
-                return [process_schema(i) for i in obj]
-            return obj
-        
-        processed_schema = process_schema(schema)
-        
+        from .conditional import get_not_modified_response
+        from .schema import get_schema
+
         if "format" in request.GET and request.GET["format"] == "yaml":
             return Response({"error": "YAML format unavailable for custom schema"})
-        
-        return Response(processed_schema) 
\ No newline at end of file
+
+        content, etag = get_schema()
+        response = get_not_modified_response(request, etag)
+        if response is None:
+            response = HttpResponse(content, content_type="application/json")
+        response["ETag"] = etag
+        # O schema só muda a cada deploy; clientes revalidam com If-None-Match
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
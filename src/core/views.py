@@ -0,0 +1,69 @@
+"""
+Async actions for DRF viewsets.
+
+DRF dispatches synchronously. :class:`AsyncActionsMixin` lets a viewset
+declare actions with ``async def``: the routes whose handlers are all async
+get a coroutine view, so Django awaits them natively under ASGI (and runs
+them in an event loop under WSGI). Authentication, permissions, throttling
+and content negotiation still run through DRF's ``initial()``, in a worker
+thread since they may query the database; the handler itself must use the
+async ORM or ``sync_to_async`` for any other blocking call.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.decorators import classonlymethod
+
+
+class AsyncActionsMixin:
+    """Allow ``async def`` actions in a viewset."""
+
+    # Definido por as_view() nas rotas cujas ações são todas assíncronas
+    async_dispatch = False
+
+    @classonlymethod
+    def as_view(cls, actions=None, **initkwargs):
+        handlers = [getattr(cls, name) for name in (actions or {}).values()]
+        is_async = [iscoroutinefunction(handler) for handler in handlers]
+        if any(is_async) and not all(is_async):
+            raise ImproperlyConfigured(
+                f'{cls.__name__}: a route cannot mix sync and async actions ({actions}).'
+            )
+        if handlers and all(is_async):
+            initkwargs['async_dispatch'] = True
+        view = super().as_view(actions, **initkwargs)
+        if initkwargs.get('async_dispatch'):
+            markcoroutinefunction(view)
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.async_dispatch:
+            return self.adispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        """Async version of ``APIView.dispatch()``."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                # OPTIONS e métodos não permitidos
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response